@@ -0,0 +1,109 @@
+"""benchmarks of the impact evaluation at several scales
+
+the classes follow the asv conventions (params, setup, teardown and time_*
+methods), so the suite can be run by asv or by benchmarks/run.py.
+"""
+import os
+import shutil
+import sys
+import tempfile
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import pandas as pd
+from pyiat.core.impact import IndicatorTable
+from pyiat.example.synthetic import synthetic_frame, synthetic_impact
+from pyiat.utils.io import excel_parser
+
+# capitals x dimensions x indicators
+SCALES = {
+    "small": (3, 3, 5),
+    "medium": (6, 6, 10),
+    "large": (10, 10, 30),
+}
+
+
+def _weight_files(impact) -> dict:
+    """the weight matrices of an impact in the format of weight_matrices_to_excel"""
+    files = impact.weight_matrices_to_excel(None)
+
+    files["Impact"]["impacts"][:] = impact.judgments
+    for capital_name, capital in impact._capitals.items():
+        files["Capital"][capital_name][:] = capital.judgments
+        for dimension_name, dimension in capital._dimensions.items():
+            files["Dimension"][dimension_name][:] = dimension.judgments
+
+    return files
+
+
+class ImpactScore:
+    params = list(SCALES)
+    param_names = ["scale"]
+
+    def setup(self, scale):
+        self.impact = synthetic_impact(*SCALES[scale], noise=0.1, seed=0)
+
+    def _clear(self):
+        # the scores are memoized, so every run starts from cold caches of all
+        # the objects. the parents are cleared first, so the indicators do not
+        # update a compiled impact.
+        objects = list(self.impact._weighted_objects())
+        for obj in objects:
+            obj._invalidate()
+
+        for obj in objects:
+            items = getattr(obj, "_indicators", None)
+            if isinstance(items, IndicatorTable):
+                items._invalidate()
+            elif items is not None:
+                for indicator in items.values():
+                    indicator._invalidate()
+
+    def time_score(self, scale):
+        self._clear()
+        self.impact.score
+
+    def time_summary(self, scale):
+        self._clear()
+        self.impact.summary
+
+    def time_calc_weight(self, scale):
+        self._clear()
+        for obj in self.impact._weighted_objects():
+            obj.calc_weight()
+
+
+class ExcelIO:
+    params = list(SCALES)
+    param_names = ["scale"]
+
+    def setup(self, scale):
+        self.path = tempfile.mkdtemp()
+        self.impact = synthetic_impact(*SCALES[scale], noise=0.1, seed=0)
+
+        self.project = f"{self.path}/Project.xlsx"
+        synthetic_frame(*SCALES[scale], seed=0).set_index(
+            ["capital", "dimension", "indicator"]
+        ).to_excel(self.project)
+
+        self.weights = f"{self.path}/weights"
+        os.makedirs(self.weights)
+        for item, sheets in _weight_files(self.impact).items():
+            with pd.ExcelWriter(f"{self.weights}/{item}.xlsx") as file:
+                for sheet, matrix in sheets.items():
+                    matrix.to_excel(file, sheet_name=sheet)
+
+        self.output = f"{self.path}/output"
+        os.makedirs(self.output)
+
+    def teardown(self, scale):
+        shutil.rmtree(self.path)
+
+    def time_excel_parser(self, scale):
+        excel_parser(self.project)
+
+    def time_weight_matrices_to_excel(self, scale):
+        self.impact.weight_matrices_to_excel(self.output)
+
+    def time_parse_weight_matrices(self, scale):
+        self.impact.parse_weight_matrices(self.weights)
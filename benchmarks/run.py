@@ -0,0 +1,157 @@
+"""runs the benchmarks and records the results
+
+usage:
+    python benchmarks/run.py [--scales small medium] [--output benchmarks/results.jsonl]
+
+every run is appended as one json line with the commit and the package
+versions, and compared with the previous run of the file. benchmarks slower
+than the previous run by more than the threshold are reported as regressions.
+"""
+import argparse
+import datetime
+import inspect
+import json
+import os
+import platform
+import subprocess
+import sys
+import timeit
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+import benchmarks
+
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results.jsonl")
+
+
+def _commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(scales: list, repeat: int = 5, match: str = None) -> dict:
+    """times every time_* method of the benchmark classes
+
+    Parameters
+    ----------
+    scales : list
+        the scales of benchmarks.SCALES to run
+    repeat : int, optional
+        number of timed runs of every benchmark, by default 5
+    match : str, optional
+        if given, only the benchmarks containing it are run, by default None
+
+    Returns
+    -------
+    dict
+        {"Class.time_method[scale]": {"min": ..., "median": ..., "repeat": ...}}
+    """
+    results = {}
+    for class_name, cls in inspect.getmembers(benchmarks, inspect.isclass):
+        if not hasattr(cls, "params"):
+            continue
+
+        methods = [name for name in dir(cls) if name.startswith("time_")]
+        for scale in scales:
+            keys = {name: f"{class_name}.{name}[{scale}]" for name in methods}
+            methods_to_run = [
+                name for name in methods if match is None or match in keys[name]
+            ]
+            if not methods_to_run:
+                continue
+
+            bench = cls()
+            bench.setup(scale)
+            try:
+                for name in methods_to_run:
+                    method = getattr(bench, name)
+                    method(scale)  # warm up
+                    times = timeit.repeat(lambda: method(scale), number=1, repeat=repeat)
+
+                    results[keys[name]] = {
+                        "min": min(times),
+                        "median": float(np.median(times)),
+                        "repeat": repeat,
+                    }
+                    print(f"{keys[name]:<50} {min(times) * 1e3:10.3f} ms")
+            finally:
+                if hasattr(bench, "teardown"):
+                    bench.teardown(scale)
+
+    return results
+
+
+def previous_run(output: str) -> dict:
+    """returns the last recorded run of the output file"""
+    if not os.path.exists(output):
+        return None
+
+    with open(output) as file:
+        lines = [line for line in file if line.strip()]
+
+    return json.loads(lines[-1]) if lines else None
+
+
+def compare(results: dict, previous: dict, threshold: float) -> list:
+    """returns the benchmarks slower than the previous run by more than threshold"""
+    regressions = []
+    for key, result in results.items():
+        before = previous["results"].get(key)
+        if before is not None and result["min"] > before["min"] * (1 + threshold):
+            regressions.append((key, before["min"], result["min"]))
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="runs the pyiat benchmarks")
+    parser.add_argument(
+        "--scales", nargs="+", default=list(benchmarks.SCALES), choices=list(benchmarks.SCALES)
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--match", default=None, help="only run the matching benchmarks")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="relative slowdown reported as regression"
+    )
+    args = parser.parse_args(argv)
+
+    previous = previous_run(args.output)
+    results = run(args.scales, args.repeat, args.match)
+
+    record = {
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "commit": _commit(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "results": results,
+    }
+    with open(args.output, "a") as file:
+        file.write(json.dumps(record) + "\n")
+
+    if previous is not None:
+        regressions = compare(results, previous, args.threshold)
+        for key, before, after in regressions:
+            print(
+                f"regression: {key} {before * 1e3:.3f} ms -> {after * 1e3:.3f} ms "
+                f"(commit {previous['commit']})"
+            )
+
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,6 +2,9 @@
 """
 
 
-from pyiat.core.impact import Capital,Dimension,Indicator,Impact
+from pyiat.core.impact import Capital,Dimension,Indicator,Impact,IndicatorTable
+from pyiat.core.compiled import CompiledImpact
 from pyiat.utils.io import excel_parser
+from pyiat.utils.storage import save_project, load_project, load_compiled
+from pyiat.utils.profiling import profile
 from pyiat.error_log.errors import *
\ No newline at end of file
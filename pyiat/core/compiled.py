@@ -0,0 +1,820 @@
+import numpy as np
+import pandas as pd
+import threading
+from collections import namedtuple
+from typing import List, Union
+from pyiat.utils.constants import INDICATORS, POSITIVE
+from pyiat.error_log.errors import InvalidInput, WrongFormat
+from pyiat.utils.tools import segment_sum
+
+STATES = ["ex_ante", "ex_post"]
+SCENARIO_COLUMNS = ["scenario", "capital", "dimension", "indicator", "ex_ante", "ex_post"]
+
+Scenarios = namedtuple("Scenarios", ["score", "capitals_score", "dimensions_score"])
+
+
+def normalize(ex_ante: np.ndarray, ex_post: np.ndarray, positive: np.ndarray) -> np.ndarray:
+    """vectorized version of Indicator.normalized
+
+    Parameters
+    ----------
+    ex_ante : np.ndarray
+        ex_ante rates of shape (..., indicators)
+    ex_post : np.ndarray
+        ex_post rates of shape (..., indicators)
+    positive : np.ndarray
+        bool array of shape (indicators,), True for positive indicators
+
+    Returns
+    -------
+    np.ndarray
+        array of shape (..., 2, indicators) with normalized ex_ante and ex_post
+    """
+    ex_ante = np.asarray(ex_ante, dtype=float)
+    ex_post = np.asarray(ex_post, dtype=float)
+    total = ex_ante + ex_post
+
+    return np.stack(
+        [
+            np.where(positive, ex_ante, ex_post) / total,
+            np.where(positive, ex_post, ex_ante) / total,
+        ],
+        axis=-2,
+    )
+
+
+class CompiledImpact:
+    """an array-backed, flattened copy of an Impact hierarchy
+
+    indicators are stored contiguously per dimension and dimensions contiguously
+    per capital, so every level of the tree is a segment of the level below and
+    the scores are computed with segmented reductions instead of tree walks.
+
+    update changes the arrays in place under the lock of the object, e.g. when
+    Impact rescores an edited indicator. capital_values, impact_values and
+    rates take the same lock, so they never see a change half applied. the
+    other methods read the arrays directly; while they run in other threads,
+    the indicators of the impact should not be edited.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        capitals: List[str],
+        dimensions: List[str],
+        indicators: List[str],
+        dimension_capital: np.ndarray,
+        indicator_dimension: np.ndarray,
+        ex_ante: np.ndarray,
+        ex_post: np.ndarray,
+        positive: np.ndarray,
+        capital_weight: np.ndarray,
+        dimension_weight: np.ndarray,
+        indicator_weight: np.ndarray,
+    ):
+        """creates a compiled impact
+
+        Parameters
+        ----------
+        name : str
+            the name of the impact
+        capitals : List[str]
+            capital names
+        dimensions : List[str]
+            dimension names, ordered by capital
+        indicators : List[str]
+            indicator names, ordered by dimension
+        dimension_capital : np.ndarray
+            the capital index of every dimension
+        indicator_dimension : np.ndarray
+            the dimension index of every indicator
+        ex_ante : np.ndarray
+            the ex_ante rate of every indicator
+        ex_post : np.ndarray
+            the ex_post rate of every indicator
+        positive : np.ndarray
+            True for positive indicators and False for negative ones
+        capital_weight : np.ndarray
+            the normalized weight of every capital in the impact
+        dimension_weight : np.ndarray
+            the normalized weight of every dimension in its capital. nan if the
+            capital weight matrix is not assigned.
+        indicator_weight : np.ndarray
+            the normalized weight of every indicator in its dimension
+        """
+        self.name = name
+        self.capitals = list(capitals)
+        self.dimensions = list(dimensions)
+        self.indicators = list(indicators)
+        self.dimension_capital = np.asarray(dimension_capital, dtype=np.intp)
+        self.indicator_dimension = np.asarray(indicator_dimension, dtype=np.intp)
+        self.ex_ante = np.asarray(ex_ante, dtype=float)
+        self.ex_post = np.asarray(ex_post, dtype=float)
+        self.positive = np.asarray(positive, dtype=bool)
+        self.capital_weight = np.asarray(capital_weight, dtype=float)
+        self.dimension_weight = np.asarray(dimension_weight, dtype=float)
+        self.indicator_weight = np.asarray(indicator_weight, dtype=float)
+        self._values = None
+        self._sources = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_impact(cls, impact) -> "CompiledImpact":
+        """flattens an Impact object into arrays
+
+        Parameters
+        ----------
+        impact : Impact
+            the impact to be compiled
+
+        Returns
+        -------
+        CompiledImpact
+            the compiled impact
+
+        Raises
+        ------
+        MissingData
+            if the impact or any dimension has no weight matrix assigned
+        """
+        capitals, dimensions, indicators = [], [], []
+        dimension_capital, indicator_dimension = [], []
+        ex_ante, ex_post, positive = [], [], []
+        dimension_weight, indicator_weight = [], []
+        sources = {}
+
+        capital_weight = impact.calc_weight()[impact.capitals].to_numpy()
+
+        for capital_name, capital in impact._capitals.items():
+            if capital.weight_assigned:
+                dimension_weight.extend(capital.calc_weight()[capital.dimensions])
+            else:
+                dimension_weight.extend([np.nan] * len(capital))
+
+            for dimension_name, dimension in capital._dimensions.items():
+                indicator_weight.extend(dimension.calc_weight()[dimension.indicators])
+
+                items = dimension._indicators
+                if isinstance(items, dict):
+                    for indicator_name, indicator in items.items():
+                        sources.setdefault(id(indicator), []).append(len(indicators))
+                        indicators.append(indicator_name)
+                        indicator_dimension.append(len(dimensions))
+                        ex_ante.append(indicator.ex_ante)
+                        ex_post.append(indicator.ex_post)
+                        positive.append(indicator.type == POSITIVE)
+                else:
+                    # an IndicatorTable, whose views are found by table and position
+                    sources.setdefault(id(items), []).append(len(indicators))
+                    indicators.extend(items.names)
+                    indicator_dimension.extend([len(dimensions)] * len(items))
+                    ex_ante.extend(items.ex_ante.tolist())
+                    ex_post.extend(items.ex_post.tolist())
+                    positive.extend(items.positive.tolist())
+
+                dimensions.append(dimension_name)
+                dimension_capital.append(len(capitals))
+
+            capitals.append(capital_name)
+
+        compiled = cls(
+            name=impact.name,
+            capitals=capitals,
+            dimensions=dimensions,
+            indicators=indicators,
+            dimension_capital=dimension_capital,
+            indicator_dimension=indicator_dimension,
+            ex_ante=ex_ante,
+            ex_post=ex_post,
+            positive=positive,
+            capital_weight=capital_weight,
+            dimension_weight=dimension_weight,
+            indicator_weight=indicator_weight,
+        )
+        compiled._sources = sources
+
+        return compiled
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_sources"] = {}
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.indicators)
+
+    def __repr__(self) -> str:
+        return "CompiledImpact" + ":" + self.name
+
+    @property
+    def indicator_capital(self) -> np.ndarray:
+        """the capital index of every indicator"""
+        return self.dimension_capital[self.indicator_dimension]
+
+    @property
+    def normalized(self) -> np.ndarray:
+        """returns the normalized rates of all the indicators
+
+        Returns
+        -------
+        np.ndarray
+            array of shape (2, indicators) with normalized ex_ante and ex_post
+        """
+        return normalize(self.ex_ante, self.ex_post, self.positive)
+
+    @property
+    def global_weight(self) -> np.ndarray:
+        """the weight of every indicator in the impact score
+
+        the product of the indicator weight in its dimension and the capital
+        weight in the impact. dimensions are summed inside their capital, as in
+        Capital.score, so the dimension weights do not enter the chain.
+        """
+        return self.indicator_weight * self.capital_weight[self.indicator_capital]
+
+    @property
+    def contributions(self) -> np.ndarray:
+        """the part of every indicator in the impact score
+
+        Returns
+        -------
+        np.ndarray
+            array of shape (2, indicators), the normalized rates times the
+            global weights. the sum over the indicators is the impact score.
+        """
+        return self.normalized * self.global_weight
+
+    @property
+    def indicator_index(self) -> pd.MultiIndex:
+        """the (Capital, Dimension, Indicator) index of the compiled indicators"""
+        capitals = np.asarray(self.capitals, dtype=object)
+        dimensions = np.asarray(self.dimensions, dtype=object)
+
+        return pd.MultiIndex.from_arrays(
+            [
+                capitals[self.indicator_capital],
+                dimensions[self.indicator_dimension],
+                self.indicators,
+            ],
+            names=["Capital", "Dimension", "Indicator"],
+        )
+
+    def refresh(self) -> None:
+        """recomputes the capital and impact scores from all the indicators"""
+        capitals = segment_sum(
+            self.normalized * self.indicator_weight,
+            self.indicator_capital,
+            len(self.capitals),
+        )
+        self._values = [capitals, capitals @ self.capital_weight]
+
+    def capital_values(self) -> np.ndarray:
+        """returns the capital scores as an array
+
+        Returns
+        -------
+        np.ndarray
+            array of shape (2, capitals)
+        """
+        with self._lock:
+            if self._values is None:
+                self.refresh()
+
+            return self._values[0].copy()
+
+    def impact_values(self) -> np.ndarray:
+        """returns the impact score as an array
+
+        Returns
+        -------
+        np.ndarray
+            array of shape (2,) with ex_ante and ex_post scores
+        """
+        with self._lock:
+            if self._values is None:
+                self.refresh()
+
+            return self._values[1].copy()
+
+    def rates(self) -> tuple:
+        """returns copies of the rates, consistent with concurrent updates
+
+        Returns
+        -------
+        tuple
+            the ex_ante, ex_post and positive arrays
+        """
+        with self._lock:
+            return self.ex_ante.copy(), self.ex_post.copy(), self.positive.copy()
+
+    def positions_of(self, indicator) -> List[int]:
+        """returns the positions of an Indicator object in the compiled arrays
+
+        Parameters
+        ----------
+        indicator : Indicator
+            an indicator object of the compiled impact
+
+        Returns
+        -------
+        List[int]
+            the positions, empty if the indicator is not in the impact
+        """
+        table = getattr(indicator, "table", None)
+        if table is not None:
+            return [
+                start + indicator.position for start in self._sources.get(id(table), [])
+            ]
+
+        return self._sources.get(id(indicator), [])
+
+    def update(
+        self,
+        positions: Union[int, List[int]],
+        ex_ante: Union[int, None] = None,
+        ex_post: Union[int, None] = None,
+        positive: Union[bool, None] = None,
+    ) -> tuple:
+        """changes the rates of some indicators and updates the scores incrementally
+
+        the change of the normalized rates is applied to the capital and
+        impact scores through the weight chain, so the cost does not depend
+        on the size of the impact. the arrays are changed in place under the
+        lock of the object; concurrent updates are serialized, and readers
+        other than capital_values, impact_values and rates may see a change
+        half applied.
+
+        Parameters
+        ----------
+        positions : Union[int, List[int]]
+            the positions of the indicators in the compiled arrays
+        ex_ante : Union[int, None], optional
+            the new ex_ante rate, by default None to keep the current one
+        ex_post : Union[int, None], optional
+            the new ex_post rate, by default None to keep the current one
+        positive : Union[bool, None], optional
+            the new type flag, by default None to keep the current one
+
+        Returns
+        -------
+        tuple
+            the impact scores (ex_ante, ex_post) before and after the change
+
+        Raises
+        ------
+        InvalidInput
+            if the rates are not valid
+        """
+        positions = np.atleast_1d(np.asarray(positions, dtype=np.intp))
+
+        for state, rate in zip(STATES, [ex_ante, ex_post]):
+            if rate is not None and rate not in INDICATORS[state]:
+                raise InvalidInput(f"Valid inputs for {state} are {INDICATORS[state]}")
+
+        with self._lock:
+            if self._values is None:
+                self.refresh()
+            before = self._values[1].copy()
+
+            old = normalize(
+                self.ex_ante[positions], self.ex_post[positions], self.positive[positions]
+            )
+
+            if ex_ante is not None:
+                self.ex_ante[positions] = ex_ante
+            if ex_post is not None:
+                self.ex_post[positions] = ex_post
+            if positive is not None:
+                self.positive[positions] = positive
+
+            new = normalize(
+                self.ex_ante[positions], self.ex_post[positions], self.positive[positions]
+            )
+
+            delta = (new - old) * self.indicator_weight[positions]
+            capitals = self.indicator_capital[positions]
+
+            np.add.at(self._values[0], (slice(None), capitals), delta)
+            self._values[1] += delta @ self.capital_weight[capitals]
+
+            return before, self._values[1].copy()
+
+    def evaluate(self, ex_ante: np.ndarray, ex_post: np.ndarray) -> tuple:
+        """scores many sets of indicator rates against the compiled weights
+
+        Parameters
+        ----------
+        ex_ante : np.ndarray
+            ex_ante rates of shape (scenarios, indicators)
+        ex_post : np.ndarray
+            ex_post rates of shape (scenarios, indicators)
+
+        Returns
+        -------
+        tuple
+            (impact, capitals, normalized) arrays of shapes (scenarios, 2),
+            (scenarios, 2, capitals) and (scenarios, 2, indicators)
+        """
+        normalized = normalize(ex_ante, ex_post, self.positive)
+        capitals = segment_sum(
+            normalized * self.indicator_weight,
+            self.indicator_capital,
+            len(self.capitals),
+        )
+
+        return capitals @ self.capital_weight, capitals, normalized
+
+    def evaluate_batch(
+        self,
+        capital_weight: np.ndarray,
+        indicator_weight: np.ndarray,
+        ex_ante: np.ndarray,
+        ex_post: np.ndarray,
+    ) -> tuple:
+        """scores many sets of weights and rates together
+
+        Parameters
+        ----------
+        capital_weight : np.ndarray
+            capital weights of shape (queries, capitals)
+        indicator_weight : np.ndarray
+            indicator weights of shape (queries, indicators)
+        ex_ante : np.ndarray
+            ex_ante rates of shape (queries, indicators)
+        ex_post : np.ndarray
+            ex_post rates of shape (queries, indicators)
+
+        Returns
+        -------
+        tuple
+            (impact, capitals) arrays of shapes (queries, 2) and
+            (queries, 2, capitals)
+        """
+        normalized = normalize(ex_ante, ex_post, self.positive)
+        capitals = segment_sum(
+            normalized * np.asarray(indicator_weight, dtype=float)[..., None, :],
+            self.indicator_capital,
+            len(self.capitals),
+        )
+        impact = np.einsum(
+            "...kc,...c->...k", capitals, np.asarray(capital_weight, dtype=float)
+        )
+
+        return impact, capitals
+
+    def evaluate_weights(
+        self,
+        capital_weight: Union[np.ndarray, None] = None,
+        indicator_weight: Union[np.ndarray, None] = None,
+    ) -> np.ndarray:
+        """scores many sets of weights against the current rates
+
+        the score is linear in the weights: with only capital weights it is
+        capital_weight @ capital_values, otherwise the global weights are
+        multiplied by the normalized rates.
+
+        Parameters
+        ----------
+        capital_weight : Union[np.ndarray, None], optional
+            capital weights of shape (..., capitals), by default None for the
+            current weights
+        indicator_weight : Union[np.ndarray, None], optional
+            indicator weights of shape (..., indicators), by default None for
+            the current weights
+
+        Returns
+        -------
+        np.ndarray
+            the impact scores of shape (..., 2)
+        """
+        if capital_weight is None:
+            capital_weight = self.capital_weight
+
+        if indicator_weight is None:
+            return np.asarray(capital_weight, dtype=float) @ self.capital_values().T
+
+        global_weight = (
+            np.asarray(indicator_weight, dtype=float)
+            * np.asarray(capital_weight, dtype=float)[..., self.indicator_capital]
+        )
+
+        return global_weight @ self.normalized.T
+
+    def score_weights(
+        self,
+        capital_weight: Union[np.ndarray, pd.DataFrame, None] = None,
+        indicator_weight: Union[np.ndarray, pd.DataFrame, None] = None,
+        renormalize: bool = False,
+    ) -> pd.DataFrame:
+        """scores many alternative weightings in one call
+
+        Parameters
+        ----------
+        capital_weight : Union[np.ndarray, pd.DataFrame, None], optional
+            a (weightings x capitals) array in the order of capitals, or a frame
+            with the capital names as columns, by default None for the current
+            weights
+        indicator_weight : Union[np.ndarray, pd.DataFrame, None], optional
+            a (weightings x indicators) array in the compiled order, or a frame
+            with the indicator_index as columns, by default None for the current
+            weights
+        renormalize : bool, optional
+            if True, the capital weights are scaled to sum to 1 and the
+            indicator weights to sum to 1 in every dimension, by default False
+
+        Returns
+        -------
+        pd.DataFrame
+            the ex_ante and ex_post impact scores of every weighting
+
+        Raises
+        ------
+        WrongFormat
+            if the shape or the columns of the inputs are not correct
+        """
+        index = None
+        weights = []
+        for weight, columns, size in [
+            (capital_weight, self.capitals, len(self.capitals)),
+            (indicator_weight, self.indicator_index, len(self)),
+        ]:
+            if weight is None:
+                weights.append(None)
+                continue
+
+            if isinstance(weight, pd.DataFrame):
+                index = weight.index if index is None else index
+                if not set(columns).issubset(weight.columns):
+                    raise WrongFormat(f"weights should have the columns {list(columns)}.")
+                weight = weight[columns].to_numpy(dtype=float)
+
+            weight = np.atleast_2d(np.asarray(weight, dtype=float))
+            if weight.ndim != 2 or weight.shape[1] != size:
+                raise WrongFormat(f"weights should have the shape (weightings, {size}).")
+            weights.append(weight)
+
+        capital_weight, indicator_weight = weights
+
+        if renormalize and capital_weight is not None:
+            capital_weight = capital_weight / capital_weight.sum(axis=1, keepdims=True)
+
+        if renormalize and indicator_weight is not None:
+            totals = segment_sum(
+                indicator_weight, self.indicator_dimension, len(self.dimensions)
+            )
+            indicator_weight = indicator_weight / totals[:, self.indicator_dimension]
+
+        if capital_weight is not None and indicator_weight is not None:
+            if len(capital_weight) != len(indicator_weight):
+                raise WrongFormat("capital and indicator weights should have the same rows.")
+
+        scores = np.atleast_2d(self.evaluate_weights(capital_weight, indicator_weight))
+
+        return pd.DataFrame(scores, index=index, columns=STATES)
+
+    def _capital_position(self, capital) -> int:
+        if capital not in self.capitals:
+            raise InvalidInput(f"{capital} is not a capital of the impact.")
+
+        return self.capitals.index(capital)
+
+    def _indicator_position(self, indicator) -> int:
+        """the position of an indicator given by position, name or path"""
+        if isinstance(indicator, (int, np.integer)):
+            if not 0 <= indicator < len(self):
+                raise InvalidInput(
+                    f"indicator positions are between 0 and {len(self) - 1}, not {indicator}."
+                )
+
+            return int(indicator)
+
+        if isinstance(indicator, tuple):
+            positions = np.flatnonzero(self.indicator_index.isin([indicator]))
+        else:
+            positions = np.flatnonzero(np.asarray(self.indicators, dtype=object) == indicator)
+
+        if len(positions) != 1:
+            raise InvalidInput(
+                f"{indicator} is not a unique indicator of the impact. "
+                "use its (capital, dimension, indicator) path."
+            )
+
+        return int(positions[0])
+
+    @staticmethod
+    def _reweight(weights: np.ndarray, position: int, weight: float) -> np.ndarray:
+        """sets one weight and scales the others to keep the sum"""
+        if not 0 <= weight <= 1:
+            raise InvalidInput("weights should be between 0 and 1.")
+
+        others = weights.sum() - weights[position]
+        if others > 0:
+            output = weights * (weights.sum() - weight) / others
+        else:
+            output = np.full(len(weights), (weights.sum() - weight) / max(len(weights) - 1, 1))
+
+        output[position] = weight
+
+        return output
+
+    def what_if_capital(self, capital: str, weight: float) -> np.ndarray:
+        """returns the impact score with another weight for one capital
+
+        the weights of the other capitals are scaled to keep the sum, so the
+        cost only depends on the number of capitals.
+
+        Parameters
+        ----------
+        capital : str
+            the name of the capital
+        weight : float
+            the new weight, between 0 and 1
+
+        Returns
+        -------
+        np.ndarray
+            the ex_ante and ex_post impact scores
+        """
+        weights = self._reweight(self.capital_weight, self._capital_position(capital), weight)
+
+        return weights @ self.capital_values().T
+
+    def what_if_indicator(self, indicator, weight: float) -> np.ndarray:
+        """returns the impact score with another weight for one indicator
+
+        the weights of the other indicators of its dimension are scaled to keep
+        the sum, so the cost only depends on the size of the dimension.
+
+        Parameters
+        ----------
+        indicator : Union[int, str, tuple]
+            the position, the name or the (capital, dimension, indicator) path
+            of the indicator
+        weight : float
+            the new weight in its dimension, between 0 and 1
+
+        Returns
+        -------
+        np.ndarray
+            the ex_ante and ex_post impact scores
+        """
+        position = self._indicator_position(indicator)
+        dimension = self.indicator_dimension[position]
+
+        # the indicators of a dimension are contiguous
+        start, stop = np.searchsorted(self.indicator_dimension, [dimension, dimension + 1])
+        weights = self.indicator_weight[start:stop]
+        delta = self._reweight(weights, position - start, weight) - weights
+
+        normalized = normalize(
+            self.ex_ante[start:stop], self.ex_post[start:stop], self.positive[start:stop]
+        )
+        capital = self.dimension_capital[dimension]
+
+        return self.impact_values() + self.capital_weight[capital] * (normalized @ delta)
+
+    def score_scenarios(
+        self,
+        ex_ante: Union[np.ndarray, pd.DataFrame],
+        ex_post: Union[np.ndarray, None] = None,
+        scenarios: Union[List, None] = None,
+    ) -> Scenarios:
+        """scores many alternative rating sets in one call
+
+        Parameters
+        ----------
+        ex_ante : Union[np.ndarray, pd.DataFrame]
+            either a 2-D array of ex_ante rates of shape (scenarios, indicators)
+            in the compiled indicator order, or a long-format pd.DataFrame with
+            scenario, capital, dimension, indicator, ex_ante and ex_post columns.
+            indicators missing from a scenario of the long-format table keep
+            their current rates.
+        ex_post : Union[np.ndarray, None], optional
+            2-D array of ex_post rates, required when ex_ante is an array, by default None
+        scenarios : Union[List, None], optional
+            the names of the scenarios when arrays are passed, by default None
+
+        Returns
+        -------
+        Scenarios
+            a namedtuple of score, capitals_score and dimensions_score frames,
+            each indexed by (scenario, state)
+
+        Raises
+        ------
+        WrongFormat
+            if the shape or the columns of the inputs are not correct, or if an
+            indicator has more than one row in a scenario of the table
+        InvalidInput
+            if rates are not valid or indicators are not in the impact
+        """
+        if isinstance(ex_ante, pd.DataFrame):
+            scenarios, ex_ante, ex_post = self._scenarios_from_frame(ex_ante)
+        else:
+            ex_ante = np.atleast_2d(np.asarray(ex_ante))
+            ex_post = np.atleast_2d(np.asarray(ex_post))
+
+            if ex_ante.shape != ex_post.shape or ex_ante.shape[1] != len(self):
+                raise WrongFormat(
+                    f"ex_ante and ex_post should have the shape (scenarios, {len(self)})."
+                )
+
+            if scenarios is None:
+                scenarios = range(ex_ante.shape[0])
+
+        for state, rates in zip(STATES, [ex_ante, ex_post]):
+            if not np.isin(rates, INDICATORS[state]).all():
+                raise InvalidInput(f"Valid inputs for {state} are {INDICATORS[state]}")
+
+        impact, capitals, normalized = self.evaluate(ex_ante, ex_post)
+
+        index = pd.MultiIndex.from_product(
+            [list(scenarios), STATES], names=["Scenario", "State"]
+        )
+
+        return Scenarios(
+            score=pd.DataFrame(impact.reshape(-1, 1), index=index, columns=["Impact"]),
+            capitals_score=pd.DataFrame(
+                capitals.reshape(-1, len(self.capitals)),
+                index=index,
+                columns=self.capitals,
+            ),
+            dimensions_score=pd.DataFrame(
+                normalized.reshape(-1, len(self)),
+                index=index,
+                columns=self.indicator_index,
+            ),
+        )
+
+    def _scenarios_from_frame(self, frame: pd.DataFrame) -> tuple:
+        """pivots a long-format scenario table into rate arrays"""
+        missing = set(SCENARIO_COLUMNS).difference(frame.columns)
+        if missing:
+            raise WrongFormat(f"scenario table misses the columns {sorted(missing)}.")
+
+        positions = self.indicator_index.get_indexer(
+            pd.MultiIndex.from_frame(frame[["capital", "dimension", "indicator"]])
+        )
+        if (positions == -1).any():
+            unknown = frame.loc[positions == -1, ["capital", "dimension", "indicator"]]
+            raise InvalidInput(
+                f"indicators not found in the impact: {unknown.values.tolist()}"
+            )
+
+        codes, scenarios = pd.factorize(frame["scenario"], sort=False)
+
+        duplicated = pd.Series(codes * len(self) + positions).duplicated().to_numpy()
+        if duplicated.any():
+            rows = frame.loc[duplicated, ["scenario", "capital", "dimension", "indicator"]]
+            raise WrongFormat(
+                f"indicators are given more than once in a scenario: {rows.values.tolist()}"
+            )
+
+        current_ante, current_post, _ = self.rates()
+        ex_ante = np.tile(current_ante, (len(scenarios), 1))
+        ex_post = np.tile(current_post, (len(scenarios), 1))
+        ex_ante[codes, positions] = frame["ex_ante"].to_numpy()
+        ex_post[codes, positions] = frame["ex_post"].to_numpy()
+
+        return scenarios, ex_ante, ex_post
+
+    @property
+    def score(self) -> pd.DataFrame:
+        """returns the impact score, equal to Impact.score
+
+        Returns
+        -------
+        pd.DataFrame
+            the total score of the impact
+        """
+        return pd.DataFrame(
+            self.impact_values()[:, None], index=STATES, columns=["Impact"]
+        )
+
+    @property
+    def capitals_score(self) -> pd.DataFrame:
+        """returns the capital scores, equal to Impact.capitals_score
+
+        Returns
+        -------
+        pd.DataFrame
+            concated capital scores
+        """
+        return pd.DataFrame(self.capital_values(), index=STATES, columns=self.capitals)
+
+    @property
+    def dimensions_score(self) -> pd.DataFrame:
+        """returns the normalized indicator scores of all the dimensions
+
+        Returns
+        -------
+        pd.DataFrame
+            the score of dimensions with (Capital, Dimension, Indicator) columns.
+            selecting a capital gives the same frame as Capital.dimensions_score
+        """
+        return pd.DataFrame(self.normalized, index=STATES, columns=self.indicator_index)
@@ -0,0 +1,129 @@
+import numpy as np
+import pandas as pd
+from typing import Tuple
+from pyiat.core.weights import harker_matrix
+from pyiat.utils.tools import principal_eigen, reciprocal_matrix
+
+# Saaty random consistency indices by matrix size
+RANDOM_INDEX = {
+    1: 0.0,
+    2: 0.0,
+    3: 0.58,
+    4: 0.90,
+    5: 1.12,
+    6: 1.24,
+    7: 1.32,
+    8: 1.41,
+    9: 1.45,
+    10: 1.49,
+    11: 1.51,
+    12: 1.48,
+    13: 1.56,
+    14: 1.57,
+    15: 1.59,
+}
+
+CR_THRESHOLD = 0.1
+
+
+def random_index(size: int) -> float:
+    """returns the random consistency index of a matrix size
+
+    sizes larger than the Saaty table use the Alonso-Lamata estimate of the
+    average principal eigenvalue of random matrices (2.7699n - 4.3513).
+
+    Parameters
+    ----------
+    size : int
+        the size of the matrix
+
+    Returns
+    -------
+    float
+        the random index
+    """
+    if size in RANDOM_INDEX:
+        return RANDOM_INDEX[size]
+
+    return (1.7699 * size - 4.3513) / (size - 1)
+
+
+def consistency_ratio(matrices: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """returns the Saaty consistency measures of a stack of same-size matrices
+
+    Parameters
+    ----------
+    matrices : np.ndarray
+        array of shape (..., n, n) of positive reciprocal matrices. incomplete
+        matrices (with nan) are measured on their Harker matrices.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray, np.ndarray]
+        the principal eigenvalue, the consistency index and the consistency
+        ratio, each of shape (...,). CI and CR are 0 for n <= 2.
+    """
+    matrices = np.asarray(matrices, dtype=float)
+    size = matrices.shape[-1]
+
+    if np.isnan(matrices).any():
+        matrices = harker_matrix(matrices)
+
+    eigenvalue, _ = principal_eigen(matrices)
+
+    if size <= 2:
+        zeros = np.zeros_like(eigenvalue)
+        return eigenvalue, zeros, zeros
+
+    index = (eigenvalue - size) / (size - 1)
+
+    return eigenvalue, index, index / random_index(size)
+
+
+def consistency_report(impact) -> pd.DataFrame:
+    """computes the consistency of every weight matrix of an impact
+
+    matrices of the same size are stacked and solved in one batched power
+    iteration. objects without an assigned weight matrix are not reported.
+
+    Parameters
+    ----------
+    impact : Impact
+        the impact object
+
+    Returns
+    -------
+    pd.DataFrame
+        indexed by (Level, Name) with Size, Lambda Max, CI, CR and Consistent columns
+    """
+    objects = [impact]
+    for capital in impact._capitals.values():
+        objects.append(capital)
+        objects.extend(capital._dimensions.values())
+
+    objects = [obj for obj in objects if obj.weight_assigned]
+
+    groups = {}
+    for position, obj in enumerate(objects):
+        groups.setdefault(len(obj), []).append((position, obj.judgments))
+
+    values = np.empty((len(objects), 3))
+    for size, group in groups.items():
+        positions = [position for position, _ in group]
+        values[positions] = np.column_stack(
+            consistency_ratio(
+                reciprocal_matrix(np.array([judgments for _, judgments in group]), size)
+            )
+        )
+
+    report = pd.DataFrame(
+        values,
+        index=pd.MultiIndex.from_tuples(
+            [(obj.id, obj.name) for obj in objects], names=["Level", "Name"]
+        ),
+        columns=["Lambda Max", "CI", "CR"],
+    )
+    report.insert(0, "Size", [len(obj) for obj in objects])
+    report["Consistent"] = report["CR"] <= CR_THRESHOLD
+
+    return report
@@ -0,0 +1,326 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Union
+from pyiat.core.weights import get_weight_method
+from pyiat.error_log.errors import InvalidInput, WrongFormat
+from pyiat.utils.tools import reciprocal_matrix
+
+AGGREGATIONS = ("judgments", "priorities")
+
+PANEL_COLUMNS = ["expert", "level", "parent", "reference", "compared", "value"]
+
+
+def _expert_weights(expert_weights, experts: int) -> np.ndarray:
+    """returns the expert weights as an array summing to 1"""
+    if expert_weights is None:
+        return np.full(experts, 1 / experts)
+
+    expert_weights = np.asarray(expert_weights, dtype=float)
+    if expert_weights.shape != (experts,) or (expert_weights < 0).any():
+        raise InvalidInput(f"expert weights should be {experts} non-negative values.")
+
+    return expert_weights / expert_weights.sum()
+
+
+def weighted_geometric_mean(
+    values: np.ndarray, expert_weights: Union[np.ndarray, None] = None
+) -> np.ndarray:
+    """returns the weighted geometric mean over the first (expert) axis
+
+    missing values (nan) are skipped and the weights of the other experts are
+    renormalized. the result is nan where all the experts are missing.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        array of shape (experts, ...)
+    expert_weights : Union[np.ndarray, None], optional
+        the weights of the experts, by default None for equal weights
+
+    Returns
+    -------
+    np.ndarray
+        array of shape (...)
+    """
+    values = np.asarray(values, dtype=float)
+    weights = _expert_weights(expert_weights, values.shape[0])
+    weights = weights.reshape((-1,) + (1,) * (values.ndim - 1))
+
+    present = ~np.isnan(values)
+    total = np.where(present, weights, 0).sum(axis=0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        log_mean = np.where(present, weights * np.log(values), 0).sum(axis=0) / total
+
+    return np.exp(log_mean)
+
+
+def aggregate_judgments(
+    matrices: np.ndarray, expert_weights: Union[np.ndarray, None] = None
+) -> np.ndarray:
+    """aggregates individual judgments (AIJ) by element-wise geometric mean
+
+    Parameters
+    ----------
+    matrices : np.ndarray
+        array of shape (experts, ..., n, n)
+    expert_weights : Union[np.ndarray, None], optional
+        the weights of the experts, by default None for equal weights
+
+    Returns
+    -------
+    np.ndarray
+        the group matrices of shape (..., n, n), reciprocal like the individual ones
+    """
+    return weighted_geometric_mean(matrices, expert_weights)
+
+
+def aggregate_priorities(
+    matrices: np.ndarray,
+    expert_weights: Union[np.ndarray, None] = None,
+    method: Union[str, None] = None,
+) -> np.ndarray:
+    """aggregates individual priorities (AIP) by weighted geometric mean
+
+    Parameters
+    ----------
+    matrices : np.ndarray
+        array of shape (experts, ..., n, n)
+    expert_weights : Union[np.ndarray, None], optional
+        the weights of the experts, by default None for equal weights
+    method : Union[str, None], optional
+        the weight method of the individual priorities, if None the global
+        default, by default None
+
+    Returns
+    -------
+    np.ndarray
+        the group priorities of shape (..., n) summing to 1
+    """
+    matrices = np.asarray(matrices, dtype=float)
+    priorities = np.full(matrices.shape[:-1], np.nan)
+
+    # experts with missing judgments do not have priorities for the matrix
+    complete = ~np.isnan(matrices).any(axis=(-2, -1))
+    priorities[complete] = get_weight_method(method)(matrices[complete])
+
+    group = weighted_geometric_mean(priorities, expert_weights)
+
+    return group / group.sum(axis=-1, keepdims=True)
+
+
+class Panel:
+    """the pairwise judgments of many experts for a whole impact
+
+    the judgments are stored as an (experts x comparisons) array in the row
+    order of Impact.weight_matrices_to_table, so the aggregation of all the
+    matrices of the hierarchy is a single vectorized operation.
+    """
+
+    def __init__(self, impact, experts: List):
+        """creates an empty panel
+
+        Parameters
+        ----------
+        impact : Impact
+            the impact whose matrices are judged
+        experts : List
+            the names of the experts
+        """
+        self.impact = impact
+        self.experts = list(experts)
+        self.template = impact.weight_matrices_to_table()
+        self.objects = list(impact._weighted_objects())
+
+        self.offsets = np.zeros(len(self.objects) + 1, dtype=np.intp)
+        self.offsets[1:] = np.cumsum(
+            [len(obj) * (len(obj) - 1) // 2 for obj in self.objects]
+        )
+
+        self.values = np.full((len(self.experts), len(self.template)), np.nan)
+
+    def __len__(self):
+        return len(self.experts)
+
+    @classmethod
+    def from_table(cls, impact, table: pd.DataFrame) -> "Panel":
+        """creates a panel from a long table of judgments
+
+        Parameters
+        ----------
+        impact : Impact
+            the impact whose matrices are judged
+        table : pd.DataFrame
+            expert, level, parent, reference, compared and value columns.
+            comparisons may be given in either direction.
+
+        Returns
+        -------
+        Panel
+            the panel
+
+        Raises
+        ------
+        WrongFormat
+            if columns are missing
+        InvalidInput
+            if comparisons are not in the impact, or if an expert gives a
+            comparison more than once
+        """
+        missing = set(PANEL_COLUMNS).difference(table.columns)
+        if missing:
+            raise WrongFormat(f"panel table misses the columns {sorted(missing)}.")
+
+        codes, experts = pd.factorize(table["expert"], sort=False)
+        panel = cls(impact, experts)
+
+        keys = ["level", "parent", "reference", "compared"]
+        lookup = panel.template[keys].assign(row=np.arange(len(panel.template)))
+        lookup = pd.concat(
+            [
+                lookup.assign(inverse=False),
+                lookup.rename(
+                    columns={"reference": "compared", "compared": "reference"}
+                ).assign(inverse=True),
+            ]
+        )
+
+        merged = table[keys + ["value"]].merge(lookup, on=keys, how="left")
+        unknown = merged["row"].isnull().to_numpy()
+        if unknown.any():
+            raise InvalidInput(
+                f"comparisons not found in the impact: {merged.loc[unknown, keys].values.tolist()}"
+            )
+
+        rows = merged["row"].to_numpy(dtype=np.intp)
+
+        # a comparison and its inverse are the same judgment
+        duplicated = pd.Series(codes * len(panel.template) + rows).duplicated().to_numpy()
+        if duplicated.any():
+            pairs = table.loc[duplicated, ["expert"] + keys]
+            raise InvalidInput(
+                f"comparisons are given more than once by an expert: {pairs.values.tolist()}"
+            )
+
+        values = merged["value"].to_numpy(dtype=float)
+        inverse = merged["inverse"].to_numpy(dtype=bool)
+        panel.values[codes, rows] = np.where(inverse, 1 / values, values)
+
+        return panel
+
+    def set_matrices(self, obj, matrices: np.ndarray) -> None:
+        """sets the judgments of all the experts for one pairwised object
+
+        Parameters
+        ----------
+        obj : Union[Impact, Capital, Dimension]
+            an object of the impact
+        matrices : np.ndarray
+            array of shape (experts, n, n) in the order of obj.pairwised_items.
+            missing judgments are nan.
+
+        Raises
+        ------
+        WrongFormat
+            if the shape of matrices is not correct
+        InvalidInput
+            if the object is not in the impact
+        """
+        position = next(
+            (ii for ii, item in enumerate(self.objects) if item is obj), None
+        )
+        if position is None:
+            raise InvalidInput(f"{obj} is not in the impact of the panel.")
+
+        size = len(obj)
+        matrices = np.asarray(matrices, dtype=float)
+        if matrices.shape != (len(self), size, size):
+            raise WrongFormat(f"matrices should have the shape {(len(self), size, size)}.")
+
+        rows, cols = np.triu_indices(size, 1)
+        self.values[:, self.offsets[position] : self.offsets[position + 1]] = matrices[
+            :, rows, cols
+        ]
+
+    def aggregate(
+        self,
+        aggregation: str = "judgments",
+        expert_weights: Union[np.ndarray, Dict, None] = None,
+        method: Union[str, None] = None,
+    ) -> pd.DataFrame:
+        """aggregates the judgments of all the matrices of the impact
+
+        Parameters
+        ----------
+        aggregation : str, optional
+            "judgments" for the geometric mean of the individual judgments or
+            "priorities" for the geometric mean of the individual priorities,
+            by default "judgments"
+        expert_weights : Union[np.ndarray, Dict, None], optional
+            the weights of the experts as an array or a {expert: weight} dict,
+            by default None for equal weights
+        method : Union[str, None], optional
+            the weight method of the individual priorities, by default None
+
+        Returns
+        -------
+        pd.DataFrame
+            the group judgments in the format of Impact.weight_matrices_to_table.
+            for "priorities" the judgments form the consistent matrix of the
+            group priorities (w_i / w_j).
+        """
+        if aggregation not in AGGREGATIONS:
+            raise InvalidInput(f"Valid inputs for aggregation are {AGGREGATIONS}")
+
+        if isinstance(expert_weights, dict):
+            expert_weights = [expert_weights[expert] for expert in self.experts]
+
+        if aggregation == "judgments":
+            values = weighted_geometric_mean(self.values, expert_weights)
+        else:
+            values = self._aggregate_priorities(expert_weights, method)
+
+        return self.template.assign(value=values)
+
+    def _aggregate_priorities(self, expert_weights, method) -> np.ndarray:
+        """the group priorities of all the objects as consistent judgments"""
+        sizes = np.array([len(obj) for obj in self.objects])
+        values = np.full(len(self.template), np.nan)
+
+        for size in np.unique(sizes[sizes > 1]):
+            positions = np.flatnonzero(sizes == size)
+            rows = self.offsets[positions][:, None] + np.arange(size * (size - 1) // 2)
+
+            matrices = reciprocal_matrix(self.values[:, rows], size)
+            priorities = aggregate_priorities(matrices, expert_weights, method)
+
+            upper, lower = np.triu_indices(size, 1)
+            values[rows] = priorities[:, upper] / priorities[:, lower]
+
+        return values
+
+    def apply(
+        self,
+        aggregation: str = "judgments",
+        expert_weights: Union[np.ndarray, Dict, None] = None,
+        method: Union[str, None] = None,
+        allow_missing: bool = False,
+    ) -> None:
+        """aggregates the judgments and sets the group matrices on the impact
+
+        Parameters
+        ----------
+        aggregation : str, optional
+            "judgments" or "priorities", by default "judgments"
+        expert_weights : Union[np.ndarray, Dict, None], optional
+            the weights of the experts, by default None
+        method : Union[str, None], optional
+            the weight method of the individual priorities, by default None
+        allow_missing : bool, optional
+            if True, comparisons judged by no expert are set as missing
+            comparisons of incomplete matrices, by default False
+        """
+        self.impact.parse_weight_table(
+            self.aggregate(aggregation, expert_weights, method),
+            allow_missing=allow_missing,
+        )
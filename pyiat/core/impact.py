@@ -1,17 +1,306 @@
 from pyiat.utils.constants import INDICATORS, EFFECT, POSITIVE, NEGATIVE
 from pyiat.error_log.errors import InvalidInput, WrongFormat, MissingData
 from pyiat.utils.constants import Constant
-from pyiat.utils.tools import get_combination, geometric_mean,evaluation_guide
+from pyiat.utils.tools import get_combination, evaluation_guide, reciprocal_matrix
+from pyiat.utils.profiling import instrumented, timed
 from pyiat.core.plots import Plots
+from pyiat.core.compiled import STATES, CompiledImpact, normalize
+from pyiat.core.consistency import consistency_ratio, consistency_report
+from pyiat.core.weights import (
+    default_weight_method,
+    get_weight_method,
+    is_connected,
+    weight_methods_version,
+)
 import pandas as pd
 import numpy as np
 import copy
-from typing import Dict, List, Union
+import csv
+import functools
+import threading
+import weakref
+from collections import namedtuple
+from typing import Callable, Dict, List, Union
 
 OBJ_MAP = {"Impact": "capitals", "Capital": "dimensions", "Dimension": "indicators"}
+LEVELS = ["capital", "dimension", "indicator"]
+INDICATOR_COLUMNS = ["type", "unit", "ex_ante", "ex_post"]
+WEIGHT_TABLE_COLUMNS = ["level", "parent", "reference", "compared", "value"]
+
+ScoreChange = namedtuple("ScoreChange", ["indicator", "before", "after"])
+
+SUMMARY_COLUMNS = [
+    "Capital",
+    "Dimension",
+    "Indicator",
+    "Type",
+    "Ex_ante",
+    "Ex_post",
+    "Effect",
+    "Normalized Ex_ante",
+    "Normalized Ex_post",
+    "Difference",
+]
+
+# EFFECT of every rating as a (negative/positive, ex_ante, ex_post) lookup table
+EFFECT_TABLE = np.array(
+    [
+        [
+            [EFFECT[kind][ex_post - ex_ante] for ex_post in INDICATORS.ex_post]
+            for ex_ante in INDICATORS.ex_ante
+        ]
+        for kind in (NEGATIVE, POSITIVE)
+    ],
+    dtype=object,
+)
+
+
+def effect(ex_ante: np.ndarray, ex_post: np.ndarray, positive: np.ndarray) -> np.ndarray:
+    """vectorized version of Indicator.effect
+
+    Parameters
+    ----------
+    ex_ante : np.ndarray
+        ex_ante rates
+    ex_post : np.ndarray
+        ex_post rates
+    positive : np.ndarray
+        True for positive indicators
+
+    Returns
+    -------
+    np.ndarray
+        the qualitative effects
+    """
+    # the rates are 1 to 5
+    return EFFECT_TABLE[
+        np.asarray(positive, dtype=np.intp),
+        np.asarray(ex_ante, dtype=np.intp) - 1,
+        np.asarray(ex_post, dtype=np.intp) - 1,
+    ]
+
+
+_MISSING = object()
+
+
+def memoized(func):
+    """caches the output of a method or property getter in the object cache
+
+    the cache is cleared by Cached._invalidate and when the default or the
+    registered weight methods change. pandas objects and dicts are returned as
+    copies, so the callers can not change the cache.
+
+    the cache is safe for concurrent readers: every key is computed once while
+    the other threads asking for it wait, and different keys are computed in
+    parallel. a result computed while the object was invalidated is returned
+    but not cached.
+    """
+
+    @functools.wraps(func)
+    def wrapper(self, *args):
+        key = (func.__name__,) + args
+        cache = self._cache if self._cache is not None else self._init_cache()
+        if self._methods != weight_methods_version():
+            self._drop_weights()
+
+        value = cache.get(key, _MISSING)
+        if value is _MISSING:
+            with self._key_lock(key):
+                value = cache.get(key, _MISSING)
+                if value is _MISSING:
+                    version = self._version
+                    value = func(self, *args)
+                    with self._lock:
+                        if self._version == version:
+                            cache[key] = value
+
+        if isinstance(value, (pd.DataFrame, pd.Series)):
+            return value.copy()
+        if isinstance(value, dict):
+            return type(value)(value)
+
+        return value
+
+    return wrapper
+
+
+def _read_only(frame: pd.DataFrame) -> pd.DataFrame:
+    """returns a float copy of a frame whose values can not be changed in place
+
+    read-only frames are returned as they are, so the copies of the objects
+    keep sharing them.
+    """
+    if _READ_ONLY.get(id(frame)) is frame:
+        return frame
+
+    values = frame.to_numpy(dtype=float, copy=True)
+    values.flags.writeable = False
+    frame = pd.DataFrame(values, index=frame.index, columns=frame.columns, copy=False)
+    _READ_ONLY[id(frame)] = frame
+
+    return frame
+
+
+# the frames made by _read_only, by id since frames are not hashable
+_READ_ONLY = weakref.WeakValueDictionary()
+
+
+# creates the caches and the parents of the objects on first use
+_CREATION_LOCK = threading.Lock()
+
+
+class Parents:
+    """the weak references to the objects holding an object
+
+    a lighter WeakSet for the few parents of an object: most objects have one
+    parent and the forks sharing an object add one each.
+    """
+
+    __slots__ = ("_refs",)
+
+    def __init__(self):
+        self._refs = []
+
+    def add(self, obj) -> None:
+        if obj not in self:
+            self._refs.append(weakref.ref(obj))
+
+    def discard(self, obj) -> None:
+        self._refs = [ref for ref in self._refs if ref() is not None and ref() is not obj]
 
+    def __contains__(self, obj) -> bool:
+        return any(ref() is obj for ref in self._refs)
 
-class PairWised:
+    def __iter__(self):
+        # a list, so the parents can change during the iteration
+        return iter([obj for obj in (ref() for ref in self._refs) if obj is not None])
+
+    def __len__(self) -> int:
+        return sum(ref() is not None for ref in self._refs)
+
+
+class Cached:
+    """the parent class for objects with cached results
+
+    every object keeps weak references to the objects holding it, so an
+    invalidation clears the cache of the object and of all its ancestors.
+
+    the cache and its locks are created when a result is first cached and the
+    parents when the object is first held, so the objects being built cost no
+    more than their data and are not invalidated.
+    """
+
+    # _lock guards the cache and the version, which counts the invalidations.
+    # _locks holds one lock per cached key.
+    _cache = None
+    _lock = None
+    _locks = None
+    _version = 0
+    _parents = None
+    # the weight_methods_version of the cached results
+    _methods = 0
+
+    def _init_cache(self) -> dict:
+        """creates the cache and its locks, if they do not exist
+
+        Returns
+        -------
+        dict
+            the cache
+        """
+        if self._cache is None:
+            with _CREATION_LOCK:
+                if self._cache is None:
+                    self._lock = threading.Lock()
+                    self._locks = {}
+                    self._cache = {}
+
+        return self._cache
+
+    def _drop_weights(self) -> None:
+        """clears the cache computed with other weight methods"""
+        with self._lock:
+            self._version += 1
+            self._cache.clear()
+            self._methods = weight_methods_version()
+
+    def _key_lock(self, key) -> threading.Lock:
+        """returns the lock computing a cached key"""
+        lock = self._locks.get(key)
+        if lock is None:
+            with self._lock:
+                lock = self._locks.setdefault(key, threading.Lock())
+
+        return lock
+
+    def _hold(self, parent) -> None:
+        """adds an object holding the object"""
+        if self._parents is None:
+            with _CREATION_LOCK:
+                if self._parents is None:
+                    self._parents = Parents()
+
+        self._parents.add(parent)
+
+    def _release(self, parent) -> None:
+        """removes an object holding the object"""
+        if self._parents is not None:
+            self._parents.discard(parent)
+
+    @property
+    def _shared(self) -> bool:
+        """True if the object is held by more than one object"""
+        return self._parents is not None and len(self._parents) > 1
+
+    def _invalidate(self, indicator=None):
+        """clears the cache of the object and its ancestors
+
+        the lock of an object is released before its parents are invalidated,
+        so the invalidations never wait for an object while holding another.
+
+        Parameters
+        ----------
+        indicator : Indicator, optional
+            the indicator whose rates or type changed, if that is the only
+            change, by default None
+        """
+        if self._cache is not None:
+            with self._lock:
+                self._version += 1
+                self._cache.clear()
+
+        if self._parents is not None:
+            for parent in self._parents:
+                parent._invalidate(indicator)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for key in ["_cache", "_parents", "_lock", "_locks", "_version"]:
+            state.pop(key, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+    def _clone(self):
+        """returns a shallow copy sharing the data of the object
+
+        the copy has no parents and keeps the cached results, except the
+        compiled impact which is updated in place.
+        """
+        clone = copy.copy(self)
+        if self._cache is not None:
+            with self._lock:
+                cache = {
+                    key: value for key, value in self._cache.items() if key != ("compile",)
+                }
+            clone._init_cache().update(cache)
+            clone._methods = self._methods
+
+        return clone
+
+
+class PairWised(Cached):
     """ The parent class for pairwised objects including:
         Dimension
         Capital
@@ -21,6 +310,9 @@ class PairWised:
     def __init__(self, name, items, description=None):
         self.name = name
         self.description = description
+        self._weight_matrix = None
+        self._compact = None
+        self.weight_method = None
         self.plots = Plots(self)
         self.set_items(items)
 
@@ -73,44 +365,196 @@ class PairWised:
             dtype=float,
         )
 
-    def set_weight_matrix(self, matrix):
+    @instrumented
+    def set_weight_matrix(self, matrix, allow_missing=False, compact=False):
         """sets the weight matrix
 
         Parameters
         ----------
         matrix : pd.Series
             defines the weights of pairwised items
+        allow_missing : bool, optional
+            if True, nan values are kept as missing comparisons of an incomplete
+            matrix, by default False
+        compact : bool, optional
+            if True, only the upper triangle judgments are kept and weight_matrix
+            is built on access, by default False
 
         Raises
         ------
         InvalidInput
-            if nan exists in matrix
+            if nan exists in matrix and allow_missing is False, or if the given
+            comparisons of an incomplete matrix do not connect all the items
         WrongFormat
             if the index level/s of matrix is not correct
         """
-        if matrix.hasnans:
-            raise InvalidInput("nan values are not acceptable.")
+        if matrix.hasnans and not allow_missing:
+            raise InvalidInput(
+                "nan values are not acceptable. to set an incomplete matrix, use 'allow_missing=True'."
+            )
+
+        items = self.pairwised_items
+        size = len(items)
 
-        df = pd.DataFrame(
-            data=np.eye(len(self)),
-            index=self.pairwised_items,
-            columns=self.pairwised_items,
+        positions = pd.Index(items)
+        rows = positions.get_indexer(matrix.index.get_level_values(0))
+        cols = positions.get_indexer(matrix.index.get_level_values(1))
+        if (rows == -1).any() or (cols == -1).any():
+            raise WrongFormat(
+                f"matrix does not have the correct format. please use the get_weight_matrix function to get the correct format. Object -> {self}"
+            )
+
+        data = np.eye(size)
+        if allow_missing:
+            data[data == 0] = np.nan
+
+        values = matrix.to_numpy(dtype=float)
+        given = ~np.isnan(values)
+        data[rows[given], cols[given]] = values[given]
+        data[cols[given], rows[given]] = 1 / values[given]
+
+        if allow_missing and not is_connected(data):
+            raise InvalidInput(
+                f"the given comparisons of '{self}' do not connect all the items."
+            )
+
+        if compact:
+            self._set_compact(data[np.triu_indices(size, 1)])
+        else:
+            self.weight_matrix = pd.DataFrame(data=data, index=items, columns=items)
+
+    def _set_compact(self, values: np.ndarray) -> None:
+        """assigns the upper triangle judgments of a compact weight matrix
+
+        the judgments are copied and not validated, e.g. the judgments of a
+        saved project.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            the judgments in the order of np.triu_indices, nan for missing ones
+
+        Raises
+        ------
+        WrongFormat
+            if the number of judgments does not match the items
+        """
+        size = len(self.pairwised_items)
+        values = np.array(values, dtype=float)
+        if values.shape != (size * (size - 1) // 2,):
+            raise WrongFormat(
+                f"'{self}' needs {size * (size - 1) // 2} judgments, not {values.size}."
+            )
+
+        self._weight_matrix = None
+        self._compact = values
+        self._invalidate()
+
+    @property
+    def weight_matrix(self) -> pd.DataFrame:
+        """the reciprocal weight matrix of the pairwised items
+
+        the matrix is read-only, since the weights computed from it are
+        cached: the weights are changed with set_weight_matrix or by assigning
+        a new matrix.
+
+        Returns
+        -------
+        pd.DataFrame
+            the weight matrix. compact objects build it from their judgments.
+
+        Raises
+        ------
+        AttributeError
+            if the weights are not still assigned, so hasattr can be used
+        """
+        if self._weight_matrix is not None:
+            return self._weight_matrix
+
+        if self._compact is None:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute 'weight_matrix'"
+            )
+
+        items = self.pairwised_items
+        return _read_only(
+            pd.DataFrame(
+                reciprocal_matrix(self._compact, len(items)), index=items, columns=items
+            )
         )
 
-        # print(df)
-        # if not df.index.equals(matrix.index):
-        #     raise WrongFormat(
-        #         f"matrix does not have the correct format. please use the get_weight_matrix function to get the correct format. Object -> {self}"
-        #     )
-        for raw, val in matrix.items():
-            df.loc[raw[0], raw[1]] = val
-            df.loc[raw[1], raw[0]] = 1 / val
+    @weight_matrix.setter
+    def weight_matrix(self, var):
+        self._weight_matrix = _read_only(var)
+        self._compact = None
+        self._invalidate()
+
+    @property
+    def weight_assigned(self) -> bool:
+        """True if the weight matrix is assigned"""
+        return self._weight_matrix is not None or self._compact is not None
+
+    @property
+    def compact(self) -> bool:
+        """True if only the upper triangle judgments are stored"""
+        return self._compact is not None
+
+    @property
+    def judgments(self) -> np.ndarray:
+        """the upper triangle judgments of the weight matrix
+
+        Returns
+        -------
+        np.ndarray
+            the judgments in the order of get_weight_matrix
 
-        self.weight_matrix = df
+        Raises
+        ------
+        MissingData
+            if the weights are not still assigned.
+        """
+        if self._compact is not None:
+            return self._compact.copy()
 
-    def calc_weight(self):
+        if self._weight_matrix is None:
+            raise MissingData(
+                f"weights are not assigned for object '{self}'. set_weight_matrix function can be used for assinging the matrix."
+            )
+
+        items = self.pairwised_items
+        values = self._weight_matrix.loc[items, items].to_numpy(dtype=float)
+
+        return values[np.triu_indices(len(items), 1)]
+
+    @property
+    def weight_method(self):
+        """the name of the weight derivation method of the object
+
+        Returns
+        -------
+        str
+            the method name, or None to use the global default of pyiat.core.weights
+        """
+        return self._weight_method
+
+    @weight_method.setter
+    def weight_method(self, var):
+        if var is not None:
+            get_weight_method(var)
+        self._weight_method = var
+        self._invalidate()
+
+    @instrumented
+    def calc_weight(self, method: Union[str, None] = None):
         """Calculates the normalized weights based on the given weight matrix
 
+        Parameters
+        ----------
+        method : Union[str, None], optional
+            a registered weight method such as "geometric_mean", "eigenvector"
+            or "llsm". if None, the weight_method of the object or the global
+            default is used, by default None
+
         Returns
         -------
         pd.Series
@@ -121,14 +565,46 @@ class PairWised:
         MissingData
             if the weights are not still assigned.
         """
-        if not hasattr(self, "weight_matrix"):
+        if not self.weight_assigned:
             raise MissingData(
                 f"weights are not assigned for object '{self}'. set_weight_matrix function can be used for assinging the matrix."
             )
 
-        geo_mean = geometric_mean(self.weight_matrix)
+        if method is None:
+            method = self.weight_method or default_weight_method()
+
+        return self._calc_weight(method)
+
+    @memoized
+    def _calc_weight(self, method: str) -> pd.Series:
+        if self._compact is not None:
+            index = self.pairwised_items
+            matrix = reciprocal_matrix(self._compact, len(index))
+        else:
+            index = self._weight_matrix.index
+            matrix = self._weight_matrix.to_numpy(dtype=float)
+
+        return pd.Series(get_weight_method(method)(matrix), index=index)
+
+    @property
+    def consistency(self) -> Constant:
+        """returns the Saaty consistency measures of the weight matrix
+
+        Returns
+        -------
+        Constant
+            includes lambda_max, ci and cr
+
+        Raises
+        ------
+        MissingData
+            if the weights are not still assigned.
+        """
+        lambda_max, ci, cr = consistency_ratio(
+            reciprocal_matrix(self.judgments, len(self))
+        )
 
-        return geo_mean / sum(geo_mean)
+        return Constant(lambda_max=float(lambda_max), ci=float(ci), cr=float(cr))
 
     def __repr__(self) -> str:
         return self.id + ":" + self.name
@@ -163,6 +639,17 @@ class PairWised:
         if any([not isinstance(item, _type) for item in items]):
             raise InvalidInput(f"only {_name.title()} object is acceptable.")
 
+        table = getattr(self, _pairwised)
+        if items and isinstance(table, IndicatorTable):
+            # single indicators can not be added to a table, so the rows of the
+            # table become Indicator objects
+            table._release(self)
+            setattr(self, _pairwised, {})
+            for view in table.values():
+                indicator = view.to_indicator()
+                self._indicators[indicator.name] = indicator
+                indicator._hold(self)
+
         for item in items:
 
             if item.name in self.pairwised_items and not overwrite:
@@ -170,31 +657,135 @@ class PairWised:
                     f"{item.name} already exists and is not assigned. to assign duplicate items, use 'overwrite=True'."
                 )
             else:
+                previous = getattr(self, _pairwised).get(item.name)
+                if previous is not None:
+                    previous._release(self)
+
                 getattr(self, _pairwised)[item.name] = item
+                item._hold(self)
+
+        self._invalidate()
 
     def __iter__(self):
-        pairwised = "_" + OBJ_MAP[self.id]
-        self.__it__ = copy.deepcopy(getattr(self, pairwised))
-        self.__pairwised__ = pairwised
-        return self
+        """iterates over the (name, object) pairs of the pairwised items
 
-    def __next__(self):
-        """generating an iterator over the scenarios"""
-        if len(self.__it__):
-            key = [*self.__it__][0]
-            value = getattr(self,self.__pairwised__)[key]
+        every call returns an independent generator over the items of the
+        object, so nested iterations are allowed. the items should not be
+        added or removed during the iteration.
+        """
+        yield from getattr(self, "_" + OBJ_MAP[self.id]).items()
 
-            self.__it__.pop(key)
+    def __setstate__(self, state):
+        # objects pickled before the compact storage keep a dense weight_matrix
+        state.setdefault("_weight_matrix", state.pop("weight_matrix", None))
+        state.setdefault("_compact", None)
+        super().__setstate__(state)
+        if self._weight_matrix is not None:
+            self._weight_matrix = _read_only(self._weight_matrix)
 
-            return (key, value)
+        items = getattr(self, "_" + OBJ_MAP[self.id])
+        if isinstance(items, IndicatorTable):
+            items._hold(self)
+            return
 
-        else:
-            raise StopIteration
+        for item in items.values():
+            item._hold(self)
 
     def copy(self):
         return copy.deepcopy(self)
 
-class Indicator:
+    def _clone(self):
+        clone = super()._clone()
+        clone.plots = Plots(clone)
+
+        # the items are shared, but not the dict holding them
+        items = getattr(clone, "_" + OBJ_MAP[self.id])
+        if not isinstance(items, IndicatorTable):
+            setattr(clone, "_" + OBJ_MAP[self.id], dict(items))
+
+        return clone
+
+    def fork(self):
+        """returns a copy-on-write copy of the object
+
+        unlike copy, the fork shares the items and the weight matrices with
+        the object, so a fork costs one new object whatever the size of the
+        tree. the items to change should be taken with edit, which copies the
+        shared objects on their path only; the changes of shared objects
+        taken otherwise are seen by all the forks.
+
+        Returns
+        -------
+        PairWised
+            the fork
+        """
+        return self._clone()
+
+    def edit(self, *path):
+        """returns an item of the object that is not shared with other trees
+
+        the shared objects on the path are replaced by shallow copies in their
+        parents, so the changes of the returned object only reach this object.
+
+        Examples
+        --------
+        >>> scenario = impact.fork()
+        >>> scenario.edit("Natural Capital", "Water", "Water quality").ex_post = 5
+
+        Parameters
+        ----------
+        *path : str
+            the names of the items from the object down, e.g. the capital,
+            dimension and indicator names for an Impact
+
+        Returns
+        -------
+        Union[PairWised, Indicator]
+            the item, or the object itself for an empty path
+
+        Raises
+        ------
+        InvalidInput
+            if an item of the path does not exist
+        """
+        obj = self
+        for name in path:
+            if not isinstance(obj, PairWised):
+                raise InvalidInput(f"'{obj}' has no items.")
+
+            obj = obj._own(name)
+
+        return obj
+
+    def _own(self, name):
+        """returns an item after replacing it by a copy if it is shared"""
+        _pairwised = "_" + OBJ_MAP[self.id]
+        items = getattr(self, _pairwised)
+        if name not in items:
+            raise InvalidInput(f"'{name}' is not an item of '{self}'.")
+
+        if isinstance(items, IndicatorTable):
+            if items._shared:
+                items._release(self)
+                items = items._clone()
+                items._hold(self)
+                setattr(self, _pairwised, items)
+                self._invalidate()
+
+            return items[name]
+
+        item = items[name]
+        if item._shared:
+            item._release(self)
+            item = item._clone()
+            item._hold(self)
+            items[name] = item
+            # the compiled impact of the ancestors refers to the replaced item
+            self._invalidate()
+
+        return item
+
+class Indicator(Cached):
     """an object for buidling indicators
     """
 
@@ -216,7 +807,6 @@ class Indicator:
         description : str, optional
             the description of the indicator, by default None
         """
-
         self.name = name
         self.type = type
         self.ex_ante = ex_ante
@@ -233,6 +823,7 @@ class Indicator:
         if var not in INDICATORS.type:
             raise InvalidInput(f"Valid inputs for type are {INDICATORS.type}")
         self._type = var
+        self._invalidate(indicator=self)
 
     @property
     def ex_ante(self):
@@ -243,6 +834,7 @@ class Indicator:
         if var not in INDICATORS.ex_ante:
             raise InvalidInput(f"Valid inputs for ex_ante are {INDICATORS.ex_ante}")
         self._ex_ante = var
+        self._invalidate(indicator=self)
 
     @property
     def ex_post(self):
@@ -253,6 +845,7 @@ class Indicator:
         if var not in INDICATORS.ex_post:
             raise InvalidInput(f"Valid inputs for ex_post are {INDICATORS.ex_post}")
         self._ex_post = var
+        self._invalidate(indicator=self)
 
     @property
     def effect(self):
@@ -268,6 +861,7 @@ class Indicator:
         return EFFECT[self.type][difference]
 
     @property
+    @instrumented
     def normalized(self):
         """returns normalized data
 
@@ -294,6 +888,426 @@ class Indicator:
     def copy(self):
         return copy.deepcopy(self)
 
+class IndicatorTable(Cached):
+    """the indicators of a dimension as columnar arrays
+
+    the rates are stored as int8, the types as bool and the units as a
+    categorical, so large registries take a few bytes per indicator instead of
+    an Indicator object each. the table can be given to Dimension instead of a
+    list of indicators and behaves as the {name: Indicator} dict of the
+    dimension; the accessed indicators are IndicatorView objects writing
+    through to the arrays.
+    """
+
+    def __init__(self, names, types, units, ex_ante, ex_post, descriptions=None):
+        """creates a table of indicators
+
+        Parameters
+        ----------
+        names : array-like
+            the unique names of the indicators
+        types : array-like
+            "positive" or "negative"
+        units : array-like
+            the units of measure
+        ex_ante : array-like
+            the ex_ante rates from 1 to 5
+        ex_post : array-like
+            the ex_post rates from 1 to 5
+        descriptions : array-like, optional
+            the descriptions of the indicators, by default None
+
+        Raises
+        ------
+        WrongFormat
+            if the names are duplicated or the columns have different lengths
+        InvalidInput
+            if types or rates are not valid
+        """
+        self._names = pd.Index(names, dtype=object)
+
+        if self._names.has_duplicates:
+            raise WrongFormat(
+                f"duplicate indicators: {self._names[self._names.duplicated()].tolist()}"
+            )
+
+        columns = {"type": types, "unit": units, "ex_ante": ex_ante, "ex_post": ex_post}
+        if descriptions is not None:
+            columns["description"] = descriptions
+
+        columns = {key: np.asarray(val, dtype=object) for key, val in columns.items()}
+        if any(len(val) != len(self._names) for val in columns.values()):
+            raise WrongFormat("all the columns should have the length of names.")
+
+        for column in ["type", "ex_ante", "ex_post"]:
+            self._validate(column, columns[column])
+
+        self._positive = columns["type"] == POSITIVE
+        self._units = pd.Categorical(columns["unit"])
+        self._ex_ante = columns["ex_ante"].astype(np.int8)
+        self._ex_post = columns["ex_post"].astype(np.int8)
+        self._descriptions = (
+            columns["description"] if "description" in columns else None
+        )
+        self._views = weakref.WeakValueDictionary()
+
+    def _validate(self, column, values, positions=slice(None)):
+        """raises InvalidInput with the names of the invalid values"""
+        names = np.asarray(self._names, dtype=object)[positions]
+        invalid = np.broadcast_to(~np.isin(values, INDICATORS[column]), names.shape)
+        if invalid.any():
+            raise InvalidInput(
+                f"Valid inputs for {column} are {INDICATORS[column]}. "
+                f"invalid indicators -> {names[invalid].tolist()}"
+            )
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame) -> "IndicatorTable":
+        """creates a table from a frame of indicators
+
+        Parameters
+        ----------
+        frame : pd.DataFrame
+            type, unit, ex_ante, ex_post and optional description columns with
+            the names of the indicators in the indicator column or as the index
+
+        Returns
+        -------
+        IndicatorTable
+            the table
+        """
+        missing = set(INDICATOR_COLUMNS).difference(frame.columns)
+        if missing:
+            raise WrongFormat(f"indicators table misses the columns {sorted(missing)}.")
+
+        names = frame["indicator"] if "indicator" in frame.columns else frame.index
+
+        return cls(
+            names=names,
+            types=frame["type"],
+            units=frame["unit"],
+            ex_ante=frame["ex_ante"],
+            ex_post=frame["ex_post"],
+            descriptions=frame["description"] if "description" in frame.columns else None,
+        )
+
+    @classmethod
+    def from_indicators(cls, indicators: List[Indicator]) -> "IndicatorTable":
+        """creates a table from Indicator objects
+
+        Parameters
+        ----------
+        indicators : List[Indicator]
+            the indicators
+
+        Returns
+        -------
+        IndicatorTable
+            the table
+        """
+        descriptions = [indicator.description for indicator in indicators]
+
+        return cls(
+            names=[indicator.name for indicator in indicators],
+            types=[indicator.type for indicator in indicators],
+            units=[indicator.unit for indicator in indicators],
+            ex_ante=[indicator.ex_ante for indicator in indicators],
+            ex_post=[indicator.ex_post for indicator in indicators],
+            descriptions=None if all(dd is None for dd in descriptions) else descriptions,
+        )
+
+    def __len__(self):
+        return len(self._names)
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __contains__(self, name):
+        return name in self._names
+
+    def __repr__(self) -> str:
+        return f"IndicatorTable:{len(self)} indicators"
+
+    def __getitem__(self, name) -> "IndicatorView":
+        return self.view(self._names.get_loc(name))
+
+    def get(self, name, default=None):
+        return self[name] if name in self._names else default
+
+    def keys(self):
+        return list(self._names)
+
+    def values(self):
+        return [self.view(position) for position in range(len(self))]
+
+    def items(self):
+        return zip(self._names, self.values())
+
+    def view(self, position: int) -> "IndicatorView":
+        """returns the Indicator view of a row of the table
+
+        the views are kept while they are referenced, so the same row gives
+        the same object.
+
+        Parameters
+        ----------
+        position : int
+            the position of the indicator
+
+        Returns
+        -------
+        IndicatorView
+            the view
+        """
+        position = int(position)
+        self._init_cache()
+        with self._lock:
+            view = self._views.get(position)
+            if view is None:
+                view = IndicatorView(self, position)
+                self._views[position] = view
+
+        return view
+
+    @property
+    def names(self) -> pd.Index:
+        return self._names
+
+    @property
+    def positive(self) -> np.ndarray:
+        return self._positive.copy()
+
+    @property
+    def types(self) -> np.ndarray:
+        return np.where(self._positive, POSITIVE, NEGATIVE).astype(object)
+
+    @property
+    def units(self) -> pd.Categorical:
+        return self._units
+
+    @property
+    def ex_ante(self) -> np.ndarray:
+        return self._ex_ante.copy()
+
+    @property
+    def ex_post(self) -> np.ndarray:
+        return self._ex_post.copy()
+
+    @property
+    def descriptions(self) -> np.ndarray:
+        if self._descriptions is None:
+            return np.full(len(self), None, dtype=object)
+
+        return self._descriptions.copy()
+
+    @property
+    def nbytes(self) -> int:
+        """the memory of the rates, types and unit codes in bytes"""
+        return (
+            self._positive.nbytes
+            + self._ex_ante.nbytes
+            + self._ex_post.nbytes
+            + self._units.codes.nbytes
+        )
+
+    def set_rates(self, positions=None, type=None, ex_ante=None, ex_post=None) -> None:
+        """changes the type and the rates of many indicators at once
+
+        Parameters
+        ----------
+        positions : array-like, optional
+            the positions or the names of the indicators, by default None for all
+        type : array-like, optional
+            the new types, by default None
+        ex_ante : array-like, optional
+            the new ex_ante rates, by default None
+        ex_post : array-like, optional
+            the new ex_post rates, by default None
+
+        Raises
+        ------
+        InvalidInput
+            if the new types or rates are not valid. nothing is changed then.
+        """
+        if positions is None:
+            positions = slice(None)
+        elif not isinstance(positions, slice):
+            positions = np.atleast_1d(positions)
+            if positions.dtype == object or positions.dtype.kind in "US":
+                positions = self._names.get_indexer(positions)
+                if (positions == -1).any():
+                    raise InvalidInput("indicators not found in the table.")
+
+        values = {"type": type, "ex_ante": ex_ante, "ex_post": ex_post}
+        values = {key: np.asarray(val, dtype=object) for key, val in values.items() if val is not None}
+        for column, val in values.items():
+            self._validate(column, val, positions)
+
+        if "type" in values:
+            self._positive[positions] = values["type"] == POSITIVE
+        if "ex_ante" in values:
+            self._ex_ante[positions] = values["ex_ante"].astype(np.int8)
+        if "ex_post" in values:
+            self._ex_post[positions] = values["ex_post"].astype(np.int8)
+
+        self._invalidate()
+
+    @property
+    @memoized
+    def normalized(self) -> pd.DataFrame:
+        """vectorized version of Indicator.normalized
+
+        Returns
+        -------
+        pd.DataFrame
+            the normalized ex_ante and ex_post rows of all the indicators
+        """
+        return pd.DataFrame(
+            normalize(self._ex_ante, self._ex_post, self._positive),
+            index=["ex_ante", "ex_post"],
+            columns=self._names,
+        )
+
+    @property
+    def effect(self) -> np.ndarray:
+        """vectorized version of Indicator.effect
+
+        Returns
+        -------
+        np.ndarray
+            the qualitative effects of all the indicators
+        """
+        return effect(self._ex_ante, self._ex_post, self._positive)
+
+    def to_frame(self) -> pd.DataFrame:
+        """returns the indicators in the format of IndicatorTable.from_frame"""
+        return pd.DataFrame(
+            {
+                "indicator": np.asarray(self._names, dtype=object),
+                "type": self.types,
+                "unit": np.asarray(self._units, dtype=object),
+                "ex_ante": self._ex_ante.astype(int),
+                "ex_post": self._ex_post.astype(int),
+                "description": self.descriptions,
+            }
+        )
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state.pop("_views", None)
+        return state
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self._views = weakref.WeakValueDictionary()
+
+    def _clone(self):
+        clone = super()._clone()
+        # the rates and types are changed in place by the views
+        clone._positive = self._positive.copy()
+        clone._ex_ante = self._ex_ante.copy()
+        clone._ex_post = self._ex_post.copy()
+
+        return clone
+
+
+class IndicatorView(Indicator):
+    """an Indicator reading and writing a row of an IndicatorTable
+
+    the views behave as Indicator objects for the code written for them, while
+    the data stays in the arrays of the table.
+    """
+
+    def __init__(self, table: IndicatorTable, position: int):
+        self.table = table
+        self.position = position
+
+    @property
+    def _parents(self):
+        return self.table._parents
+
+    def _invalidate(self, indicator=None):
+        self.table._invalidate(indicator=self)
+
+    @property
+    def name(self):
+        return self.table._names[self.position]
+
+    @property
+    def unit(self):
+        return self.table._units[self.position]
+
+    @property
+    def description(self):
+        if self.table._descriptions is None:
+            return None
+
+        return self.table._descriptions[self.position]
+
+    @property
+    def type(self):
+        return POSITIVE if self.table._positive[self.position] else NEGATIVE
+
+    @type.setter
+    def type(self, var):
+        if var not in INDICATORS.type:
+            raise InvalidInput(f"Valid inputs for type are {INDICATORS.type}")
+        self.table._positive[self.position] = var == POSITIVE
+        self._invalidate()
+
+    @property
+    def ex_ante(self):
+        return int(self.table._ex_ante[self.position])
+
+    @ex_ante.setter
+    def ex_ante(self, var):
+        if var not in INDICATORS.ex_ante:
+            raise InvalidInput(f"Valid inputs for ex_ante are {INDICATORS.ex_ante}")
+        self.table._ex_ante[self.position] = var
+        self._invalidate()
+
+    @property
+    def ex_post(self):
+        return int(self.table._ex_post[self.position])
+
+    @ex_post.setter
+    def ex_post(self, var):
+        if var not in INDICATORS.ex_post:
+            raise InvalidInput(f"Valid inputs for ex_post are {INDICATORS.ex_post}")
+        self.table._ex_post[self.position] = var
+        self._invalidate()
+
+    @property
+    def normalized(self):
+        normalized = self.table.normalized[self.name]
+
+        return Constant(
+            ex_ante=normalized["ex_ante"],
+            ex_post=normalized["ex_post"],
+            difference=normalized["ex_post"] - normalized["ex_ante"],
+        )
+
+    def to_indicator(self) -> Indicator:
+        """returns an independent Indicator with the values of the view"""
+        return Indicator(
+            name=self.name,
+            type=self.type,
+            unit=self.unit,
+            ex_ante=self.ex_ante,
+            ex_post=self.ex_post,
+            description=self.description,
+        )
+
+    def copy(self):
+        return self.to_indicator()
+
+    def __getstate__(self):
+        return {"table": self.table, "position": self.position}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+
 class Dimension(PairWised):
     """the main class for Dimensions
     """
@@ -307,13 +1321,18 @@ class Dimension(PairWised):
         ----------
         name : str
             dimension name
-        indicators : list
-            list of indicator objects
+        indicators : Union[list, IndicatorTable]
+            list of indicator objects or a table of indicators
         description : _type_, optional
             a description of dimension, by default None
         """
         self._indicators = {}
-        super().__init__(name, indicators, description)
+        if isinstance(indicators, IndicatorTable):
+            super().__init__(name, [], description)
+            self._indicators = indicators
+            indicators._hold(self)
+        else:
+            super().__init__(name, indicators, description)
 
     def set_indicator(self, indicators, overwrite=False):
         """sets new indicators
@@ -332,6 +1351,8 @@ class Dimension(PairWised):
         return [*self._indicators]
 
     @property
+    @instrumented
+    @memoized
     def score(self):
         """calcuates and returns the final score of dimension
 
@@ -340,13 +1361,17 @@ class Dimension(PairWised):
         pd.DataFrame
             final score of dimension for all the indicators of the dimension
         """
-        output = pd.DataFrame()
-        for name, indicator in self:
-            vals = indicator.normalized
-            output.loc["ex_ante", name] = vals.ex_ante
-            output.loc["ex_post", name] = vals.ex_post
+        if isinstance(self._indicators, IndicatorTable):
+            return self._indicators.normalized
+
+        indicators = self._indicators.values()
+        values = normalize(
+            [indicator.ex_ante for indicator in indicators],
+            [indicator.ex_post for indicator in indicators],
+            np.array([indicator.type == POSITIVE for indicator in indicators], dtype=bool),
+        )
 
-        return output
+        return pd.DataFrame(values, index=STATES, columns=[*self._indicators])
 
 
 class Capital(PairWised):
@@ -385,6 +1410,8 @@ class Capital(PairWised):
         self.set_items(dimensions, overwrite)
 
     @property
+    @instrumented
+    @memoized
     def score(self) -> pd.DataFrame:
         """returns the score of capital
 
@@ -393,19 +1420,15 @@ class Capital(PairWised):
         pd.DataFrame
             the total score of the capital
         """
-        output = pd.DataFrame(index=["ex_ante", "ex_post"], columns=[*self._dimensions])
-
-        for name, dimension in self:
-            score = dimension.score
-            weight = dimension.calc_weight()
-            output.loc[["ex_ante", "ex_post"], name] = score @ weight
-
-        capital = output.sum(1).to_frame()
-        capital.columns = [self.name]
+        values = np.zeros(len(STATES))
+        for _, dimension in self:
+            values += (dimension.score @ dimension.calc_weight()).to_numpy(dtype=float)
 
-        return capital
+        return pd.DataFrame(values[:, None], index=STATES, columns=[self.name])
 
     @property
+    @instrumented
+    @memoized
     def dimensions_score(self) -> pd.DataFrame:
         """returns the concated score of capital dimensions
 
@@ -435,8 +1458,232 @@ class Impact(PairWised):
             a description of the impact, by default None
         """
         self._capitals = {}
+        self._subscribers = []
         super().__init__(name, capitals, description)
 
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self._subscribers = []
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state.pop("_subscribers", None)
+        return state
+
+    @classmethod
+    @instrumented
+    def from_frame(
+        cls, frame: pd.DataFrame, name: str = "unknows", indicator_table: bool = False
+    ) -> "Impact":
+        """builds an impact from a table of indicators
+
+        the types and rates are validated column-wise and the hierarchy is
+        built in a single pass over the rows, keeping the order in which the
+        capitals, dimensions and indicators appear.
+
+        Parameters
+        ----------
+        frame : pd.DataFrame
+            one row per indicator with type, unit, ex_ante, ex_post and optional
+            description columns. the capital, dimension and indicator names are
+            either the three levels of the index (as in the project excel file)
+            or capital, dimension and indicator columns.
+        name : str, optional
+            the name of the impact, by default "unknows"
+        indicator_table : bool, optional
+            if True, the indicators of every dimension are stored in an
+            IndicatorTable instead of Indicator objects, by default False
+
+        Returns
+        -------
+        Impact
+            the impact object
+
+        Raises
+        ------
+        WrongFormat
+            if columns are missing or indicators are duplicated
+        InvalidInput
+            if types or rates are not valid
+        """
+        if set(LEVELS).issubset(frame.columns):
+            frame = frame.set_index(LEVELS)
+
+        missing = set(INDICATOR_COLUMNS).difference(frame.columns)
+        if missing:
+            raise WrongFormat(f"indicators table misses the columns {sorted(missing)}.")
+
+        if frame.index.nlevels != 3:
+            raise WrongFormat(
+                "indicators table should be indexed by capital, dimension and indicator."
+            )
+
+        if frame.index.has_duplicates:
+            raise WrongFormat(
+                f"duplicate indicators: {frame.index[frame.index.duplicated()].tolist()}"
+            )
+
+        for column in ["type", "ex_ante", "ex_post"]:
+            invalid = ~frame[column].isin(INDICATORS[column])
+            if invalid.any():
+                raise InvalidInput(
+                    f"Valid inputs for {column} are {INDICATORS[column]}. "
+                    f"invalid rows -> {frame.index[invalid.to_numpy()].tolist()}"
+                )
+
+        if "description" in frame.columns:
+            descriptions = frame["description"].tolist()
+        else:
+            descriptions = [None] * len(frame)
+
+        if indicator_table:
+            tree = {}
+            for (cc, dd), rows in frame.groupby(level=[0, 1], sort=False).indices.items():
+                tree.setdefault(cc, {})[dd] = IndicatorTable(
+                    names=frame.index.get_level_values(2)[rows],
+                    types=frame["type"].to_numpy()[rows],
+                    units=frame["unit"].to_numpy()[rows],
+                    ex_ante=frame["ex_ante"].to_numpy()[rows],
+                    ex_post=frame["ex_post"].to_numpy()[rows],
+                    descriptions=np.asarray(descriptions, dtype=object)[rows],
+                )
+
+            return cls._from_tree(tree, name)
+
+        tree = {}
+        for (cc, dd, ii), _type, unit, ex_ante, ex_post, description in zip(
+            frame.index,
+            frame["type"].tolist(),
+            frame["unit"].tolist(),
+            frame["ex_ante"].tolist(),
+            frame["ex_post"].tolist(),
+            descriptions,
+        ):
+            tree.setdefault(cc, {}).setdefault(dd, []).append(
+                Indicator(
+                    name=ii,
+                    type=_type,
+                    unit=unit,
+                    ex_ante=ex_ante,
+                    ex_post=ex_post,
+                    description=description,
+                )
+            )
+
+        return cls._from_tree(tree, name)
+
+    @classmethod
+    def _from_tree(cls, tree: Dict, name: str) -> "Impact":
+        """builds an impact from {capital: {dimension: indicators}}"""
+        capitals = [
+            Capital(
+                name=cc,
+                dimensions=[
+                    Dimension(name=dd, indicators=indicators)
+                    for dd, indicators in dimensions.items()
+                ],
+            )
+            for cc, dimensions in tree.items()
+        ]
+
+        return cls(name=name, capitals=capitals)
+
+    @classmethod
+    def from_records(cls, records: List, name: str = "unknows") -> "Impact":
+        """builds an impact from a list of indicator records
+
+        Parameters
+        ----------
+        records : List
+            a list of dicts with capital, dimension, indicator, type, unit,
+            ex_ante, ex_post and optional description keys
+        name : str, optional
+            the name of the impact, by default "unknows"
+
+        Returns
+        -------
+        Impact
+            the impact object
+        """
+        return cls.from_frame(pd.DataFrame.from_records(records), name=name)
+
+    def _invalidate(self, indicator=None):
+        """clears the cache and updates the compiled impact incrementally
+
+        when only the rates or the type of an indicator changed, the cached
+        compiled impact is kept and the change is applied through its weight
+        chain. other changes drop the compiled impact, which is compiled again
+        while there are subscribers. the subscribers are notified with a
+        ScoreChange.
+        """
+        compiled = None
+        if self._cache is not None and self._methods == weight_methods_version():
+            with self._lock:
+                compiled = self._cache.get(("compile",))
+        super()._invalidate(indicator)
+
+        if compiled is None and not self._subscribers:
+            return
+
+        positions = (
+            [] if indicator is None or compiled is None else compiled.positions_of(indicator)
+        )
+        if positions:
+            before, after = compiled.update(
+                positions,
+                ex_ante=indicator.ex_ante,
+                ex_post=indicator.ex_post,
+                positive=indicator.type == POSITIVE,
+            )
+            cache = self._init_cache()
+            with self._lock:
+                # a reader may have compiled the changed impact meanwhile
+                cache.setdefault(("compile",), compiled)
+
+        elif self._subscribers:
+            before = None if compiled is None else compiled.impact_values()
+            try:
+                after = self.compile().impact_values()
+            except MissingData:
+                # the impact can not be scored until its weights are assigned
+                return
+
+        else:
+            return
+
+        change = ScoreChange(indicator, before, after)
+        for callback in list(self._subscribers):
+            callback(change)
+
+    def subscribe(self, callback: Callable) -> None:
+        """subscribes a callback to the score changes of the impact
+
+        the callbacks are called with a ScoreChange(indicator, before, after)
+        after every change of the impact, with the impact scores (ex_ante,
+        ex_post) as arrays. the rate and type changes of an indicator are
+        applied incrementally to the compiled impact, which is compiled on
+        subscription. other changes, e.g. of the weights or the items, compile
+        the impact again and give a ScoreChange with indicator None. before is
+        None if the impact could not be scored before the change.
+
+        Parameters
+        ----------
+        callback : Callable
+            a function with one argument
+        """
+        self.compile()
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable) -> None:
+        """removes a subscribed callback
+
+        Parameters
+        ----------
+        callback : Callable
+            a subscribed function
+        """
+        self._subscribers.remove(callback)
+
     @property
     def capitals(self):
         return [*self._capitals]
@@ -453,79 +1700,267 @@ class Impact(PairWised):
         """
         self.set_items(capitals, overwrite)
 
+    @instrumented
+    @memoized
+    def compile(self) -> CompiledImpact:
+        """flattens the capital/dimension/indicator hierarchy into arrays
+
+        the compiled object gives the same score, capitals_score and
+        dimensions_score through vectorized reductions. it is cached until the
+        weights or the items of the impact change; rate changes of the
+        indicators are applied to it incrementally, under its lock (see
+        CompiledImpact for the readers that may run meanwhile). it should not
+        be modified in place otherwise.
+
+        Returns
+        -------
+        CompiledImpact
+            the array-backed copy of the impact
+        """
+        return CompiledImpact.from_impact(self)
+
+    def score_scenarios(
+        self,
+        ex_ante: Union[np.ndarray, pd.DataFrame],
+        ex_post: Union[np.ndarray, None] = None,
+        scenarios: Union[List, None] = None,
+    ):
+        """scores many alternative rating sets against the current weights
+
+        the ratings are broadcasted over the compiled hierarchy, so the
+        indicator objects are not changed. see CompiledImpact.score_scenarios
+        for the input formats; the indicator order of the arrays is the order of
+        Impact.compile().indicators.
+
+        Parameters
+        ----------
+        ex_ante : Union[np.ndarray, pd.DataFrame]
+            a (scenarios x indicators) array of ex_ante rates or a long-format table
+        ex_post : Union[np.ndarray, None], optional
+            a (scenarios x indicators) array of ex_post rates, by default None
+        scenarios : Union[List, None], optional
+            the names of the scenarios, by default None
+
+        Returns
+        -------
+        namedtuple
+            score, capitals_score and dimensions_score of all the scenarios
+        """
+        return self.compile().score_scenarios(ex_ante, ex_post, scenarios)
+
+    @property
+    def contributions(self) -> pd.DataFrame:
+        """returns the global weight and the score contributions of every indicator
+
+        the global weight is the indicator weight times the weight of its
+        capital, so the contributions sum to Impact.score. see
+        CompiledImpact.what_if_capital and what_if_indicator for single
+        weight changes.
+
+        Returns
+        -------
+        pd.DataFrame
+            Global Weight, ex_ante and ex_post columns indexed by
+            (Capital, Dimension, Indicator)
+        """
+        compiled = self.compile()
+        contributions = pd.DataFrame(
+            compiled.contributions.T, index=compiled.indicator_index, columns=STATES
+        )
+        contributions.insert(0, "Global Weight", compiled.global_weight)
+
+        return contributions
+
+    def score_weights(
+        self,
+        capital_weight: Union[np.ndarray, pd.DataFrame, None] = None,
+        indicator_weight: Union[np.ndarray, pd.DataFrame, None] = None,
+        renormalize: bool = False,
+    ) -> pd.DataFrame:
+        """scores many alternative weightings against the current rates
+
+        see CompiledImpact.score_weights for the input formats.
+
+        Parameters
+        ----------
+        capital_weight : Union[np.ndarray, pd.DataFrame, None], optional
+            (weightings x capitals) capital weights, by default None
+        indicator_weight : Union[np.ndarray, pd.DataFrame, None], optional
+            (weightings x indicators) indicator weights, by default None
+        renormalize : bool, optional
+            if True, the weights are scaled to sum to 1 in every parent, by default False
+
+        Returns
+        -------
+        pd.DataFrame
+            the ex_ante and ex_post impact scores of every weighting
+        """
+        return self.compile().score_weights(capital_weight, indicator_weight, renormalize)
+
+    def consistency_report(self) -> pd.DataFrame:
+        """returns the consistency of all the Impact, Capital and Dimension matrices
+
+        Returns
+        -------
+        pd.DataFrame
+            Size, Lambda Max, CI, CR and Consistent columns indexed by (Level, Name)
+        """
+        return consistency_report(self)
+
     @property
+    @instrumented
+    @memoized
     def score(self) -> pd.DataFrame:
         """returns the impact score
 
+        the score is computed from the compiled arrays, see compile.
+
         Returns
         -------
         pd.DataFrame
             the total score of the imapct
         """
-        capital_scores = pd.concat([capital.score for _, capital in self], axis=1,)
-        weights = self.calc_weight()
-        _score = (capital_scores @ weights).to_frame()
-        _score.columns = ["Impact"]
-        return _score
+        return self.compile().score
+
+    def _indicator_arrays(self) -> Dict[str, np.ndarray]:
+        """returns the names and the rates of all the indicators as flat arrays"""
+        columns = {
+            column: []
+            for column in ["capital", "dimension", "indicator", "ex_ante", "ex_post", "positive"]
+        }
+
+        for capital_name, capital in self._capitals.items():
+            for dimension_name, dimension in capital._dimensions.items():
+                items = dimension._indicators
+                if isinstance(items, IndicatorTable):
+                    columns["indicator"].append(np.asarray(items.names, dtype=object))
+                    columns["ex_ante"].append(items.ex_ante)
+                    columns["ex_post"].append(items.ex_post)
+                    columns["positive"].append(items.positive)
+                else:
+                    indicators = list(items.values())
+                    columns["indicator"].append(np.asarray(list(items), dtype=object))
+                    columns["ex_ante"].append([ii.ex_ante for ii in indicators])
+                    columns["ex_post"].append([ii.ex_post for ii in indicators])
+                    columns["positive"].append([ii.type == POSITIVE for ii in indicators])
+
+                size = len(items)
+                columns["capital"].append(np.full(size, capital_name, dtype=object))
+                columns["dimension"].append(np.full(size, dimension_name, dtype=object))
+
+        dtypes = {"ex_ante": np.int64, "ex_post": np.int64, "positive": bool}
+
+        return {
+            column: np.concatenate(
+                [np.asarray(values, dtype=dtypes.get(column, object)) for values in chunks]
+                or [np.empty(0, dtype=dtypes.get(column, object))]
+            )
+            for column, chunks in columns.items()
+        }
+
+    @staticmethod
+    def _summary_frame(arrays: Dict[str, np.ndarray]) -> pd.DataFrame:
+        """builds the summary rows of flat indicator arrays"""
+        ex_ante, ex_post, positive = arrays["ex_ante"], arrays["ex_post"], arrays["positive"]
+        normalized = normalize(ex_ante, ex_post, positive)
+
+        frame = pd.DataFrame(
+            {
+                "Capital": arrays["capital"],
+                "Dimension": arrays["dimension"],
+                "Indicator": arrays["indicator"],
+                "Type": np.where(positive, POSITIVE, NEGATIVE).astype(object),
+                "Ex_ante": ex_ante,
+                "Ex_post": ex_post,
+                "Effect": effect(ex_ante, ex_post, positive),
+                "Normalized Ex_ante": normalized[0],
+                "Normalized Ex_post": normalized[1],
+                "Difference": normalized[1] - normalized[0],
+            },
+            columns=SUMMARY_COLUMNS,
+        )
+
+        return frame.set_index(SUMMARY_COLUMNS[0:3])
 
     @property
+    @instrumented
+    @memoized
     def summary(self) -> pd.DataFrame:
         """returns a summary of the whole project
 
+        the summary is built from the flattened indicator arrays, with the
+        effects looked up in EFFECT_TABLE. summary_to_file writes large
+        summaries in chunks.
+
         Returns
         -------
         pd.DataFrame
             a summary table of the prject
         """
-        headers = [
-            "Capital",
-            "Dimension",
-            "Indicator",
-            "Type",
-            "Ex_ante",
-            "Ex_post",
-            "Effect",
-            "Normalized Ex_ante",
-            "Normalized Ex_post",
-            "Difference",
-        ]
-        vals = []
-        for capital, capital_obj in self():
-            for dimension, dimension_obj in capital_obj:
-                for indicator, indicator_obj in dimension_obj:
-                    normalized = indicator_obj.normalized
-                    vals.append(
-                        [
-                            capital,
-                            dimension,
-                            indicator,
-                            indicator_obj.type,
-                            indicator_obj.ex_ante,
-                            indicator_obj.ex_post,
-                            indicator_obj.effect,
-                            normalized.ex_ante,
-                            normalized.ex_post,
-                            normalized.difference,
-                        ]
-                    )
+        return self._summary_frame(self._indicator_arrays())
 
-        df = pd.DataFrame(vals, columns=headers)
-        return df.set_index(headers[0:3])
+    @instrumented
+    def summary_to_file(self, path: str, chunksize: int = 100000) -> None:
+        """writes the summary into a .csv or .parquet file in chunks of rows
+
+        only one chunk of rows is built as a DataFrame at a time. the
+        Capital, Dimension and Indicator levels are written as columns.
+        parquet files need pyarrow.
+
+        Parameters
+        ----------
+        path : str
+            a .csv or .parquet file path
+        chunksize : int, optional
+            number of rows of a chunk, by default 100000
+        """
+        arrays = self._indicator_arrays()
+        size = len(arrays["indicator"])
+        chunks = (
+            self._summary_frame(
+                {column: values[start : start + chunksize] for column, values in arrays.items()}
+            ).reset_index()
+            for start in range(0, max(size, 1), chunksize)
+        )
 
+        if str(path).endswith(".parquet"):
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            writer = None
+            try:
+                for chunk in chunks:
+                    table = pa.Table.from_pandas(chunk, preserve_index=False)
+                    if writer is None:
+                        writer = pq.ParquetWriter(path, table.schema)
+                    writer.write_table(table)
+            finally:
+                if writer is not None:
+                    writer.close()
+            return
+
+        with open(path, "w", newline="") as file:
+            for position, chunk in enumerate(chunks):
+                chunk.to_csv(file, header=position == 0, index=False)
 
     @property
+    @instrumented
+    @memoized
     def capitals_score(self) -> pd.DataFrame:
         """returns the concated capital scores of the project
 
+        the scores are computed from the compiled arrays, see compile.
+
         Returns
         -------
         pd.DataFrame
             concated capital scores
         """
-        return pd.concat([capital.score for name, capital in self], axis=1)
+        return self.compile().capitals_score
 
 
 
+    @instrumented
     def weight_matrices_to_excel(self,path:Union[str,None]) -> Union[None,Dict]:
         """writes all the weight matrices into a series of excel files
 
@@ -560,45 +1995,69 @@ class Impact(PairWised):
 
         for item,vals in files.items():
             guide = evaluation_guide(item)
-            with pd.ExcelWriter(f'{path}/{item}.xlsx') as file:
-                guide.to_excel(file,"Evaluation Guide")
+            with timed("pandas.to_excel"), pd.ExcelWriter(f'{path}/{item}.xlsx') as file:
+                guide.to_excel(file, sheet_name="Evaluation Guide")
                 for sheet,df in vals.items():
-                    df.to_excel(file,sheet)
+                    df.to_excel(file, sheet_name=sheet)
 
 
+    @instrumented
     def parse_weight_matrices(self,io:Union[str,Dict]) -> None:
         """parses weight matrices from an excel file or a dictionary
 
         Parameters
         ----------
         io : Union[str,Dict]
-            file path as a string or the files dictionary
+            the directory of the Impact, Capital and Dimension excel files as a
+            string, or the files dictionary as returned by weight_matrices_to_excel
 
         Raises
         ------
         InvalidInput
-            if nans exists in the dataframes/excel sheets.
+            if nans exists in the dataframes/excel sheets. all the invalid sheets
+            are reported together.
         """
-        sample = self.weight_matrices_to_excel(path=None)
-
-        if io == None:
+        if isinstance(io, dict):
             files = io
 
         else:
-            files = sample.copy()
-
-            for item,vals in files.items():
-                for sheet,df in vals.items():
+            sheets = {
+                "Impact": ["impacts"],
+                "Capital": self.capitals,
+                "Dimension": [
+                    dimension_name
+                    for capital in self._capitals.values()
+                    for dimension_name in capital.dimensions
+                ],
+            }
+
+            files = {}
+            invalids = []
+            for item, names in sheets.items():
+                # every workbook is opened and parsed once
+                with timed("pandas.read_excel"):
                     data = pd.read_excel(
                         f"{io}/{item}.xlsx",
-                        sheet_name=sheet,
-                        index_col=[0,1]
-                        )
+                        sheet_name=list(dict.fromkeys(names)),
+                        index_col=[0, 1],
+                    )
+
+                nans = (
+                    pd.concat({sheet: df.isnull().any(axis=1) for sheet, df in data.items()})
+                    .groupby(level=0, sort=False)
+                    .any()
+                )
+                invalids.extend(
+                    f"File -> '{io}/{item}.xlsx', sheet -> {sheet}"
+                    for sheet in nans.index[nans.to_numpy()]
+                )
 
-                    if data.isnull().any().sum():
-                        raise InvalidInput(f"NaN values are not acceptable for weights. File -> '{io}/{item}.xlsx', sheet -> {sheet}.")
+                files[item] = {sheet: df.iloc[:, 0] for sheet, df in data.items()}
 
-                    files[item][sheet] = data.iloc[:,0]
+            if invalids:
+                raise InvalidInput(
+                    "NaN values are not acceptable for weights. " + "; ".join(invalids) + "."
+                )
 
         self.set_weight_matrix(files["Impact"]["impacts"])
 
@@ -607,6 +2066,156 @@ class Impact(PairWised):
             for dimension_name,dimension in capital:
                 dimension.set_weight_matrix(files["Dimension"][dimension_name])
 
+    def _weighted_objects(self):
+        """yields the Impact, Capital and Dimension objects of the impact"""
+        yield self
+        for capital in self._capitals.values():
+            yield capital
+            yield from capital._dimensions.values()
+
+    def _weight_rows(self, obj) -> pd.DataFrame:
+        """returns the long-format weight rows of one pairwised object"""
+        items = np.asarray(obj.pairwised_items, dtype=object)
+        rows, cols = np.triu_indices(len(items), 1)
 
+        if obj.weight_assigned:
+            values = obj.judgments
+        else:
+            values = np.full(len(rows), np.nan)
+
+        return pd.DataFrame(
+            {
+                "level": obj.id,
+                "parent": obj.name,
+                "reference": items[rows],
+                "compared": items[cols],
+                "value": values,
+            },
+            columns=WEIGHT_TABLE_COLUMNS,
+        )
 
+    @instrumented
+    def weight_matrices_to_table(
+        self, path: Union[str, None] = None
+    ) -> Union[None, pd.DataFrame]:
+        """writes all the weight matrices into a single long table
 
+        an alternative to weight_matrices_to_excel with one row per pairwise
+        comparison and level, parent, reference, compared and value columns.
+        assigned weights are written as values and missing ones are left empty.
+
+        Parameters
+        ----------
+        path : Union[str, None], optional
+            a .csv or .parquet file path. csv files are written object by
+            object. if None, the table is returned, by default None
+
+        Returns
+        -------
+        Union[None, pd.DataFrame]
+            the table if path is None
+        """
+        if path is None:
+            return pd.concat(
+                [self._weight_rows(obj) for obj in self._weighted_objects()],
+                ignore_index=True,
+            )
+
+        if str(path).endswith(".parquet"):
+            self.weight_matrices_to_table().to_parquet(path, index=False)
+            return
+
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(WEIGHT_TABLE_COLUMNS)
+            for obj in self._weighted_objects():
+                writer.writerows(self._weight_rows(obj).itertuples(index=False))
+
+    @instrumented
+    def parse_weight_table(
+        self, io: Union[str, pd.DataFrame], allow_missing: bool = False
+    ) -> None:
+        """parses the weight matrices from a long table
+
+        Parameters
+        ----------
+        io : Union[str, pd.DataFrame]
+            a .csv or .parquet file path or the table as returned by
+            weight_matrices_to_table
+        allow_missing : bool, optional
+            if True, missing values and absent comparisons are set as
+            incomplete matrices, by default False
+
+        Raises
+        ------
+        WrongFormat
+            if the columns of the table are not correct
+        InvalidInput
+            if values are missing, or if the comparisons of an object are not
+            its n(n-1)/2 distinct pairs. all the invalid objects are reported
+            together.
+        MissingData
+            if the table has no rows for an object of the impact
+        """
+        if isinstance(io, pd.DataFrame):
+            table = io
+        elif str(io).endswith(".parquet"):
+            table = pd.read_parquet(io)
+        else:
+            table = pd.read_csv(io)
+
+        missing = set(WEIGHT_TABLE_COLUMNS).difference(table.columns)
+        if missing:
+            raise WrongFormat(f"weight table misses the columns {sorted(missing)}.")
+
+        invalid = table.loc[table["value"].isnull(), ["level", "parent"]]
+        if len(invalid) and not allow_missing:
+            raise InvalidInput(
+                "NaN values are not acceptable for weights. Objects -> "
+                f"{invalid.drop_duplicates().values.tolist()}"
+            )
+
+        groups = table.groupby(["level", "parent"], sort=False)
+        matrices = {}
+        pairs = {}
+        for (level, parent), group in groups:
+            pairs[(level, parent)] = (
+                len(group),
+                len(set(map(frozenset, zip(group["reference"], group["compared"])))),
+            )
+            matrices[(level, parent)] = pd.Series(
+                group["value"].to_numpy(dtype=float),
+                index=pd.MultiIndex.from_arrays(
+                    [group["reference"], group["compared"]],
+                    names=["Reference Impact", "Compared Impact"],
+                ),
+            )
+
+        objects = list(self._weighted_objects())
+        missing = [
+            repr(obj) for obj in objects if len(obj) > 1 and (obj.id, obj.name) not in matrices
+        ]
+        if missing:
+            raise MissingData(f"weights are not given for objects {missing}.")
+
+        # absent comparisons are missing values of incomplete matrices
+        invalid = []
+        for obj in objects:
+            rows, distinct = pairs.get((obj.id, obj.name), (0, 0))
+            expected = len(obj) * (len(obj) - 1) // 2
+            if rows != distinct or distinct > expected or (
+                distinct < expected and not allow_missing
+            ):
+                invalid.append([obj.id, obj.name])
+
+        if invalid:
+            raise InvalidInput(
+                "every object needs the n(n-1)/2 distinct pairs of its items. Objects -> "
+                f"{invalid}"
+            )
+
+        for obj in objects:
+            obj.set_weight_matrix(
+                matrices.get((obj.id, obj.name), obj.get_weight_matrix()),
+                allow_missing=allow_missing,
+            )
@@ -0,0 +1,365 @@
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from typing import Sequence, Union
+from pyiat.core.compiled import STATES
+from pyiat.error_log.errors import InvalidInput
+from pyiat.core.weights import get_weight_method
+from pyiat.utils.tools import reciprocal_matrix, segment_sum
+
+SAATY_SCALE = np.array([1 / 5, 1 / 4, 1 / 3, 1 / 2, 1, 2, 3, 4, 5])
+
+PERTURBATIONS = ("saaty", "lognormal")
+
+# number of array elements sampled in one batch
+BATCH_SIZE = 2 ** 22
+
+
+def perturb_saaty(
+    values: np.ndarray, size: int, spread: int, rng: np.random.Generator
+) -> np.ndarray:
+    """samples judgments on the Saaty 1/5..5 scale around the given values
+
+    Parameters
+    ----------
+    values : np.ndarray
+        the original judgments
+    size : int
+        number of samples
+    spread : int
+        maximum number of scale steps a judgment can move in each direction
+    rng : np.random.Generator
+        random generator
+
+    Returns
+    -------
+    np.ndarray
+        array of shape (size,) + values.shape
+    """
+    values = np.asarray(values, dtype=float)
+    position = np.abs(np.log(SAATY_SCALE) - np.log(values)[..., None]).argmin(-1)
+    steps = rng.integers(-spread, spread + 1, size=(size,) + values.shape)
+
+    samples = SAATY_SCALE[np.clip(position + steps, 0, len(SAATY_SCALE) - 1)]
+
+    # missing comparisons of incomplete matrices stay missing
+    return np.where(np.isnan(values), np.nan, samples)
+
+
+def perturb_lognormal(
+    values: np.ndarray, size: int, sigma: float, rng: np.random.Generator
+) -> np.ndarray:
+    """samples judgments from a log-normal distribution around the given values
+
+    Parameters
+    ----------
+    values : np.ndarray
+        the original judgments, used as the median of the distribution
+    size : int
+        number of samples
+    sigma : float
+        standard deviation of the log of the judgments
+    rng : np.random.Generator
+        random generator
+
+    Returns
+    -------
+    np.ndarray
+        array of shape (size,) + values.shape
+    """
+    values = np.asarray(values, dtype=float)
+
+    return values * np.exp(rng.normal(0, sigma, size=(size,) + values.shape))
+
+
+class MonteCarlo:
+    """Monte Carlo propagation of the uncertainty of pairwise judgments
+
+    the judgments of the impact matrix (capital weights) and of every dimension
+    matrix (indicator weights) are perturbed and the weights are recomputed with
+    a vectorized weight method over (samples x n x n) stacks. the capital
+    matrices are not sampled since the dimension weights do not enter the
+    scores.
+    """
+
+    def __init__(
+        self,
+        impact,
+        perturbation: str = "saaty",
+        spread: int = 1,
+        sigma: float = 0.25,
+        method: Union[str, None] = None,
+    ):
+        """prepares the Monte Carlo model of an impact
+
+        Parameters
+        ----------
+        impact : Impact
+            an impact with all the weight matrices assigned
+        perturbation : str, optional
+            "saaty" to move the judgments on the Saaty scale or "lognormal", by default "saaty"
+        spread : int, optional
+            maximum number of Saaty scale steps for "saaty" perturbation, by default 1
+        sigma : float, optional
+            standard deviation of log judgments for "lognormal" perturbation, by default 0.25
+        method : Union[str, None], optional
+            the weight method of pyiat.core.weights used for all the samples,
+            if None the global default, by default None
+
+        Raises
+        ------
+        InvalidInput
+            if the perturbation is not valid
+        """
+        if perturbation not in PERTURBATIONS:
+            raise InvalidInput(f"Valid inputs for perturbation are {PERTURBATIONS}")
+
+        self.perturbation = perturbation
+        self.spread = spread
+        self.sigma = sigma
+        self.method = method
+
+        compiled = impact.compile()
+        self.capitals = compiled.capitals
+        self.normalized = compiled.normalized
+        self.indicator_capital = compiled.indicator_capital
+
+        self.impact_judgments = impact.judgments
+
+        # grouping the dimension matrices by size to sample them as stacks
+        groups = {}
+        start = 0
+        for capital in impact._capitals.values():
+            for dimension in capital._dimensions.values():
+                size = len(dimension)
+                judgments, positions = groups.setdefault(size, ([], []))
+                judgments.append(dimension.judgments)
+                positions.append(np.arange(start, start + size))
+                start += size
+
+        self.groups = {
+            size: (np.array(judgments), np.concatenate(positions))
+            for size, (judgments, positions) in groups.items()
+        }
+        self.indicators = start
+
+    def _sample(self, values: np.ndarray, size: int, rng: np.random.Generator):
+        if self.perturbation == "saaty":
+            return perturb_saaty(values, size, self.spread, rng)
+
+        return perturb_lognormal(values, size, self.sigma, rng)
+
+    def sample_chunk(self, size: int, seed=None) -> tuple:
+        """draws one chunk of samples
+
+        the matrices of each group are sampled in batches of about BATCH_SIZE
+        elements and their weights are reduced to capital scores right away,
+        so the memory does not grow with size times the number of indicators.
+
+        Parameters
+        ----------
+        size : int
+            number of samples
+        seed : optional
+            seed of the random generator, by default None
+
+        Returns
+        -------
+        tuple
+            (impact, capitals) arrays of shapes (size, 2) and (size, 2, capitals)
+        """
+        rng = np.random.default_rng(seed)
+        weight_method = get_weight_method(self.method)
+
+        n_capitals = len(self.capitals)
+        capital_weight = weight_method(
+            reciprocal_matrix(self._sample(self.impact_judgments, size, rng), n_capitals)
+        )
+
+        capitals = np.zeros((size, len(STATES), n_capitals))
+        for n, (judgments, positions) in self.groups.items():
+            segments = self.indicator_capital[positions]
+            if n == 1:
+                # single indicators have a weight of one
+                capitals += segment_sum(self.normalized[:, positions], segments, n_capitals)
+                continue
+
+            # the positions of a group are ordered by capital
+            names, bounds = np.unique(segments, return_index=True)
+            bounds = np.append(bounds, len(positions))
+
+            step = max(1, BATCH_SIZE // (len(judgments) * n * n))
+            for first in range(0, size, step):
+                count = min(step, size - first)
+                weights = weight_method(
+                    reciprocal_matrix(self._sample(judgments, count, rng), n)
+                ).reshape(count, -1)
+
+                for capital, start, stop in zip(names, bounds[:-1], bounds[1:]):
+                    capitals[first : first + count, :, capital] += (
+                        weights[:, start:stop] @ self.normalized[:, positions[start:stop]].T
+                    )
+
+        impact = np.einsum("skc,sc->sk", capitals, capital_weight)
+
+        return impact, capitals
+
+    def run(
+        self,
+        samples: int,
+        chunk_size: int = 10000,
+        seed=None,
+        processes: Union[int, None] = None,
+    ) -> "MonteCarloResult":
+        """runs the Monte Carlo simulation
+
+        the samples are drawn in chunks, which are the tasks of the processes.
+        within a chunk the weight matrices are sampled in batches of about
+        BATCH_SIZE elements, so the memory depends on the number of samples
+        only through the (samples, 2, capitals) scores. the results are reproducible for a
+        given seed and chunk_size, with or without processes.
+
+        Parameters
+        ----------
+        samples : int
+            total number of samples
+        chunk_size : int, optional
+            number of samples drawn at once, by default 10000
+        seed : optional
+            seed of the random generators, by default None
+        processes : Union[int, None], optional
+            if given, the chunks are evaluated on a process pool with this
+            number of workers, by default None
+
+        Returns
+        -------
+        MonteCarloResult
+            the score distributions
+        """
+        sizes = [chunk_size] * (samples // chunk_size)
+        if samples % chunk_size:
+            sizes.append(samples % chunk_size)
+
+        seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+        if processes is None:
+            chunks = [self.sample_chunk(size, ss) for size, ss in zip(sizes, seeds)]
+        else:
+            with ProcessPoolExecutor(max_workers=processes) as pool:
+                chunks = list(pool.map(self.sample_chunk, sizes, seeds))
+
+        return MonteCarloResult(
+            impact=np.concatenate([chunk[0] for chunk in chunks]),
+            capitals=np.concatenate([chunk[1] for chunk in chunks]),
+            capital_names=self.capitals,
+        )
+
+
+class MonteCarloResult:
+    """the score distributions of a Monte Carlo simulation"""
+
+    def __init__(self, impact: np.ndarray, capitals: np.ndarray, capital_names: list):
+        self.impact = impact
+        self.capitals = capitals
+        self.capital_names = capital_names
+
+    def __len__(self):
+        return len(self.impact)
+
+    @property
+    def score(self) -> pd.DataFrame:
+        """returns the sampled impact scores
+
+        Returns
+        -------
+        pd.DataFrame
+            a frame of samples with ex_ante and ex_post columns
+        """
+        return pd.DataFrame(self.impact, columns=STATES)
+
+    def capitals_score(self, state: str = "ex_post") -> pd.DataFrame:
+        """returns the sampled capital scores
+
+        Parameters
+        ----------
+        state : str, optional
+            "ex_ante", "ex_post" or "difference", by default "ex_post"
+
+        Returns
+        -------
+        pd.DataFrame
+            a frame of samples with a column per capital
+        """
+        return pd.DataFrame(_state(self.capitals, state), columns=self.capital_names)
+
+    def quantiles(self, q: Sequence[float] = (0.05, 0.5, 0.95)) -> pd.DataFrame:
+        """returns the quantiles of the impact and capital scores
+
+        Parameters
+        ----------
+        q : Sequence[float], optional
+            the quantiles, by default (0.05, 0.5, 0.95)
+
+        Returns
+        -------
+        pd.DataFrame
+            quantiles as rows and (state, Impact or capital) as columns
+        """
+        values = np.concatenate([self.impact[:, :, None], self.capitals], axis=2)
+
+        columns = pd.MultiIndex.from_product(
+            [STATES, ["Impact"] + self.capital_names], names=["State", "Score"]
+        )
+
+        return pd.DataFrame(
+            np.quantile(values.reshape(len(self), -1), q, axis=0),
+            index=pd.Index(q, name="Quantile"),
+            columns=columns,
+        )
+
+    def rank_probabilities(self, state: str = "ex_post") -> pd.DataFrame:
+        """returns the probability of every capital to have each rank
+
+        Parameters
+        ----------
+        state : str, optional
+            "ex_ante", "ex_post" or "difference", by default "ex_post"
+
+        Returns
+        -------
+        pd.DataFrame
+            capitals as rows and ranks (1 is the highest score) as columns
+        """
+        values = _state(self.capitals, state)
+        n_capitals = values.shape[1]
+
+        ranks = np.empty_like(values, dtype=np.intp)
+        np.put_along_axis(
+            ranks,
+            np.argsort(-values, axis=1, kind="stable"),
+            np.arange(n_capitals)[None, :],
+            axis=1,
+        )
+
+        counts = segment_sum(
+            np.ones(ranks.size),
+            (np.arange(n_capitals)[None, :] * n_capitals + ranks).ravel(),
+            n_capitals * n_capitals,
+        ).reshape(n_capitals, n_capitals)
+
+        return pd.DataFrame(
+            counts / len(self),
+            index=self.capital_names,
+            columns=pd.RangeIndex(1, n_capitals + 1, name="Rank"),
+        )
+
+
+def _state(values: np.ndarray, state: str) -> np.ndarray:
+    """selects ex_ante, ex_post or their difference from (samples, 2, ...) arrays"""
+    if state == "difference":
+        return values[:, 1] - values[:, 0]
+
+    if state not in STATES:
+        raise InvalidInput(f"Valid inputs for state are {STATES + ['difference']}")
+
+    return values[:, STATES.index(state)]
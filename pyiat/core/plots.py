@@ -4,6 +4,7 @@ import pandas as pd
 from math import ceil
 from pyiat.error_log.errors import NotImplementable
 from pyiat.utils.tools import generate_plot_grid
+from pyiat.utils.profiling import instrumented
 
 DETAILED_SCORES = {
     "Impact" : "capitals_score",
@@ -15,6 +16,7 @@ class Plots:
     def __init__(self, model):
         self.model = model
 
+    @instrumented
     def final_scores_chart(self,**kwargs):
 
         data = self.model.score
@@ -22,6 +24,7 @@ class Plots:
 
         fig.show()
 
+    @instrumented
     def detailed_scores_chart(self,kind,**kwargs):
 
         if self.model.id == "Dimension":
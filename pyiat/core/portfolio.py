@@ -0,0 +1,153 @@
+import pandas as pd
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterable, Iterator, List, Union
+from pyiat.core.impact import Impact
+from pyiat.error_log.errors import InvalidInput
+from pyiat.utils.io import excel_parser
+from pyiat.utils.storage import load_project
+
+ProjectResult = namedtuple(
+    "ProjectResult", ["index", "name", "score", "capitals_score", "summary"]
+)
+
+
+def load_portfolio_project(project) -> Impact:
+    """returns the Impact of a portfolio project
+
+    Parameters
+    ----------
+    project : Union[Impact, str, tuple]
+        an Impact object, the directory of a project saved with
+        pyiat.utils.storage.save_project, or a (project excel file, weight
+        matrices directory) tuple as used by excel_parser and
+        Impact.parse_weight_matrices
+
+    Returns
+    -------
+    Impact
+        the impact with its weights
+
+    Raises
+    ------
+    InvalidInput
+        if the project is not in a valid form
+    """
+    if isinstance(project, Impact):
+        return project
+
+    if isinstance(project, str):
+        return load_project(project)
+
+    if isinstance(project, tuple) and len(project) == 2:
+        filepath, weights = project
+        impact = excel_parser(filepath, impact_name=filepath).impact
+        impact.parse_weight_matrices(weights)
+        return impact
+
+    raise InvalidInput(
+        "Valid projects are Impact objects, saved project directories or "
+        "(project file, weights directory) tuples."
+    )
+
+
+def evaluate_project(project, index: int = 0, summary: bool = True) -> ProjectResult:
+    """evaluates the scores of one project
+
+    Parameters
+    ----------
+    project : Union[Impact, str, tuple]
+        the project, see load_portfolio_project
+    index : int, optional
+        the position of the project in the portfolio, by default 0
+    summary : bool, optional
+        if False, the summary is not computed, by default True
+
+    Returns
+    -------
+    ProjectResult
+        a namedtuple of index, name, score, capitals_score and summary
+    """
+    impact = load_portfolio_project(project)
+
+    return ProjectResult(
+        index=index,
+        name=impact.name,
+        score=impact.score,
+        capitals_score=impact.capitals_score,
+        summary=impact.summary if summary else None,
+    )
+
+
+def _evaluate_chunk(chunk: List[tuple], summary: bool) -> List[ProjectResult]:
+    return [evaluate_project(project, index, summary) for index, project in chunk]
+
+
+def evaluate_portfolio(
+    projects: Iterable,
+    processes: Union[int, None] = None,
+    chunksize: int = 1,
+    ordered: bool = True,
+    summary: bool = True,
+) -> Iterator[ProjectResult]:
+    """evaluates many independent projects and streams the results
+
+    Parameters
+    ----------
+    projects : Iterable
+        Impact objects, saved project directories or (project file, weights
+        directory) tuples. paths are cheaper to send to the processes than
+        Impact objects.
+    processes : Union[int, None], optional
+        number of worker processes, if None the projects are evaluated in the
+        current process, by default None
+    chunksize : int, optional
+        number of projects sent to a worker at once, by default 1
+    ordered : bool, optional
+        if True, the results are yielded in the order of the projects,
+        otherwise as soon as their chunk is done, by default True
+    summary : bool, optional
+        if False, the summaries are not computed, by default True
+
+    Yields
+    ------
+    Iterator[ProjectResult]
+        the results of the projects
+    """
+    projects = list(enumerate(projects))
+    chunks = [projects[ii : ii + chunksize] for ii in range(0, len(projects), chunksize)]
+
+    if processes is None:
+        for chunk in chunks:
+            yield from _evaluate_chunk(chunk, summary)
+        return
+
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        futures = [pool.submit(_evaluate_chunk, chunk, summary) for chunk in chunks]
+
+        for future in futures if ordered else as_completed(futures):
+            yield from future.result()
+
+
+def portfolio_frame(results: Iterable[ProjectResult]) -> pd.DataFrame:
+    """consolidates the results of a portfolio into one frame
+
+    Parameters
+    ----------
+    results : Iterable[ProjectResult]
+        the results of evaluate_portfolio
+
+    Returns
+    -------
+    pd.DataFrame
+        indexed by (Project, State) with the Impact score and the capital
+        scores as columns. capitals missing in a project are nan.
+    """
+    frames = {}
+    for result in sorted(results, key=lambda result: result.index):
+        name = result.name
+        if name in frames:
+            name = f"{name} ({result.index})"
+        frames[name] = pd.concat([result.score, result.capitals_score], axis=1)
+
+    return pd.concat(frames, names=["Project", "State"])
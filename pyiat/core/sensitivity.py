@@ -0,0 +1,577 @@
+import numpy as np
+import pandas as pd
+from collections import namedtuple
+from typing import Callable, Sequence, Union
+from pyiat.core.compiled import STATES
+from pyiat.core.montecarlo import SAATY_SCALE, perturb_lognormal
+from pyiat.core.weights import default_weight_method, get_weight_method
+from pyiat.error_log.errors import InvalidInput
+from pyiat.utils.tools import reciprocal_matrix, segment_sum
+
+PARAMETERS = ("judgments", "weights")
+
+JUDGMENT_LEVELS = ["Level", "Parent", "Reference", "Compared"]
+WEIGHT_LEVELS = ["Level", "Parent", "Item"]
+
+# number of array elements evaluated in one batch
+BATCH_SIZE = 2 ** 22
+
+Matrix = namedtuple(
+    "Matrix", ["obj", "size", "start", "stop", "positions", "dimension", "capital", "method"]
+)
+
+
+def _select(values: np.ndarray, state: str) -> np.ndarray:
+    """selects ex_ante, ex_post or their difference from (..., 2) arrays"""
+    if state == "difference":
+        return values[..., 1] - values[..., 0]
+
+    if state not in STATES:
+        raise InvalidInput(f"Valid inputs for state are {STATES + ['difference']}")
+
+    return values[..., STATES.index(state)]
+
+
+class Sensitivity:
+    """sensitivity of the impact score to the pairwise judgments and the weights
+
+    the parameters are the judgments of the impact matrix (capital weights) and
+    of the dimension matrices (indicator weights), or the weights derived from
+    them. the capital matrices are not included since the dimension weights do
+    not enter the scores.
+
+    the score is linear in the weights of each matrix, so a change of one
+    matrix only needs the weights of that matrix: every sweep point recomputes
+    one matrix in a batched weight method call and updates the dimension and
+    capital scores as vectors, without changing the impact.
+    """
+
+    def __init__(self, impact, method: Union[str, None] = None):
+        """prepares the sensitivity model of an impact
+
+        Parameters
+        ----------
+        impact : Impact
+            an impact with all the weight matrices assigned
+        method : Union[str, None], optional
+            the weight method used for all the matrices, if None the weight
+            method of every object, by default None
+        """
+        compiled = impact.compile()
+        self.capitals = compiled.capitals
+        self.dimensions = compiled.dimensions
+        self.dimension_capital = compiled.dimension_capital
+        self.capital_weight = compiled.capital_weight
+        self.indicator_weight = compiled.indicator_weight
+        self.normalized = compiled.normalized
+
+        # the score of every dimension, the weighted sum of its normalized rates
+        self.dimension_values = segment_sum(
+            self.normalized * self.indicator_weight,
+            compiled.indicator_dimension,
+            len(self.dimensions),
+        )
+
+        objects = [impact] + [
+            dimension
+            for capital in impact._capitals.values()
+            for dimension in capital._dimensions.values()
+        ]
+
+        self.matrices = []
+        judgments, weights, start, first = [], [], 0, 0
+        for position, obj in enumerate(objects):
+            size = len(obj)
+            if position == 0:
+                positions, dimension, capital = None, None, None
+            else:
+                positions = np.arange(first, first + size)
+                dimension = position - 1
+                capital = self.dimension_capital[dimension]
+                first += size
+
+            if size > 1:
+                rows = impact._weight_rows(obj)
+                judgments.append(rows)
+                weights.append(
+                    pd.DataFrame(
+                        {
+                            "Level": obj.id,
+                            "Parent": obj.name,
+                            "Item": obj.pairwised_items,
+                            "Weight": self.capital_weight
+                            if positions is None
+                            else self.indicator_weight[positions],
+                        }
+                    )
+                )
+                self.matrices.append(
+                    Matrix(
+                        obj=repr(obj),
+                        size=size,
+                        start=start,
+                        stop=start + len(rows),
+                        positions=positions,
+                        dimension=dimension,
+                        capital=capital,
+                        method=get_weight_method(
+                            method or obj.weight_method or default_weight_method()
+                        ),
+                    )
+                )
+                start += len(rows)
+
+        judgments = pd.concat(judgments, ignore_index=True)
+        self.judgments = judgments["value"].to_numpy(dtype=float)
+        self.judgment_index = pd.MultiIndex.from_frame(
+            judgments[["level", "parent", "reference", "compared"]], names=JUDGMENT_LEVELS
+        )
+
+        weights = pd.concat(weights, ignore_index=True)
+        self.weights = weights["Weight"].to_numpy(dtype=float)
+        self.weight_index = pd.MultiIndex.from_frame(
+            weights[WEIGHT_LEVELS], names=WEIGHT_LEVELS
+        )
+        self.weight_offsets = np.cumsum([0] + [matrix.size for matrix in self.matrices])
+
+    def parameters(self, of: str = "judgments") -> pd.Series:
+        """returns the current values of the judgments or the weights
+
+        Parameters
+        ----------
+        of : str, optional
+            "judgments" or "weights", by default "judgments"
+
+        Returns
+        -------
+        pd.Series
+            the values indexed by (Level, Parent, Reference, Compared) for the
+            judgments or (Level, Parent, Item) for the weights
+        """
+        if of not in PARAMETERS:
+            raise InvalidInput(f"Valid inputs for parameters are {PARAMETERS}")
+
+        return pd.Series(self._base(of), index=self._index(of), name="Value")
+
+    def _evaluate(self, matrix: Matrix, weights: np.ndarray) -> tuple:
+        """the capital weights and the dimension scores with new weights of one matrix
+
+        Parameters
+        ----------
+        matrix : Matrix
+            the changed matrix
+        weights : np.ndarray
+            its weights of shape (points, size)
+
+        Returns
+        -------
+        tuple
+            (capital_weight, dimension_values) of shapes (points, capitals) and
+            (points, 2, dimensions)
+        """
+        points = len(weights)
+        if matrix.dimension is None:
+            return weights, np.broadcast_to(
+                self.dimension_values, (points,) + self.dimension_values.shape
+            )
+
+        values = np.repeat(self.dimension_values[None], points, axis=0)
+        values[:, :, matrix.dimension] = weights @ self.normalized[:, matrix.positions].T
+
+        return np.broadcast_to(self.capital_weight, (points, len(self.capitals))), values
+
+    def _impact(self, capital_weight: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """the impact scores of shape (points, 2)"""
+        return np.einsum("pkd,pd->pk", values, capital_weight[:, self.dimension_capital])
+
+    def _capitals(self, values: np.ndarray) -> np.ndarray:
+        """the capital scores of shape (points, 2, capitals)"""
+        return segment_sum(values, self.dimension_capital, len(self.capitals))
+
+    def _points(self, of: str, values: np.ndarray, reduce: Callable) -> np.ndarray:
+        """evaluates every parameter set to each of its values, one at a time
+
+        Parameters
+        ----------
+        of : str
+            "judgments" or "weights"
+        values : np.ndarray
+            the values of every parameter, of shape (parameters, points)
+        reduce : Callable
+            maps (capital_weight, dimension_values) of a batch to an array of
+            shape (batch, ...)
+
+        Returns
+        -------
+        np.ndarray
+            the reduced outputs of shape (parameters, points, ...)
+        """
+        if of not in PARAMETERS:
+            raise InvalidInput(f"Valid inputs for parameters are {PARAMETERS}")
+
+        outputs = []
+        for index, matrix in enumerate(self.matrices):
+            if of == "judgments":
+                base = self.judgments[matrix.start : matrix.stop]
+                rows = values[matrix.start : matrix.stop]
+            else:
+                base = self.weights[self.weight_offsets[index] : self.weight_offsets[index + 1]]
+                rows = values[self.weight_offsets[index] : self.weight_offsets[index + 1]]
+
+            count, grid = rows.shape
+            width = max(len(base), matrix.size ** 2, 2 * len(self.dimensions))
+            step = max(1, BATCH_SIZE // (grid * width))
+
+            for first in range(0, count, step):
+                chunk = np.arange(first, min(first + step, count))
+                batch = rows[chunk]
+
+                if of == "judgments":
+                    points = np.tile(base, (len(chunk), grid, 1))
+                    points[np.arange(len(chunk)), :, chunk] = batch
+                    weights = matrix.method(
+                        reciprocal_matrix(points.reshape(-1, len(base)), matrix.size)
+                    )
+                else:
+                    # the other weights of the matrix are scaled to keep the sum
+                    with np.errstate(divide="ignore", invalid="ignore"):
+                        scale = (1 - batch) / (1 - base[chunk, None])
+                    points = base * scale[:, :, None]
+                    points[np.arange(len(chunk)), :, chunk] = batch
+                    weights = points.reshape(-1, len(base))
+
+                output = reduce(*self._evaluate(matrix, weights))
+                outputs.append(output.reshape((len(chunk), grid) + output.shape[1:]))
+
+        return np.concatenate(outputs)
+
+    def _index(self, of: str) -> pd.MultiIndex:
+        return self.judgment_index if of == "judgments" else self.weight_index
+
+    def _base(self, of: str) -> np.ndarray:
+        return self.judgments if of == "judgments" else self.weights
+
+    def sweep(
+        self,
+        of: str = "judgments",
+        grid: Union[Sequence[float], None] = None,
+        relative: bool = False,
+    ) -> pd.DataFrame:
+        """sets every parameter to every value of a grid, one at a time
+
+        Parameters
+        ----------
+        of : str, optional
+            "judgments" or "weights", by default "judgments"
+        grid : Union[Sequence[float], None], optional
+            the values of the parameters, by default the Saaty scale for the
+            judgments and 0 to 1 in steps of 0.1 for the weights
+        relative : bool, optional
+            if True, the grid values are factors of the current values, by default False
+
+        Returns
+        -------
+        pd.DataFrame
+            Value, ex_ante and ex_post columns indexed by the parameter and the
+            Point of the grid
+        """
+        if grid is None:
+            grid = SAATY_SCALE if of == "judgments" else np.linspace(0, 1, 11)
+
+        base = self._base(of)
+        grid = np.asarray(grid, dtype=float)
+        values = base[:, None] * grid if relative else np.tile(grid, (len(base), 1))
+
+        scores = self._points(of, values, self._impact)
+
+        index = pd.MultiIndex.from_tuples(
+            [(*parameter, point) for parameter in self._index(of) for point in range(len(grid))],
+            names=self._index(of).names + ["Point"],
+        )
+
+        return pd.DataFrame(
+            np.column_stack([values.ravel(), scores.reshape(-1, 2)]),
+            index=index,
+            columns=["Value"] + STATES,
+        )
+
+    def elasticities(self, of: str = "judgments", step: float = 0.01) -> pd.DataFrame:
+        """returns the elasticities of the impact score to every parameter
+
+        the elasticity is the relative change of the score over the relative
+        change of the parameter, estimated by central differences in log scale.
+
+        Parameters
+        ----------
+        of : str, optional
+            "judgments" or "weights", by default "judgments"
+        step : float, optional
+            the log step of the differences, by default 0.01
+
+        Returns
+        -------
+        pd.DataFrame
+            ex_ante and ex_post elasticities indexed by the parameter
+        """
+        base = self._base(of)
+        values = base[:, None] * np.exp([-step, step])
+
+        scores = self._points(of, values, self._impact)
+
+        return pd.DataFrame(
+            (np.log(scores[:, 1]) - np.log(scores[:, 0])) / (2 * step),
+            index=self._index(of),
+            columns=STATES,
+        )
+
+    def tornado(
+        self,
+        of: str = "judgments",
+        state: str = "ex_post",
+        spread: int = 1,
+        delta: float = 0.1,
+    ) -> pd.DataFrame:
+        """returns the swing of the impact score for a low and a high value of every parameter
+
+        Parameters
+        ----------
+        of : str, optional
+            "judgments" or "weights", by default "judgments"
+        state : str, optional
+            "ex_ante", "ex_post" or "difference", by default "ex_post"
+        spread : int, optional
+            the number of Saaty scale steps of the low and high judgments, by default 1
+        delta : float, optional
+            the relative change of the low and high weights, by default 0.1
+
+        Returns
+        -------
+        pd.DataFrame
+            Low Value, High Value, Low, High and Range columns indexed by the
+            parameter, sorted by Range
+        """
+        base = self._base(of)
+        if of == "judgments":
+            position = np.abs(np.log(SAATY_SCALE) - np.log(base)[:, None]).argmin(-1)
+            values = SAATY_SCALE[
+                np.clip(position[:, None] + [-spread, spread], 0, len(SAATY_SCALE) - 1)
+            ]
+        else:
+            values = np.clip(base[:, None] * [1 - delta, 1 + delta], 0, 1)
+
+        scores = _select(self._points(of, values, self._impact), state)
+
+        frame = pd.DataFrame(
+            {
+                "Low Value": values[:, 0],
+                "High Value": values[:, 1],
+                "Low": scores[:, 0],
+                "High": scores[:, 1],
+                "Range": np.abs(scores[:, 1] - scores[:, 0]),
+            },
+            index=self._index(of),
+        )
+
+        return frame.sort_values("Range", ascending=False)
+
+    def rank_reversals(
+        self,
+        of: str = "judgments",
+        state: str = "ex_post",
+        grid: Union[Sequence[float], None] = None,
+    ) -> pd.DataFrame:
+        """returns the closest parameter values that change the ranks of the capitals or dimensions
+
+        the capitals are ranked by their scores, as in Capital.score, and the
+        dimensions by the weighted sums of their normalized rates. the impact
+        judgments do not change these scores, so they have no thresholds.
+
+        Parameters
+        ----------
+        of : str, optional
+            "judgments" or "weights", by default "judgments"
+        state : str, optional
+            "ex_ante", "ex_post" or "difference", by default "ex_post"
+        grid : Union[Sequence[float], None], optional
+            the scanned values, by default 81 log-spaced judgments over the
+            Saaty scale or 101 weights from 0 to 1
+
+        Returns
+        -------
+        pd.DataFrame
+            Capital Lower, Capital Upper, Dimension Lower and Dimension Upper
+            columns with the closest values below and above the current value
+            with another ranking, nan if there is none in the grid
+        """
+        if grid is None:
+            if of == "judgments":
+                grid = np.geomspace(SAATY_SCALE[0], SAATY_SCALE[-1], 81)
+            else:
+                grid = np.linspace(0, 1, 101)
+
+        base = self._base(of)
+        grid = np.asarray(grid, dtype=float)
+
+        base_dimensions = _select(self.dimension_values.T, state)
+        orders = [
+            np.argsort(-segment_sum(base_dimensions, self.dimension_capital, len(self.capitals)), kind="stable"),
+            np.argsort(-base_dimensions, kind="stable"),
+        ]
+
+        def reduce(capital_weight, values):
+            dimensions = _select(np.swapaxes(values, 1, 2), state)
+            capitals = segment_sum(dimensions, self.dimension_capital, len(self.capitals))
+
+            return np.column_stack(
+                [
+                    (np.argsort(-capitals, axis=1, kind="stable") != orders[0]).any(axis=1),
+                    (np.argsort(-dimensions, axis=1, kind="stable") != orders[1]).any(axis=1),
+                ]
+            )
+
+        changed = self._points(of, np.tile(grid, (len(base), 1)), reduce)
+
+        below = (grid < base[:, None])[:, :, None] & changed
+        above = (grid > base[:, None])[:, :, None] & changed
+
+        lower = np.where(below, grid[None, :, None], -np.inf).max(axis=1)
+        upper = np.where(above, grid[None, :, None], np.inf).min(axis=1)
+
+        return pd.DataFrame(
+            {
+                "Capital Lower": lower[:, 0],
+                "Capital Upper": upper[:, 0],
+                "Dimension Lower": lower[:, 1],
+                "Dimension Upper": upper[:, 1],
+            },
+            index=self._index(of),
+        ).replace([-np.inf, np.inf], np.nan)
+
+    def _sample_values(self, judgments: np.ndarray) -> tuple:
+        """the capital weights and dimension scores of sampled judgments
+
+        Parameters
+        ----------
+        judgments : np.ndarray
+            all the judgments of shape (samples, judgments)
+
+        Returns
+        -------
+        tuple
+            (capital_weight, dimension_values) of shapes (samples, capitals) and
+            (samples, 2, dimensions)
+        """
+        samples = len(judgments)
+        capital_weight = np.broadcast_to(self.capital_weight, (samples, len(self.capitals)))
+        values = np.repeat(self.dimension_values[None], samples, axis=0)
+
+        for matrix in self.matrices:
+            weights = matrix.method(
+                reciprocal_matrix(judgments[:, matrix.start : matrix.stop], matrix.size)
+            )
+            if matrix.dimension is None:
+                capital_weight = weights
+            else:
+                values[:, :, matrix.dimension] = weights @ self.normalized[:, matrix.positions].T
+
+        return capital_weight, values
+
+    def sobol(
+        self,
+        samples: int = 1024,
+        sigma: float = 0.25,
+        by: str = "judgment",
+        state: str = "ex_post",
+        seed=None,
+    ) -> pd.DataFrame:
+        """returns the variance-based (Sobol) sensitivity indices of the judgments
+
+        the judgments are sampled log-normally around their values and the
+        first order and total indices are estimated with the Saltelli and
+        Jansen estimators. a judgment only changes the weights of its matrix,
+        so the resampled points recompute one matrix each.
+
+        Parameters
+        ----------
+        samples : int, optional
+            number of base samples, by default 1024
+        sigma : float, optional
+            standard deviation of the log judgments, by default 0.25
+        by : str, optional
+            "judgment" for the index of every judgment or "matrix" for the
+            index of the judgments of every matrix, by default "judgment"
+        state : str, optional
+            "ex_ante", "ex_post" or "difference", by default "ex_post"
+        seed : optional
+            seed of the random generator, by default None
+
+        Returns
+        -------
+        pd.DataFrame
+            First Order and Total columns indexed by the judgment or the matrix
+        """
+        if by not in ("judgment", "matrix"):
+            raise InvalidInput("Valid inputs for by are ('judgment', 'matrix')")
+
+        rng = np.random.default_rng(seed)
+        a = perturb_lognormal(self.judgments, samples, sigma, rng)
+        b = perturb_lognormal(self.judgments, samples, sigma, rng)
+
+        weights_a, values_a = self._sample_values(a)
+        weights_b, values_b = self._sample_values(b)
+
+        score_a = _select(self._impact(weights_a, values_a), state)
+        score_b = _select(self._impact(weights_b, values_b), state)
+        pooled = np.concatenate([score_a, score_b])
+        # centering the b scores does not bias the first order estimator and
+        # reduces its variance when the mean score is large
+        centered = score_b - pooled.mean()
+        variance = pooled.var()
+
+        def indices(score_ab):
+            """the first order and total indices of (samples, groups) scores"""
+            first = np.mean(centered[:, None] * (score_ab - score_a[:, None]), axis=0)
+            total = 0.5 * np.mean((score_a[:, None] - score_ab) ** 2, axis=0)
+            return np.column_stack([first, total]) / variance
+
+        def changed(matrix, weights):
+            """the scores of the a samples with new weights of one matrix"""
+            if matrix.dimension is None:
+                return _select(self._impact(weights, values_a), state)
+
+            values = values_a[:, :, matrix.dimension]
+            new = weights @ self.normalized[:, matrix.positions].T
+            weight = weights_a[:, matrix.capital][:, None]
+            return score_a + _select(weight * (new - values), state)
+
+        output, names = [], []
+        for matrix in self.matrices:
+            if by == "matrix":
+                weights = weights_b if matrix.dimension is None else matrix.method(
+                    reciprocal_matrix(b[:, matrix.start : matrix.stop], matrix.size)
+                )
+                output.append(indices(changed(matrix, weights)[:, None]))
+                names.append(tuple(self.judgment_index[matrix.start][:2]))
+                continue
+
+            count = matrix.stop - matrix.start
+            step = max(1, BATCH_SIZE // (samples * max(count, matrix.size ** 2)))
+            for first in range(0, count, step):
+                chunk = np.arange(first, min(first + step, count))
+                points = np.repeat(a[None, :, matrix.start : matrix.stop], len(chunk), axis=0)
+                points[np.arange(len(chunk)), :, chunk] = b[:, matrix.start + chunk].T
+                weights = matrix.method(
+                    reciprocal_matrix(points.reshape(-1, count), matrix.size)
+                ).reshape(len(chunk), samples, matrix.size)
+
+                output.append(
+                    indices(np.column_stack([changed(matrix, ww) for ww in weights]))
+                )
+
+        index = (
+            pd.MultiIndex.from_tuples(names, names=JUDGMENT_LEVELS[:2])
+            if by == "matrix"
+            else self.judgment_index
+        )
+
+        return pd.DataFrame(np.concatenate(output), index=index, columns=["First Order", "Total"])
@@ -0,0 +1,104 @@
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, Union
+
+
+def _map(func: Callable, items: Iterable, max_workers: Union[int, None]) -> List:
+    """applies a function to the items in a thread pool, keeping their order"""
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(func, items))
+
+
+def warm_scores(impact, max_workers: Union[int, None] = None) -> None:
+    """computes the cached scores and weights of an impact in a thread pool
+
+    the dimensions are scored in parallel, then the capitals. the scores of
+    the impact are then read from the caches, e.g. impact.capitals_score.
+
+    Parameters
+    ----------
+    impact : Impact
+        an impact with all the weight matrices assigned
+    max_workers : Union[int, None], optional
+        the number of threads, by default None for the ThreadPoolExecutor default
+    """
+    dimensions = [dimension for _, capital in impact for _, dimension in capital]
+    _map(lambda dimension: (dimension.score, dimension.calc_weight()), dimensions, max_workers)
+    _map(lambda capital: capital.score, [capital for _, capital in impact], max_workers)
+    impact.calc_weight()
+
+
+def score_impacts(
+    impacts: Iterable, attribute: str = "score", max_workers: Union[int, None] = None
+) -> List:
+    """reads a score of many impacts in a thread pool
+
+    the impacts may share objects, e.g. the forks of a project, since the
+    cached scores are safe for concurrent readers.
+
+    Parameters
+    ----------
+    impacts : Iterable
+        the Impact objects
+    attribute : str, optional
+        the score property, e.g. "score", "capitals_score" or "summary", by default "score"
+    max_workers : Union[int, None], optional
+        the number of threads, by default None for the ThreadPoolExecutor default
+
+    Returns
+    -------
+    List
+        the scores in the order of the impacts
+    """
+    return _map(lambda impact: getattr(impact, attribute), impacts, max_workers)
+
+
+def evaluate_weights(
+    compiled,
+    capital_weight: Union[np.ndarray, None] = None,
+    indicator_weight: Union[np.ndarray, None] = None,
+    chunk_size: int = 2 ** 14,
+    max_workers: Union[int, None] = None,
+) -> np.ndarray:
+    """CompiledImpact.evaluate_weights over chunks of weightings in a thread pool
+
+    numpy releases the GIL in the matrix products, so large batches of
+    weightings are scored in parallel.
+
+    Parameters
+    ----------
+    compiled : CompiledImpact
+        the compiled impact
+    capital_weight : Union[np.ndarray, None], optional
+        capital weights of shape (weightings, capitals), by default None for
+        the current weights
+    indicator_weight : Union[np.ndarray, None], optional
+        indicator weights of shape (weightings, indicators), by default None
+        for the current weights
+    chunk_size : int, optional
+        the number of weightings of every task, by default 2 ** 14
+    max_workers : Union[int, None], optional
+        the number of threads, by default None for the ThreadPoolExecutor default
+
+    Returns
+    -------
+    np.ndarray
+        the impact scores of shape (weightings, 2)
+    """
+    weights = [
+        None if weight is None else np.atleast_2d(np.asarray(weight, dtype=float))
+        for weight in (capital_weight, indicator_weight)
+    ]
+    size = max([len(weight) for weight in weights if weight is not None] + [1])
+
+    def evaluate(start):
+        # single weightings are broadcast against the other weights
+        chunk = [
+            weight
+            if weight is None or len(weight) == 1
+            else weight[start : start + chunk_size]
+            for weight in weights
+        ]
+        return np.atleast_2d(compiled.evaluate_weights(*chunk))
+
+    return np.concatenate(_map(evaluate, range(0, size, chunk_size), max_workers))
@@ -0,0 +1,263 @@
+import numpy as np
+from typing import Callable, Union
+from pyiat.error_log.errors import InvalidInput
+from pyiat.utils.tools import geometric_mean_weights, principal_eigen
+
+GEOMETRIC_MEAN = "geometric_mean"
+EIGENVECTOR = "eigenvector"
+LLSM = "llsm"
+
+
+def is_connected(matrices: np.ndarray) -> np.ndarray:
+    """checks if the comparison graphs of a stack of incomplete matrices are connected
+
+    two items are linked if their comparison is given (not nan). the weights of
+    an incomplete matrix are only defined when its graph is connected.
+
+    Parameters
+    ----------
+    matrices : np.ndarray
+        array of shape (..., n, n) with nan for the missing comparisons
+
+    Returns
+    -------
+    np.ndarray
+        bool array of shape (...)
+    """
+    reach = ~np.isnan(np.asarray(matrices, dtype=float))
+    size = reach.shape[-1]
+    reach = reach | np.eye(size, dtype=bool)
+
+    # squaring the reachability matrix doubles the length of the covered paths
+    for _ in range(int(np.ceil(np.log2(max(size, 2))))):
+        reach = np.matmul(reach.astype(np.float64), reach.astype(np.float64)) > 0
+
+    return reach.all(axis=(-2, -1))
+
+
+def harker_matrix(matrices: np.ndarray) -> np.ndarray:
+    """returns the Harker matrices of a stack of incomplete matrices
+
+    the missing comparisons are replaced by 0 and the diagonal of each row is
+    increased by its number of missing comparisons. the principal eigenvector
+    of the Harker matrix gives the weights of the incomplete matrix.
+
+    Parameters
+    ----------
+    matrices : np.ndarray
+        array of shape (..., n, n) with nan for the missing comparisons
+
+    Returns
+    -------
+    np.ndarray
+        array of shape (..., n, n)
+    """
+    matrices = np.asarray(matrices, dtype=float)
+    missing = np.isnan(matrices)
+
+    harker = np.where(missing, 0, matrices)
+    diagonal = np.arange(matrices.shape[-1])
+    harker[..., diagonal, diagonal] += missing.sum(axis=-1)
+
+    return harker
+
+
+def eigenvector_weights(matrices: np.ndarray) -> np.ndarray:
+    """returns the normalized principal eigenvectors of a stack of matrices
+
+    incomplete matrices (with nan) are solved with Harker's method.
+
+    Parameters
+    ----------
+    matrices : np.ndarray
+        array of shape (..., n, n)
+
+    Returns
+    -------
+    np.ndarray
+        array of shape (..., n) with weights summing to 1 on the last axis
+    """
+    matrices = np.asarray(matrices, dtype=float)
+    if np.isnan(matrices).any():
+        matrices = harker_matrix(matrices)
+
+    _, vector = principal_eigen(matrices)
+
+    return vector
+
+
+def llsm_weights(matrices: np.ndarray) -> np.ndarray:
+    """returns the logarithmic least squares weights of a stack of matrices
+
+    the log weights minimize the squared error against the given log
+    judgments. they are the solution of the normal equations L x = b, where L
+    is the Laplacian of the comparison graph and b the row sums of the given
+    log judgments, so incomplete matrices (with nan) are supported.
+
+    Parameters
+    ----------
+    matrices : np.ndarray
+        array of shape (..., n, n)
+
+    Returns
+    -------
+    np.ndarray
+        array of shape (..., n) with weights summing to 1 on the last axis
+    """
+    matrices = np.asarray(matrices, dtype=float)
+    size = matrices.shape[-1]
+
+    known = ~np.isnan(matrices) & ~np.eye(size, dtype=bool)
+    laplacian = -known.astype(float)
+    diagonal = np.arange(size)
+    laplacian[..., diagonal, diagonal] = known.sum(axis=-1)
+
+    # the ones matrix fixes the free scale of the log weights
+    log_weight = np.linalg.solve(
+        laplacian + np.ones((size, size)),
+        np.where(known, np.log(np.where(known, matrices, 1)), 0).sum(axis=-1)[..., None],
+    )[..., 0]
+
+    weights = np.exp(log_weight - log_weight.max(axis=-1, keepdims=True))
+
+    return weights / weights.sum(axis=-1, keepdims=True)
+
+
+def geometric_mean_method(matrices: np.ndarray) -> np.ndarray:
+    """returns the geometric mean weights of a stack of matrices
+
+    the row geometric mean is not defined for incomplete matrices (with nan),
+    which use its least squares generalization, llsm_weights.
+
+    Parameters
+    ----------
+    matrices : np.ndarray
+        array of shape (..., n, n)
+
+    Returns
+    -------
+    np.ndarray
+        array of shape (..., n) with weights summing to 1 on the last axis
+    """
+    matrices = np.asarray(matrices, dtype=float)
+    if np.isnan(matrices).any():
+        return llsm_weights(matrices)
+
+    return geometric_mean_weights(matrices)
+
+
+WEIGHT_METHODS = {
+    GEOMETRIC_MEAN: geometric_mean_method,
+    EIGENVECTOR: eigenvector_weights,
+    LLSM: llsm_weights,
+}
+
+# version counts the changes of the default method and of the registered
+# methods, so the cached weights and scores computed before are dropped.
+_DEFAULT = {"method": GEOMETRIC_MEAN, "version": 0}
+
+
+def register_weight_method(name: str, func: Callable, overwrite: bool = False) -> None:
+    """registers a new weight derivation method
+
+    Parameters
+    ----------
+    name : str
+        the name of the method
+    func : Callable
+        a function mapping an array of shape (..., n, n) to normalized weights
+        of shape (..., n)
+    overwrite : bool, optional
+        if True, will overwrite an existing method, by default False
+
+    Raises
+    ------
+    InvalidInput
+        if the name already exists and overwrite is False
+    """
+    if name in WEIGHT_METHODS and not overwrite:
+        raise InvalidInput(
+            f"{name} already exists. to replace it, use 'overwrite=True'."
+        )
+
+    if name in WEIGHT_METHODS:
+        _DEFAULT["version"] += 1
+
+    WEIGHT_METHODS[name] = func
+
+
+def set_default_weight_method(name: str) -> None:
+    """sets the method used by objects without their own weight_method
+
+    Parameters
+    ----------
+    name : str
+        the name of a registered method
+    """
+    get_weight_method(name)
+    if name != _DEFAULT["method"]:
+        _DEFAULT["method"] = name
+        _DEFAULT["version"] += 1
+
+
+def default_weight_method() -> str:
+    """returns the name of the global weight method"""
+    return _DEFAULT["method"]
+
+
+def weight_methods_version() -> int:
+    """returns the number of changes of the default and the registered methods"""
+    return _DEFAULT["version"]
+
+
+def get_weight_method(name: Union[str, None] = None) -> Callable:
+    """returns a registered weight method
+
+    Parameters
+    ----------
+    name : Union[str, None], optional
+        the name of the method, if None the global default, by default None
+
+    Returns
+    -------
+    Callable
+        the weight derivation kernel
+
+    Raises
+    ------
+    InvalidInput
+        if the method is not registered
+    """
+    if name is None:
+        name = _DEFAULT["method"]
+
+    if name not in WEIGHT_METHODS:
+        raise InvalidInput(f"Valid inputs for weight method are {[*WEIGHT_METHODS]}")
+
+    return WEIGHT_METHODS[name]
+
+
+def complete_matrix(matrices: np.ndarray, method: Union[str, None] = None) -> np.ndarray:
+    """fills the missing comparisons of a stack of incomplete matrices
+
+    the missing a_ij are replaced by w_i / w_j of the weights derived from
+    the given comparisons.
+
+    Parameters
+    ----------
+    matrices : np.ndarray
+        array of shape (..., n, n) with nan for the missing comparisons
+    method : Union[str, None], optional
+        the weight method, if None the global default, by default None
+
+    Returns
+    -------
+    np.ndarray
+        the completed matrices
+    """
+    matrices = np.asarray(matrices, dtype=float)
+    weights = get_weight_method(method)(matrices)
+
+    return np.where(
+        np.isnan(matrices), weights[..., :, None] / weights[..., None, :], matrices
+    )
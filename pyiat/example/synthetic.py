@@ -0,0 +1,131 @@
+import numpy as np
+import pandas as pd
+from typing import Union
+from pyiat.core.impact import Impact
+from pyiat.utils.constants import INDICATORS
+
+
+def synthetic_frame(
+    capitals: int = 3,
+    dimensions: int = 3,
+    indicators: int = 5,
+    seed: Union[int, np.random.Generator, None] = None,
+) -> pd.DataFrame:
+    """returns a random indicators table in the format of Impact.from_frame
+
+    Parameters
+    ----------
+    capitals : int, optional
+        number of capitals, by default 3
+    dimensions : int, optional
+        number of dimensions of every capital, by default 3
+    indicators : int, optional
+        number of indicators of every dimension, by default 5
+    seed : Union[int, np.random.Generator, None], optional
+        the seed or the generator of the random values, by default None
+
+    Returns
+    -------
+    pd.DataFrame
+        capital, dimension, indicator, type, unit, ex_ante, ex_post and
+        description columns
+    """
+    rng = np.random.default_rng(seed)
+    size = capitals * dimensions * indicators
+
+    cc, dd, ii = np.unravel_index(np.arange(size), (capitals, dimensions, indicators))
+
+    return pd.DataFrame(
+        {
+            "capital": [f"capital {c + 1}" for c in cc],
+            "dimension": [f"dimension {c + 1}.{d + 1}" for c, d in zip(cc, dd)],
+            "indicator": [
+                f"indicator {c + 1}.{d + 1}.{i + 1}" for c, d, i in zip(cc, dd, ii)
+            ],
+            "type": rng.choice(INDICATORS.type, size),
+            "unit": "-",
+            "ex_ante": rng.choice(INDICATORS.ex_ante, size),
+            "ex_post": rng.choice(INDICATORS.ex_post, size),
+            "description": None,
+        }
+    )
+
+
+def synthetic_judgments(
+    size: int,
+    noise: float = 0.0,
+    seed: Union[int, np.random.Generator, None] = None,
+) -> np.ndarray:
+    """returns the upper triangle judgments of a random pairwise matrix
+
+    the judgments are the ratios w_i / w_j of random weights, multiplied by a
+    lognormal error, so noise=0 gives a consistent matrix.
+
+    Parameters
+    ----------
+    size : int
+        number of compared items
+    noise : float, optional
+        the standard deviation of the log error of every judgment, by default 0.0
+    seed : Union[int, np.random.Generator, None], optional
+        the seed or the generator of the random values, by default None
+
+    Returns
+    -------
+    np.ndarray
+        array of shape (size*(size-1)/2,) in the order of get_weight_matrix
+    """
+    rng = np.random.default_rng(seed)
+    weights = rng.uniform(1, 9, size)
+
+    rows, cols = np.triu_indices(size, 1)
+    judgments = weights[rows] / weights[cols]
+
+    return judgments * np.exp(rng.normal(0, noise, len(judgments)))
+
+
+def synthetic_impact(
+    capitals: int = 3,
+    dimensions: int = 3,
+    indicators: int = 5,
+    noise: float = 0.0,
+    seed: Union[int, np.random.Generator, None] = None,
+    name: str = "synthetic",
+    compact: bool = False,
+) -> Impact:
+    """returns a random impact with all the weight matrices assigned
+
+    Parameters
+    ----------
+    capitals : int, optional
+        number of capitals, by default 3
+    dimensions : int, optional
+        number of dimensions of every capital, by default 3
+    indicators : int, optional
+        number of indicators of every dimension, by default 5
+    noise : float, optional
+        the log error of the judgments, 0 for consistent matrices, by default 0.0
+    seed : Union[int, np.random.Generator, None], optional
+        the seed or the generator of the random values, by default None
+    name : str, optional
+        the name of the impact, by default "synthetic"
+    compact : bool, optional
+        if True, the weight matrices are stored compact, by default False
+
+    Returns
+    -------
+    Impact
+        the impact
+    """
+    rng = np.random.default_rng(seed)
+
+    impact = Impact.from_frame(
+        synthetic_frame(capitals, dimensions, indicators, rng), name=name
+    )
+
+    for obj in impact._weighted_objects():
+        matrix = obj.get_weight_matrix()
+        matrix[:] = synthetic_judgments(len(obj), noise, rng)
+        obj.set_weight_matrix(matrix, compact=compact)
+
+    return impact
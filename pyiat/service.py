@@ -0,0 +1,492 @@
+"""a local HTTP/JSON scoring service
+
+the projects are loaded once and answer the requests from memory:
+
+    python -m pyiat.service --project Utopia pyiat/example/Project.xlsx pyiat/example
+
+GET  /projects                         the names of the projects
+GET  /projects/<name>/score            Impact.score
+GET  /projects/<name>/capitals_score   Impact.capitals_score
+GET  /projects/<name>/summary          Impact.summary as records
+POST /projects/<name>/what_if          the scores with other weights or rates
+
+the what-if body is a JSON object with any of
+
+    {
+        "capital_weight": {"<capital>": 0.5},
+        "indicator_weight": [{"capital": ..., "dimension": ..., "indicator": ..., "weight": 0.3}],
+        "rates": [{"capital": ..., "dimension": ..., "indicator": ..., "ex_ante": 2, "ex_post": 4}]
+    }
+
+the given weights are set and the other weights of the impact or of the
+dimension are scaled to keep the sum, as in CompiledImpact.what_if_capital.
+the concurrent what-if requests of a project are evaluated as one batch.
+
+the requests only read the projects, in worker threads. a project edited
+while the service runs, e.g. from a subscription callback, is updated in
+place under the lock of its compiled impact: the rates of the what-if
+queries are read consistently, but a batch evaluated during the edit may
+mix the old and new rates of the edited indicators.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+from http import HTTPStatus
+from typing import Dict, List, Union
+import numpy as np
+from pyiat.core.impact import Impact
+from pyiat.error_log.errors import InvalidInput, MissingData, WrongFormat
+from pyiat.utils.constants import INDICATORS
+from pyiat.utils.io import excel_parser
+from pyiat.utils.storage import load_project
+from pyiat.utils.tools import segment_sum
+
+PATH_COLUMNS = ["capital", "dimension", "indicator"]
+
+# the largest request body in bytes
+MAX_BODY = 2 ** 20
+
+
+def load(name: str, path: str, weights: Union[str, None] = None) -> Impact:
+    """loads a project from an excel file or a saved project directory
+
+    Parameters
+    ----------
+    name : str
+        the name of the impact
+    path : str
+        the excel file of the indicators, or a directory saved by save_project
+    weights : Union[str, None], optional
+        the directory of the weight matrices of an excel project, by default
+        the directory of the excel file
+
+    Returns
+    -------
+    Impact
+        the impact with its weight matrices
+    """
+    if os.path.isdir(path):
+        impact = load_project(path)
+        impact.name = name
+        return impact
+
+    impact = excel_parser(path, impact_name=name).impact
+    impact.parse_weight_matrices(weights or os.path.dirname(os.path.abspath(path)))
+
+    return impact
+
+
+def _rescale(
+    weights: np.ndarray, positions: np.ndarray, values: np.ndarray, segments: np.ndarray
+) -> np.ndarray:
+    """sets some weights and scales the other weights of their segments to keep the sums"""
+    if ((values < 0) | (values > 1)).any():
+        raise InvalidInput("weights should be between 0 and 1.")
+
+    output = weights.copy()
+    changed = np.zeros(len(weights), dtype=bool)
+    changed[positions] = True
+    output[positions] = values
+
+    size = segments.max() + 1
+    totals = segment_sum(weights, segments, size)
+    given = segment_sum(np.where(changed, output, 0), segments, size)
+    others = segment_sum(np.where(changed, 0, weights), segments, size)
+
+    if (given > totals + 1e-9).any():
+        raise InvalidInput("the given weights exceed the total weight of their level.")
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scale = np.where(others > 0, (totals - given) / others, 0)
+
+    output[~changed] *= scale[segments[~changed]]
+
+    return output
+
+
+class Batcher:
+    """coalesces the concurrent what-if queries of a project into batches
+
+    the queries arriving within max_delay seconds of the first one, up to
+    max_batch, are evaluated with one CompiledImpact.evaluate_batch call in a
+    worker thread.
+    """
+
+    def __init__(self, impact: Impact, max_batch: int = 256, max_delay: float = 0.002):
+        self.impact = impact
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.batches = 0
+        self._pending = []
+        self._timer = None
+
+    def query(self, body: Dict) -> tuple:
+        """parses a what-if body into weight and rate arrays
+
+        Parameters
+        ----------
+        body : Dict
+            the what-if request
+
+        Returns
+        -------
+        tuple
+            (capital_weight, indicator_weight, ex_ante, ex_post) arrays
+
+        Raises
+        ------
+        InvalidInput
+            if the items are not in the impact or the values are not valid
+        WrongFormat
+            if the body does not have the correct format
+        """
+        if not isinstance(body, dict):
+            raise WrongFormat("the what-if query should be a JSON object.")
+
+        unknown = set(body).difference(["capital_weight", "indicator_weight", "rates"])
+        if unknown:
+            raise WrongFormat(f"unknown what-if keys {sorted(unknown)}.")
+
+        compiled = self.impact.compile()
+        capital_weight = compiled.capital_weight
+        indicator_weight = compiled.indicator_weight
+        ex_ante, ex_post, _ = compiled.rates()
+
+        if body.get("capital_weight"):
+            weights = body["capital_weight"]
+            positions = [compiled._capital_position(capital) for capital in weights]
+            capital_weight = _rescale(
+                capital_weight,
+                np.array(positions),
+                np.array([*weights.values()], dtype=float),
+                np.zeros(len(capital_weight), dtype=np.intp),
+            )
+
+        if body.get("indicator_weight"):
+            rows = body["indicator_weight"]
+            indicator_weight = _rescale(
+                indicator_weight,
+                self._positions(compiled, rows),
+                np.array([row["weight"] for row in rows], dtype=float),
+                compiled.indicator_dimension,
+            )
+
+        if body.get("rates"):
+            rows = body["rates"]
+            positions = self._positions(compiled, rows)
+            for state, rates in [("ex_ante", ex_ante), ("ex_post", ex_post)]:
+                values = [
+                    row.get(state, rates[position]) for row, position in zip(rows, positions)
+                ]
+                if not np.isin(values, INDICATORS[state]).all():
+                    raise InvalidInput(f"Valid inputs for {state} are {INDICATORS[state]}")
+                rates[positions] = values
+
+        return capital_weight, indicator_weight, ex_ante, ex_post
+
+    @staticmethod
+    def _positions(compiled, rows: List[Dict]) -> np.ndarray:
+        """the compiled positions of (capital, dimension, indicator) rows"""
+        try:
+            paths = [tuple(row[column] for column in PATH_COLUMNS) for row in rows]
+        except (KeyError, TypeError):
+            raise WrongFormat(f"the indicators should be objects with {PATH_COLUMNS} keys.")
+
+        positions = compiled.indicator_index.get_indexer(paths)
+        if (positions == -1).any():
+            unknown = [path for path, position in zip(paths, positions) if position == -1]
+            raise InvalidInput(f"indicators not found in the impact: {unknown}")
+
+        return positions
+
+    def evaluate(self, queries: List[tuple]) -> List[Dict]:
+        """scores a batch of parsed queries
+
+        Parameters
+        ----------
+        queries : List[tuple]
+            the outputs of query
+
+        Returns
+        -------
+        List[Dict]
+            the impact and capital scores of every query
+        """
+        compiled = self.impact.compile()
+        impact, capitals = compiled.evaluate_batch(*map(np.stack, zip(*queries)))
+        self.batches += 1
+
+        return [
+            {
+                "score": dict(zip(["ex_ante", "ex_post"], values.tolist())),
+                "capitals_score": {
+                    capital: dict(zip(["ex_ante", "ex_post"], scores.tolist()))
+                    for capital, scores in zip(compiled.capitals, capital_values.T)
+                },
+            }
+            for values, capital_values in zip(impact, capitals)
+        ]
+
+    async def submit(self, body: Dict) -> Dict:
+        """queues a what-if query and waits for the result of its batch
+
+        Parameters
+        ----------
+        body : Dict
+            the what-if request
+
+        Returns
+        -------
+        Dict
+            the impact and capital scores
+        """
+        query = self.query(body)
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((query, future))
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.max_delay, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            asyncio.ensure_future(self._run(batch))
+
+    async def _run(self, batch: List[tuple]) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(
+                None, self.evaluate, [query for query, _ in batch]
+            )
+        except Exception as error:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+class ScoringService:
+    """answers the score, summary and what-if requests of loaded projects"""
+
+    def __init__(
+        self, projects: Dict[str, Impact], max_batch: int = 256, max_delay: float = 0.002
+    ):
+        """creates the service
+
+        Parameters
+        ----------
+        projects : Dict[str, Impact]
+            the impacts by name, with all the weight matrices assigned
+        max_batch : int, optional
+            the largest batch of what-if queries, by default 256
+        max_delay : float, optional
+            the seconds a what-if query waits for others, by default 0.002
+        """
+        self.projects = projects
+        self.batchers = {
+            name: Batcher(impact, max_batch, max_delay) for name, impact in projects.items()
+        }
+
+        # the compiled impacts are built once, not by the first requests
+        for impact in projects.values():
+            impact.compile()
+
+    @staticmethod
+    def _states(frame) -> Dict:
+        return {
+            column: dict(zip(frame.index, frame[column].astype(float).tolist()))
+            for column in frame.columns
+        }
+
+    def _read(self, name: str, view: str) -> Union[Dict, List]:
+        impact = self.projects[name]
+
+        if view == "score":
+            return self._states(impact.score)["Impact"]
+
+        if view == "capitals_score":
+            return self._states(impact.capitals_score)
+
+        summary = impact.summary.reset_index()
+        return json.loads(summary.to_json(orient="records"))
+
+    async def handle(self, method: str, path: str, body: bytes) -> tuple:
+        """answers a request
+
+        Parameters
+        ----------
+        method : str
+            the HTTP method
+        path : str
+            the path of the request
+        body : bytes
+            the body of the request
+
+        Returns
+        -------
+        tuple
+            (HTTPStatus, JSON serializable payload)
+        """
+        parts = [part for part in path.split("?")[0].split("/") if part]
+
+        try:
+            if parts == ["projects"] and method == "GET":
+                return HTTPStatus.OK, {"projects": [*self.projects]}
+
+            if len(parts) != 3 or parts[0] != "projects":
+                return HTTPStatus.NOT_FOUND, {"error": f"unknown path {path}"}
+
+            _, name, view = parts
+            if name not in self.projects:
+                return HTTPStatus.NOT_FOUND, {"error": f"unknown project {name}"}
+
+            if view in ("score", "capitals_score", "summary"):
+                if method != "GET":
+                    return HTTPStatus.METHOD_NOT_ALLOWED, {"error": "use GET"}
+
+                loop = asyncio.get_running_loop()
+                return HTTPStatus.OK, await loop.run_in_executor(None, self._read, name, view)
+
+            if view == "what_if":
+                if method != "POST":
+                    return HTTPStatus.METHOD_NOT_ALLOWED, {"error": "use POST"}
+
+                return HTTPStatus.OK, await self.batchers[name].submit(json.loads(body or b"{}"))
+
+            return HTTPStatus.NOT_FOUND, {"error": f"unknown path {path}"}
+
+        except (InvalidInput, WrongFormat, MissingData, ValueError) as error:
+            return HTTPStatus.BAD_REQUEST, {"error": str(error)}
+
+        except (KeyError, TypeError, AttributeError) as error:
+            return HTTPStatus.BAD_REQUEST, {"error": f"invalid what-if query: {error!r}"}
+
+    async def _connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """serves the requests of a keep-alive connection"""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+
+                method, path, version = line.decode("latin-1").split()
+                headers = {}
+                while True:
+                    header = await reader.readline()
+                    if header in (b"\r\n", b"\n", b""):
+                        break
+                    key, _, value = header.decode("latin-1").partition(":")
+                    headers[key.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length", 0))
+                if length > MAX_BODY:
+                    status, payload = HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "too large"}
+                    close = True
+                else:
+                    body = await reader.readexactly(length) if length else b""
+                    status, payload = await self.handle(method, path, body)
+                    close = headers.get("connection", "").lower() == "close" or (
+                        version == "HTTP/1.0"
+                        and headers.get("connection", "").lower() != "keep-alive"
+                    )
+
+                content = json.dumps(payload).encode()
+                writer.write(
+                    (
+                        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                        "Content-Type: application/json\r\n"
+                        f"Content-Length: {len(content)}\r\n"
+                        f"Connection: {'close' if close else 'keep-alive'}\r\n\r\n"
+                    ).encode("latin-1")
+                    + content
+                )
+                await writer.drain()
+
+                if close:
+                    break
+
+        except (ValueError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+
+        finally:
+            writer.close()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8000) -> asyncio.AbstractServer:
+        """starts listening
+
+        Parameters
+        ----------
+        host : str, optional
+            the host, by default "127.0.0.1"
+        port : int, optional
+            the port, 0 for any free port, by default 8000
+
+        Returns
+        -------
+        asyncio.AbstractServer
+            the server
+        """
+        return await asyncio.start_server(self._connection, host, port)
+
+
+async def serve(service: ScoringService, host: str = "127.0.0.1", port: int = 8000) -> None:
+    """runs the service until it is cancelled"""
+    server = await service.start(host, port)
+    for socket in server.sockets:
+        print(f"serving on http://{socket.getsockname()[0]}:{socket.getsockname()[1]}")
+
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv: Union[List[str], None] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m pyiat.service", description="serves the scores of pyiat projects"
+    )
+    parser.add_argument(
+        "--project",
+        nargs="+",
+        action="append",
+        required=True,
+        metavar="ARG",
+        help="the name and the excel file or saved directory of a project, "
+        "and optionally the directory of its weight matrices",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--max-batch", type=int, default=256)
+    parser.add_argument("--max-delay", type=float, default=0.002)
+    args = parser.parse_args(argv)
+
+    projects = {}
+    for project in args.project:
+        if len(project) not in (2, 3):
+            parser.error("--project takes NAME PATH [WEIGHTS]")
+        projects[project[0]] = load(*project)
+
+    service = ScoringService(projects, args.max_batch, args.max_delay)
+
+    try:
+        asyncio.run(serve(service, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -16,6 +16,7 @@ EFFECT = Constant(
             -4: "Extremely Negative",
             -3: "Highly Negative",
             -2: "Negative",
+            -1: "Slightly Negative",
             0: "Neutral",
             1: "Slightly Positive",
             2: "Positive",
@@ -26,6 +27,7 @@ EFFECT = Constant(
             4: "Extremely Negative",
             3: "Highly Negative",
             2: "Negative",
+            1: "Slightly Negative",
             0: "Neutral",
             -1: "Slightly Positive",
             -2: "Positive",
@@ -0,0 +1,177 @@
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+from collections import namedtuple
+from typing import Callable, Dict, Union
+import pandas as pd
+
+Event = namedtuple("Event", ["name", "start", "duration", "thread"])
+
+# the active stats objects. instrumentation is a single truthiness check
+# while the list is empty.
+_ACTIVE = []
+
+
+class Stats:
+    """the timings collected by profile
+
+    every instrumented call or timed block is recorded as an Event with its
+    start and duration in seconds (time.perf_counter) and its thread.
+    """
+
+    def __init__(self):
+        self.events = []
+        self.origin = time.perf_counter()
+
+    def __len__(self):
+        return len(self.events)
+
+    def record(self, name: str, start: float, duration: float) -> None:
+        self.events.append(Event(name, start, duration, threading.get_ident()))
+
+    @property
+    def counters(self) -> Dict[str, int]:
+        """the number of calls of every instrumented name"""
+        counters = {}
+        for event in self.events:
+            counters[event.name] = counters.get(event.name, 0) + 1
+
+        return counters
+
+    def report(self) -> pd.DataFrame:
+        """returns the flat report of the timings
+
+        the times of nested calls are also included in the times of their
+        callers, e.g. Dimension.score in Capital.score.
+
+        Returns
+        -------
+        pd.DataFrame
+            indexed by name with Calls, Total, Mean and Max columns in seconds,
+            sorted by Total
+        """
+        frame = pd.DataFrame(self.events, columns=Event._fields)
+        report = frame.groupby("name")["duration"].agg(["count", "sum", "mean", "max"])
+        report.columns = ["Calls", "Total", "Mean", "Max"]
+        report.index.name = "Name"
+
+        return report.sort_values("Total", ascending=False)
+
+    def to_chrome_trace(self, path: Union[str, None] = None) -> Union[None, Dict]:
+        """exports the events in the Chrome trace event format
+
+        the file can be opened in chrome://tracing or https://ui.perfetto.dev
+
+        Parameters
+        ----------
+        path : Union[str, None], optional
+            the path of the json file, if None the trace is returned, by default None
+
+        Returns
+        -------
+        Union[None, Dict]
+            the trace if path is None
+        """
+        pid = os.getpid()
+        trace = {
+            "traceEvents": [
+                {
+                    "name": event.name,
+                    "cat": "pyiat",
+                    "ph": "X",
+                    "ts": (event.start - self.origin) * 1e6,
+                    "dur": event.duration * 1e6,
+                    "pid": pid,
+                    "tid": event.thread,
+                }
+                for event in self.events
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+        if path is None:
+            return trace
+
+        with open(path, "w") as file:
+            json.dump(trace, file)
+
+
+@contextlib.contextmanager
+def profile():
+    """collects the timings of the instrumented pyiat calls
+
+    Examples
+    --------
+    >>> with profile() as stats:
+    ...     impact.summary
+    >>> stats.report()
+
+    Yields
+    ------
+    Stats
+        the collected timings
+    """
+    stats = Stats()
+    _ACTIVE.append(stats)
+    try:
+        yield stats
+    finally:
+        _ACTIVE.remove(stats)
+
+
+def _record(name: str, start: float) -> None:
+    duration = time.perf_counter() - start
+    for stats in _ACTIVE:
+        stats.record(name, start, duration)
+
+
+@contextlib.contextmanager
+def timed(name: str):
+    """times a block of code if profiling is active
+
+    Parameters
+    ----------
+    name : str
+        the name of the block in the report
+    """
+    if not _ACTIVE:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record(name, start)
+
+
+def instrumented(func: Union[Callable, None] = None, name: Union[str, None] = None):
+    """times every call of a function if profiling is active
+
+    Parameters
+    ----------
+    func : Callable
+        the function
+    name : Union[str, None], optional
+        the name in the report, by default the qualified name of the function
+    """
+    if func is None:
+        return functools.partial(instrumented, name=name)
+
+    label = name or func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _ACTIVE:
+            return func(*args, **kwargs)
+
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _record(label, start)
+
+    return wrapper
@@ -0,0 +1,261 @@
+import json
+import os
+import numpy as np
+import pandas as pd
+from pyiat.core.impact import Impact, IndicatorTable
+from pyiat.core.compiled import CompiledImpact
+from pyiat.error_log.errors import MissingData, WrongFormat
+from pyiat.utils.constants import NEGATIVE, POSITIVE
+from pyiat.utils.tools import reciprocal_matrix
+
+FORMAT_VERSION = 1
+
+ARRAYS = [
+    "dimension_capital",
+    "indicator_dimension",
+    "ex_ante",
+    "ex_post",
+    "positive",
+    "capital_weight",
+    "dimension_weight",
+    "indicator_weight",
+    "judgments",
+    "judgment_offsets",
+]
+
+
+def save_project(impact: Impact, path: str) -> None:
+    """saves an impact into a directory of columnar numpy arrays
+
+    the hierarchy, the indicator rates and all the weight matrices (as upper
+    triangle judgments) are stored as .npy files and the names, units and
+    descriptions in a meta.json file. the derived weights are stored as well,
+    so load_compiled does not need to recompute them.
+
+    Parameters
+    ----------
+    impact : Impact
+        the impact to be saved
+    path : str
+        the directory of the project, created if it does not exist
+    """
+    os.makedirs(path, exist_ok=True)
+
+    capitals = [*impact._capitals.values()]
+    dimensions = [dd for cc in capitals for dd in cc._dimensions.values()]
+    indicators = [ii for dd in dimensions for ii in dd._indicators.values()]
+
+    try:
+        compiled = impact.compile()
+        weights = {
+            "capital_weight": compiled.capital_weight,
+            "dimension_weight": compiled.dimension_weight,
+            "indicator_weight": compiled.indicator_weight,
+        }
+    except MissingData:
+        weights = {
+            "capital_weight": np.full(len(capitals), np.nan),
+            "dimension_weight": np.full(len(dimensions), np.nan),
+            "indicator_weight": np.full(len(indicators), np.nan),
+        }
+
+    objects = list(impact._weighted_objects())
+    judgments, offsets = [], [0]
+    for obj in objects:
+        if obj.weight_assigned:
+            judgments.append(obj.judgments)
+            offsets.append(offsets[-1] + len(judgments[-1]))
+        else:
+            offsets.append(offsets[-1])
+
+    arrays = {
+        "dimension_capital": np.repeat(
+            np.arange(len(capitals), dtype=np.int64), [len(cc) for cc in capitals]
+        ),
+        "indicator_dimension": np.repeat(
+            np.arange(len(dimensions), dtype=np.int64), [len(dd) for dd in dimensions]
+        ),
+        "ex_ante": np.array([ii.ex_ante for ii in indicators], dtype=float),
+        "ex_post": np.array([ii.ex_post for ii in indicators], dtype=float),
+        "positive": np.array([ii.type == POSITIVE for ii in indicators], dtype=bool),
+        "judgments": np.concatenate(judgments) if judgments else np.empty(0),
+        "judgment_offsets": np.array(offsets, dtype=np.int64),
+        **weights,
+    }
+
+    for name, array in arrays.items():
+        np.save(f"{path}/{name}.npy", np.asarray(array))
+
+    meta = {
+        "version": FORMAT_VERSION,
+        "impact": {"name": impact.name, "description": impact.description},
+        "capitals": [cc.name for cc in capitals],
+        "capital_descriptions": [cc.description for cc in capitals],
+        "dimensions": [dd.name for dd in dimensions],
+        "dimension_descriptions": [dd.description for dd in dimensions],
+        "indicators": [ii.name for ii in indicators],
+        "units": [ii.unit for ii in indicators],
+        "indicator_descriptions": [_json_value(ii.description) for ii in indicators],
+        "weight_assigned": [obj.weight_assigned for obj in objects],
+        "weight_methods": [obj.weight_method for obj in objects],
+        "compact": [obj._compact is not None for obj in objects],
+        "indicator_table": any(
+            isinstance(dd._indicators, IndicatorTable) for dd in dimensions
+        ),
+    }
+
+    with open(f"{path}/meta.json", "w") as file:
+        json.dump(meta, file)
+
+
+def _json_value(value):
+    """replaces the nan values of excel files with None"""
+    if isinstance(value, float) and np.isnan(value):
+        return None
+
+    return value
+
+
+def _read(path: str, mmap: bool) -> tuple:
+    """reads the meta data and the arrays of a saved project"""
+    try:
+        with open(f"{path}/meta.json") as file:
+            meta = json.load(file)
+    except FileNotFoundError:
+        raise WrongFormat(f"'{path}' is not a saved project directory.")
+
+    if meta["version"] != FORMAT_VERSION:
+        raise WrongFormat(f"project format version {meta['version']} is not supported.")
+
+    arrays = {
+        name: np.load(f"{path}/{name}.npy", mmap_mode="c" if mmap else None)
+        for name in ARRAYS
+    }
+
+    return meta, arrays
+
+
+def load_compiled(path: str, mmap: bool = True) -> CompiledImpact:
+    """loads a saved project directly as a CompiledImpact
+
+    with mmap the arrays are memory-mapped copy-on-write, so opening the
+    project does not read the data and worker processes share the pages of
+    the files until they change a rate.
+
+    Parameters
+    ----------
+    path : str
+        the directory of the project
+    mmap : bool, optional
+        if True, the arrays are memory-mapped, by default True
+
+    Returns
+    -------
+    CompiledImpact
+        the compiled impact
+
+    Raises
+    ------
+    MissingData
+        if the project was saved without all the weights
+    """
+    meta, arrays = _read(path, mmap)
+
+    if np.isnan(arrays["capital_weight"]).any() or np.isnan(
+        arrays["indicator_weight"]
+    ).any():
+        raise MissingData(f"the project '{path}' was saved without all the weights.")
+
+    return CompiledImpact(
+        name=meta["impact"]["name"],
+        capitals=meta["capitals"],
+        dimensions=meta["dimensions"],
+        indicators=meta["indicators"],
+        **{
+            name: arrays[name]
+            for name in ARRAYS
+            if name not in ["judgments", "judgment_offsets"]
+        },
+    )
+
+
+def load_project(path: str, mmap: bool = True) -> Impact:
+    """loads a saved project as an Impact
+
+    the judgments are assigned as they were saved, compact or dense, without
+    validating them again, and the dimensions keep their indicators in
+    IndicatorTable objects if they were saved so.
+
+    Parameters
+    ----------
+    path : str
+        the directory of the project
+    mmap : bool, optional
+        if True, the arrays are memory-mapped while building the objects, by default True
+
+    Returns
+    -------
+    Impact
+        the impact with its indicators and weight matrices
+    """
+    meta, arrays = _read(path, mmap)
+
+    dimension_capital = np.asarray(arrays["dimension_capital"])
+    indicator_dimension = np.asarray(arrays["indicator_dimension"])
+
+    capitals = np.asarray(meta["capitals"], dtype=object)
+    dimensions = np.asarray(meta["dimensions"], dtype=object)
+
+    frame = pd.DataFrame(
+        {
+            "capital": capitals[dimension_capital[indicator_dimension]],
+            "dimension": dimensions[indicator_dimension],
+            "indicator": meta["indicators"],
+            "type": np.where(arrays["positive"], POSITIVE, NEGATIVE),
+            "unit": meta["units"],
+            "ex_ante": np.asarray(arrays["ex_ante"]).astype(int),
+            "ex_post": np.asarray(arrays["ex_post"]).astype(int),
+            "description": meta["indicator_descriptions"],
+        }
+    )
+
+    impact = Impact.from_frame(
+        frame,
+        name=meta["impact"]["name"],
+        indicator_table=meta.get("indicator_table", False),
+    )
+    impact.description = meta["impact"]["description"]
+
+    for capital, description in zip(impact._capitals.values(), meta["capital_descriptions"]):
+        capital.description = description
+
+    dimension_objects = [
+        dd for cc in impact._capitals.values() for dd in cc._dimensions.values()
+    ]
+    for dimension, description in zip(dimension_objects, meta["dimension_descriptions"]):
+        dimension.description = description
+
+    # projects saved before the compact flags are loaded dense
+    objects = list(impact._weighted_objects())
+    compact = meta.get("compact", [False] * len(objects))
+
+    judgments = np.asarray(arrays["judgments"], dtype=float)
+    offsets = np.asarray(arrays["judgment_offsets"])
+    for position, obj in enumerate(objects):
+        if meta["weight_methods"][position] is not None:
+            obj.weight_method = meta["weight_methods"][position]
+
+        if not meta["weight_assigned"][position]:
+            continue
+
+        # the judgments were validated when they were saved
+        values = judgments[offsets[position] : offsets[position + 1]]
+        if compact[position]:
+            obj._set_compact(values)
+        else:
+            items = obj.pairwised_items
+            obj.weight_matrix = pd.DataFrame(
+                reciprocal_matrix(values, len(items)), index=items, columns=items
+            )
+
+    return impact
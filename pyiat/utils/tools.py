@@ -1,3 +1,4 @@
+import itertools
 from math import ceil
 import pandas as pd
 import numpy as np
@@ -17,13 +18,8 @@ def get_combination(array: List) -> List:
     List
         dual combination of items
     """
-    combination = []
-    for a in array:
-        for b in array:
-            if a != b and (a, b) not in combination and (b, a) not in combination:
-                combination.append((a, b))
-
-    return combination
+    # the pairs of the upper triangle, in the order of np.triu_indices
+    return list(itertools.combinations(dict.fromkeys(array), 2))
 
 
 # def reverse_series(series: pd.Series) -> pd.Series:
@@ -58,12 +54,137 @@ def geometric_mean(frame: pd.DataFrame) -> pd.Series:
     pd.Series
         geometric mean of rows
     """
-    geo_mean = pd.Series(index=frame.index, dtype=float)
+    return pd.Series(
+        np.exp(np.log(frame.to_numpy(dtype=float)).mean(axis=1)),
+        index=frame.index,
+        dtype=float,
+    )
+
+
+def reciprocal_matrix(upper: np.ndarray, size: int) -> np.ndarray:
+    """builds reciprocal pairwise matrices from their upper triangle values
+
+    Parameters
+    ----------
+    upper : np.ndarray
+        array of shape (..., size*(size-1)/2) with the upper triangle judgments in
+        the order of np.triu_indices(size, 1)
+    size : int
+        the number of compared items
+
+    Returns
+    -------
+    np.ndarray
+        array of shape (..., size, size) with ones on the diagonal and
+        reciprocal values in the lower triangle
+    """
+    upper = np.asarray(upper, dtype=float)
+    rows, cols = np.triu_indices(size, 1)
+
+    matrix = np.ones(upper.shape[:-1] + (size, size))
+    matrix[..., rows, cols] = upper
+    matrix[..., cols, rows] = 1 / upper
+
+    return matrix
+
+
+def geometric_mean_weights(matrices: np.ndarray) -> np.ndarray:
+    """returns the normalized row geometric means of a stack of matrices
+
+    Parameters
+    ----------
+    matrices : np.ndarray
+        array of shape (..., n, n)
+
+    Returns
+    -------
+    np.ndarray
+        array of shape (..., n) with weights summing to 1 on the last axis
+    """
+    geo_mean = np.exp(np.log(matrices).mean(axis=-1))
+
+    return geo_mean / geo_mean.sum(axis=-1, keepdims=True)
+
+
+def principal_eigen(
+    matrices: np.ndarray, tol: float = 1e-12, max_iter: int = 1000
+) -> Tuple[np.ndarray, np.ndarray]:
+    """returns the principal eigenvalue and eigenvector of a stack of positive matrices
+
+    the eigenpairs are found with a batched power iteration, which converges for
+    the positive reciprocal matrices of pairwise comparisons. the matrices
+    which do not converge in max_iter iterations are solved with np.linalg.eig.
+
+    Parameters
+    ----------
+    matrices : np.ndarray
+        array of shape (..., n, n)
+    tol : float, optional
+        the convergence tolerance on the eigenvector, by default 1e-12
+    max_iter : int, optional
+        maximum number of iterations, by default 1000
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        eigenvalues of shape (...,) and eigenvectors of shape (..., n) summing to 1
+    """
+    matrices = np.asarray(matrices, dtype=float)
+    vector = np.full(matrices.shape[:-1], 1 / matrices.shape[-1])
+    converged = np.zeros(matrices.shape[:-2], dtype=bool)
+
+    for _ in range(max_iter):
+        product = np.einsum("...ij,...j->...i", matrices, vector)
+        new = product / product.sum(axis=-1, keepdims=True)
+        converged = np.abs(new - vector).max(axis=-1, initial=0) < tol
+        vector = new
+        if converged.all():
+            break
+
+    product = np.einsum("...ij,...j->...i", matrices, vector)
+    value = np.asarray((product / vector).mean(axis=-1))
+
+    # matrices with missing values can not converge either way
+    failed = ~converged & np.isfinite(matrices).all(axis=(-2, -1))
+    if failed.any():
+        values, vectors = np.linalg.eig(matrices[failed])
+        principal = values.real.argmax(axis=-1)
+        fallback = np.abs(
+            np.take_along_axis(vectors.real, principal[..., None, None], axis=-1)[..., 0]
+        )
+        vector[failed] = fallback / fallback.sum(axis=-1, keepdims=True)
+        value[failed] = values.real.max(axis=-1)
+
+    return value[()], vector
+
+
+def segment_sum(values: np.ndarray, segments: np.ndarray, size: int) -> np.ndarray:
+    """sums the last axis of values into segments
+
+    Parameters
+    ----------
+    values : np.ndarray
+        array of shape (..., n) to be reduced
+    segments : np.ndarray
+        int array of shape (n,) with the segment index of each value
+    size : int
+        number of segments
+
+    Returns
+    -------
+    np.ndarray
+        array of shape (..., size) with the sum of each segment. empty segments are 0.
+    """
+    values = np.asarray(values, dtype=float)
+    lead = values.shape[:-1]
+    flat = values.reshape(-1, values.shape[-1])
 
-    for row, vals in frame.iterrows():
-        geo_mean.loc[row] = np.exp(np.log(vals).mean())
+    offsets = (np.arange(flat.shape[0]) * size)[:, None] + segments
+    output = np.bincount(
+        offsets.ravel(), weights=flat.ravel(), minlength=flat.shape[0] * size
+    )
 
-    return geo_mean
+    return output.reshape(*lead, size)
 
 
 def evaluation_guide(item) -> pd.DataFrame:
@@ -0,0 +1,19 @@
+import os
+import sys
+
+pyiat_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.append(pyiat_path)
+
+example_path = f"{pyiat_path}/pyiat/example"
+
+import pytest
+from pyiat.utils.io import excel_parser
+
+
+@pytest.fixture
+def ExampleImpact():
+
+    impact = excel_parser(f"{example_path}/Project.xlsx", impact_name="Utopia").impact
+    impact.parse_weight_matrices(example_path)
+
+    return impact
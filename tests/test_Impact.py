@@ -0,0 +1,372 @@
+import os
+import sys
+
+pyiat_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.append(pyiat_path)
+
+import pytest
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+from pyiat.core.compiled import CompiledImpact
+from pyiat.core.impact import effect
+from pyiat.core.weights import set_default_weight_method
+from pyiat.utils.constants import EFFECT, INDICATORS, POSITIVE
+from pyiat.error_log.errors import InvalidInput, WrongFormat
+
+
+def test_compile(ExampleImpact):
+
+    compiled = ExampleImpact.compile()
+
+    assert isinstance(compiled, CompiledImpact)
+    assert compiled.capitals == ExampleImpact.capitals
+    assert len(compiled) == 28
+    assert len(compiled.dimensions) == 14
+
+    np.testing.assert_allclose(compiled.capital_weight.sum(), 1)
+
+
+def test_compiled_scores(ExampleImpact):
+
+    compiled = ExampleImpact.compile()
+
+    # the scores of the tree objects are the reference of the compiled ones
+    capitals_score = pd.concat([capital.score for _, capital in ExampleImpact], axis=1)
+    score = (capitals_score @ ExampleImpact.calc_weight()).to_frame("Impact")
+
+    pdt.assert_frame_equal(ExampleImpact.score, score)
+    pdt.assert_frame_equal(ExampleImpact.capitals_score, capitals_score)
+
+    for name, capital in ExampleImpact:
+        pdt.assert_frame_equal(
+            capital.dimensions_score,
+            compiled.dimensions_score[name],
+            check_dtype=False,
+            check_names=False,
+        )
+
+
+def test_score_scenarios(ExampleImpact):
+
+    compiled = ExampleImpact.compile()
+    ex_ante = np.vstack([compiled.ex_ante, np.full(len(compiled), 3)])
+    ex_post = np.vstack([compiled.ex_post, np.full(len(compiled), 5)])
+
+    output = ExampleImpact.score_scenarios(ex_ante, ex_post, scenarios=["base", "alt"])
+
+    pdt.assert_frame_equal(
+        output.score.loc["base"], ExampleImpact.score, check_dtype=False, check_names=False
+    )
+    pdt.assert_frame_equal(
+        output.capitals_score.loc["base"],
+        ExampleImpact.capitals_score,
+        check_dtype=False,
+        check_names=False,
+    )
+
+    # changing the rates of the indicator objects and scoring again
+    for _, capital in ExampleImpact:
+        for _, dimension in capital:
+            for _, indicator in dimension:
+                indicator.ex_ante = 3
+                indicator.ex_post = 5
+
+    pdt.assert_frame_equal(
+        output.score.loc["alt"], ExampleImpact.score, check_dtype=False, check_names=False
+    )
+
+
+def test_score_scenarios_long_format(ExampleImpact):
+
+    frame = ExampleImpact.compile().indicator_index.to_frame(index=False)
+    frame.columns = ["capital", "dimension", "indicator"]
+    frame["scenario"] = "all equal"
+    frame["ex_ante"] = 2
+    frame["ex_post"] = 2
+
+    output = ExampleImpact.score_scenarios(frame.iloc[:-1])
+
+    # the last indicator keeps its original rates
+    assert (output.dimensions_score.iloc[:, :-1] == 0.5).all().all()
+    assert output.dimensions_score.iloc[:, -1].tolist() != [0.5, 0.5]
+
+    # an indicator can not be rated twice in a scenario
+    with pytest.raises(WrongFormat):
+        ExampleImpact.score_scenarios(pd.concat([frame, frame.iloc[[0]]]))
+
+    with pytest.raises(InvalidInput):
+        frame.loc[0, "ex_post"] = 7
+        ExampleImpact.score_scenarios(frame)
+
+
+def test_memoized_scores(ExampleImpact):
+
+    score = ExampleImpact.score
+    assert ("score",) in ExampleImpact._cache
+    pdt.assert_frame_equal(score, ExampleImpact.score)
+
+    # the returned frames are copies of the cache
+    score.iloc[0, 0] = 100
+    assert ExampleImpact.score.iloc[0, 0] != 100
+
+    capital = ExampleImpact._capitals["Natural Capital"]
+    dimension = capital._dimensions["Water"]
+    indicator = [*dimension._indicators.values()][0]
+
+    capital.score
+    indicator.ex_post = 1 if indicator.ex_post != 1 else 2
+
+    # only the ancestors are invalidated, the compiled impact is updated
+    assert [*ExampleImpact._cache] == [("compile",)]
+    assert not capital._cache
+    assert ExampleImpact._capitals["Human Capital"]._cache
+
+    pdt.assert_frame_equal(
+        ExampleImpact.score, ExampleImpact.compile().score, check_dtype=False
+    )
+
+    weight_matrix = dimension.get_weight_matrix()
+    weight_matrix[:] = 5
+    before = ExampleImpact.capitals_score
+    dimension.set_weight_matrix(weight_matrix)
+    assert not before.equals(ExampleImpact.capitals_score)
+
+
+def test_copy_invalidation(ExampleImpact):
+
+    ExampleImpact.score
+    impact = ExampleImpact.copy()
+    impact.score
+
+    dimension = impact._capitals["Natural Capital"]._dimensions["Water"]
+    indicator = [*dimension._indicators.values()][0]
+    indicator.ex_ante = 1 if indicator.ex_ante != 1 else 2
+
+    assert [*impact._cache] == [("compile",)]
+    assert ("score",) in ExampleImpact._cache
+
+
+def test_incremental_rescoring(ExampleImpact):
+
+    changes = []
+    ExampleImpact.subscribe(changes.append)
+    compiled = ExampleImpact.compile()
+
+    dimension = ExampleImpact._capitals["Human Capital"]._dimensions["Health Status"]
+    indicator = [*dimension._indicators.values()][1]
+
+    indicator.ex_post = 5
+    indicator.type = "positive"
+
+    assert len(changes) == 2
+    assert changes[-1].indicator is indicator
+    # the compiled impact is updated, not recompiled
+    assert ExampleImpact.compile() is compiled
+
+    np.testing.assert_allclose(
+        changes[-1].after, ExampleImpact.score["Impact"].to_numpy(dtype=float)
+    )
+    pdt.assert_frame_equal(
+        compiled.capitals_score, ExampleImpact.capitals_score, check_dtype=False
+    )
+
+    ExampleImpact.unsubscribe(changes.append)
+    indicator.ex_ante = 5
+    assert len(changes) == 2
+
+
+def test_subscriptions_after_weight_changes(ExampleImpact):
+
+    changes = []
+    ExampleImpact.subscribe(changes.append)
+
+    # a new weight matrix rescores the impact
+    matrix = ExampleImpact.get_weight_matrix()
+    matrix[:] = 2
+    ExampleImpact.set_weight_matrix(matrix)
+
+    assert len(changes) == 1
+    assert changes[-1].indicator is None
+    np.testing.assert_allclose(
+        changes[-1].after, ExampleImpact.score["Impact"].to_numpy(dtype=float)
+    )
+
+    # the next indicator changes are still notified
+    dimension = ExampleImpact._capitals["Human Capital"]._dimensions["Health Status"]
+    indicator = [*dimension._indicators.values()][0]
+    for ex_post in [1, 5]:
+        indicator.ex_post = ex_post
+        ExampleImpact.score
+
+    assert len(changes) == 3
+    assert changes[-1].indicator is indicator
+    np.testing.assert_allclose(changes[-1].before, changes[-2].after)
+    np.testing.assert_allclose(
+        changes[-1].after, ExampleImpact.score["Impact"].to_numpy(dtype=float)
+    )
+
+
+def test_default_weight_method(ExampleImpact):
+
+    score = ExampleImpact.score
+    try:
+        # the cached scores follow the default weight method
+        set_default_weight_method("eigenvector")
+        assert not ExampleImpact.score.equals(score)
+        pdt.assert_frame_equal(
+            ExampleImpact.score, ExampleImpact.compile().score, check_dtype=False
+        )
+    finally:
+        set_default_weight_method("geometric_mean")
+
+    pdt.assert_frame_equal(ExampleImpact.score, score)
+
+
+def test_iteration(ExampleImpact):
+
+    # nested iterations over the same object are independent
+    pairs = [(outer, inner) for outer, _ in ExampleImpact for inner, _ in ExampleImpact]
+    assert pairs == [
+        (outer, inner) for outer in ExampleImpact.capitals for inner in ExampleImpact.capitals
+    ]
+
+    # the items are not copied
+    for name, capital in ExampleImpact:
+        assert capital is ExampleImpact._capitals[name]
+
+
+def test_effect_table():
+
+    for _type, effects in EFFECT.items():
+        for ex_ante in INDICATORS.ex_ante:
+            for ex_post in INDICATORS.ex_post:
+                assert (
+                    effect(ex_ante, ex_post, _type == POSITIVE)
+                    == effects[ex_post - ex_ante]
+                )
+
+
+def test_summary(ExampleImpact):
+
+    summary = ExampleImpact.summary
+    assert len(summary) == sum(
+        len(dimension) for _, capital in ExampleImpact for _, dimension in capital
+    )
+
+    # a one-step worsening has its own effect
+    water = summary.loc[("Natural Capital", "Water", "Amount of water depleted")]
+    assert water["Ex_post"] - water["Ex_ante"] == 1
+    assert water["Effect"] == "Slightly Negative"
+
+
+def test_summary_to_file(ExampleImpact, tmp_path):
+
+    path = f"{tmp_path}/summary.csv"
+    ExampleImpact.summary_to_file(path, chunksize=2)
+
+    summary = pd.read_csv(path).set_index(["Capital", "Dimension", "Indicator"])
+    pdt.assert_frame_equal(summary, ExampleImpact.summary)
+
+
+def test_summary_to_parquet(ExampleImpact, tmp_path):
+
+    pytest.importorskip("pyarrow")
+
+    path = f"{tmp_path}/summary.parquet"
+    ExampleImpact.summary_to_file(path, chunksize=2)
+
+    summary = pd.read_parquet(path).set_index(["Capital", "Dimension", "Indicator"])
+    pdt.assert_frame_equal(summary, ExampleImpact.summary, check_dtype=False)
+
+
+def test_weight_queries(ExampleImpact):
+
+    compiled = ExampleImpact.compile()
+    contributions = ExampleImpact.contributions
+    np.testing.assert_allclose(
+        contributions[["ex_ante", "ex_post"]].sum().to_numpy(),
+        ExampleImpact.score["Impact"].to_numpy(dtype=float),
+    )
+
+    # the current weights give the current score
+    scores = ExampleImpact.score_weights(
+        capital_weight=[compiled.capital_weight, compiled.capital_weight * 2],
+        indicator_weight=np.tile(compiled.indicator_weight, (2, 1)),
+        renormalize=True,
+    )
+    np.testing.assert_allclose(scores.to_numpy(), [compiled.impact_values()] * 2)
+
+    capital = compiled.capitals[0]
+    weights = compiled.capital_weight * (1 - 0.4) / (1 - compiled.capital_weight[0])
+    weights[0] = 0.4
+    np.testing.assert_allclose(
+        compiled.what_if_capital(capital, 0.4),
+        ExampleImpact.score_weights(capital_weight=[weights]).to_numpy()[0],
+    )
+
+    # an indicator query is a single weight change in the bulk queries
+    position = 1
+    dimension = compiled.indicator_dimension == compiled.indicator_dimension[position]
+    weights = compiled.indicator_weight.copy()
+    weights[dimension] *= (1 - 0.5) / (1 - weights[position])
+    weights[position] = 0.5
+    np.testing.assert_allclose(
+        compiled.what_if_indicator(position, 0.5),
+        ExampleImpact.score_weights(indicator_weight=[weights]).to_numpy()[0],
+    )
+
+    with pytest.raises(InvalidInput):
+        compiled.what_if_capital(capital, 2)
+
+    for position in [-1, len(compiled)]:
+        with pytest.raises(InvalidInput):
+            compiled.what_if_indicator(position, 0.5)
+
+
+def test_fork(ExampleImpact):
+
+    score = ExampleImpact.score
+    fork = ExampleImpact.fork()
+
+    # the fork shares the tree until an item is edited
+    for name, capital in fork:
+        assert capital is ExampleImpact._capitals[name]
+
+    water = ExampleImpact._capitals["Natural Capital"]._dimensions["Water"]
+    indicator = fork.edit("Natural Capital", "Water", water.indicators[0])
+    indicator.ex_post = 1 if indicator.ex_post != 1 else 2
+
+    pdt.assert_frame_equal(ExampleImpact.score, score)
+    assert not fork.score.equals(score)
+    pdt.assert_frame_equal(fork.score, fork.compile().score, check_dtype=False)
+
+    # only the path to the edited indicator is copied
+    assert fork._capitals["Natural Capital"] is not ExampleImpact._capitals["Natural Capital"]
+    assert fork._capitals["Human Capital"] is ExampleImpact._capitals["Human Capital"]
+    assert fork.edit("Natural Capital", "Water").weight_matrix is water.weight_matrix
+
+    dimension = fork.edit("Human Capital", "Health Status")
+    matrix = dimension.get_weight_matrix()
+    matrix[:] = 5
+    dimension.set_weight_matrix(matrix)
+    pdt.assert_frame_equal(ExampleImpact.score, score)
+
+    with pytest.raises(InvalidInput):
+        fork.edit("Natural Capital", "Unknown")
+
+
+def test_fork_indicator_table():
+
+    from pyiat.core.impact import Impact
+    from pyiat.example.synthetic import synthetic_frame
+
+    impact = Impact.from_frame(synthetic_frame(seed=0), indicator_table=True)
+    fork = impact.fork()
+
+    indicator = fork.edit("capital 1", "dimension 1.1", "indicator 1.1.1")
+    indicator.ex_ante = 1 if indicator.ex_ante != 1 else 2
+
+    table = impact._capitals["capital 1"]._dimensions["dimension 1.1"]._indicators
+    assert indicator.table is not table
+    assert table["indicator 1.1.1"].ex_ante != indicator.ex_ante
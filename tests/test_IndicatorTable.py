@@ -0,0 +1,104 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import pickle
+import pytest
+import numpy as np
+import pandas.testing as pdt
+from pyiat.core.impact import Impact, Indicator, IndicatorTable
+from pyiat.error_log.errors import InvalidInput, WrongFormat
+from pyiat.example.synthetic import synthetic_frame, synthetic_impact
+
+
+@pytest.fixture
+def DummyTable():
+
+    return IndicatorTable(
+        names=["a", "b", "c"],
+        types=["positive", "negative", "positive"],
+        units=["m3", "m3", "kWh"],
+        ex_ante=[1, 2, 5],
+        ex_post=[4, 2, 3],
+    )
+
+
+def test_table(DummyTable):
+
+    assert DummyTable.ex_ante.dtype == np.int8
+    assert list(DummyTable) == ["a", "b", "c"]
+    assert "b" in DummyTable and "d" not in DummyTable
+
+    indicators = [
+        Indicator(name=name, type=_type, unit="-", ex_ante=ex_ante, ex_post=ex_post)
+        for name, _type, ex_ante, ex_post in zip(
+            DummyTable, DummyTable.types, DummyTable.ex_ante, DummyTable.ex_post
+        )
+    ]
+    assert DummyTable.effect.tolist() == [ii.effect for ii in indicators]
+
+    normalized = DummyTable.normalized
+    for indicator in indicators:
+        assert normalized.loc["ex_ante", indicator.name] == indicator.normalized.ex_ante
+        assert normalized.loc["ex_post", indicator.name] == indicator.normalized.ex_post
+
+    with pytest.raises(InvalidInput):
+        IndicatorTable(["a"], ["dummy"], ["-"], [1], [2])
+
+    with pytest.raises(WrongFormat):
+        IndicatorTable(["a", "a"], ["positive"] * 2, ["-"] * 2, [1, 1], [2, 2])
+
+
+def test_views(DummyTable):
+
+    view = DummyTable["a"]
+    assert isinstance(view, Indicator)
+    assert view is DummyTable["a"]
+    assert (view.name, view.unit, view.ex_ante, view.effect) == ("a", "m3", 1, "Highly Positive")
+
+    view.ex_post = 2
+    assert DummyTable.ex_post[0] == 2
+    assert DummyTable.normalized.loc["ex_post", "a"] == 2 / 3
+
+    with pytest.raises(InvalidInput):
+        view.ex_ante = 10
+
+    DummyTable.set_rates(["b", "c"], ex_ante=[3, 4])
+    assert DummyTable["b"].ex_ante == 3
+
+    with pytest.raises(InvalidInput):
+        DummyTable.set_rates(ex_post=[1, 2, 9])
+    assert DummyTable.ex_post.tolist() == [2, 2, 3]
+
+
+def test_table_impact():
+
+    frame = synthetic_frame(capitals=2, dimensions=2, indicators=3, seed=0)
+    weights = synthetic_impact(capitals=2, dimensions=2, indicators=3, seed=0)
+
+    objects = Impact.from_frame(frame, name="synthetic")
+    tables = Impact.from_frame(frame, name="synthetic", indicator_table=True)
+    for impact in [objects, tables]:
+        impact.parse_weight_table(weights.weight_matrices_to_table())
+
+    pdt.assert_frame_equal(objects.score, tables.score)
+    pdt.assert_frame_equal(objects.summary, tables.summary)
+
+    # the changes through the views are applied incrementally
+    changes = []
+    tables.subscribe(changes.append)
+    for impact in [objects, tables]:
+        impact._capitals["capital 1"]._dimensions["dimension 1.2"]._indicators[
+            "indicator 1.2.3"
+        ].type = "positive"
+        impact._capitals["capital 1"]._dimensions["dimension 1.2"]._indicators[
+            "indicator 1.2.3"
+        ].ex_ante = 5
+
+    assert len(changes) == 2
+    np.testing.assert_allclose(changes[-1].after, objects.score.to_numpy(dtype=float)[:, 0])
+    pdt.assert_frame_equal(objects.score, tables.score)
+
+    restored = pickle.loads(pickle.dumps(tables))
+    pdt.assert_frame_equal(restored.score, tables.score)
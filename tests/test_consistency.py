@@ -0,0 +1,49 @@
+import os
+import sys
+
+pyiat_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.append(pyiat_path)
+
+example_path = f"{pyiat_path}/pyiat/example"
+
+import numpy as np
+from pyiat.utils.io import excel_parser
+from pyiat.core.consistency import consistency_ratio, random_index
+
+
+def test_consistent_matrices():
+
+    weights = np.array([[0.5, 0.3, 0.2], [0.1, 0.6, 0.3]])
+    matrices = weights[:, :, None] / weights[:, None, :]
+
+    eigenvalue, ci, cr = consistency_ratio(matrices)
+
+    np.testing.assert_allclose(eigenvalue, 3)
+    np.testing.assert_allclose(cr, 0, atol=1e-10)
+
+
+def test_inconsistent_matrix():
+
+    matrix = np.array([[1, 2, 1 / 2], [1 / 2, 1, 3], [2, 1 / 3, 1]])
+
+    eigenvalue, ci, cr = consistency_ratio(matrix)
+
+    np.testing.assert_allclose(eigenvalue, np.linalg.eigvals(matrix).real.max())
+    np.testing.assert_allclose(cr, (eigenvalue - 3) / 2 / random_index(3))
+    assert cr > 0.1
+
+
+def test_consistency_report():
+
+    impact = excel_parser(f"{example_path}/Project.xlsx", impact_name="Utopia").impact
+    impact.parse_weight_matrices(example_path)
+
+    report = impact.consistency_report()
+
+    assert len(report) == 1 + 5 + 14
+    assert report.loc[("Impact", "Utopia"), "Size"] == 5
+    np.testing.assert_allclose(
+        report.loc[("Impact", "Utopia"), "CR"], impact.consistency.cr
+    )
+    # two-item matrices are always consistent
+    assert (report.loc[report["Size"] == 2, "CR"] == 0).all()
@@ -0,0 +1,89 @@
+import os
+import sys
+
+pyiat_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.append(pyiat_path)
+
+import pytest
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+from pyiat.core.group import Panel, aggregate_judgments, aggregate_priorities
+from pyiat.utils.tools import geometric_mean_weights
+from pyiat.error_log.errors import InvalidInput
+
+
+def test_aggregation_kernels():
+
+    matrices = np.array(
+        [
+            [[1, 2], [1 / 2, 1]],
+            [[1, 8], [1 / 8, 1]],
+        ]
+    )
+
+    np.testing.assert_allclose(aggregate_judgments(matrices), [[1, 4], [1 / 4, 1]])
+    np.testing.assert_allclose(
+        aggregate_judgments(matrices, [3, 1]), [[1, 2**1.5], [2**-1.5, 1]]
+    )
+    np.testing.assert_allclose(
+        aggregate_priorities(matrices), geometric_mean_weights(np.array([[1, 4], [1 / 4, 1]]))
+    )
+
+
+def test_panel_from_table(ExampleImpact):
+
+    table = ExampleImpact.weight_matrices_to_table()
+    score = ExampleImpact.score
+
+    # the second expert gives the comparisons in the opposite direction
+    reversed_table = table.rename(columns={"reference": "compared", "compared": "reference"})
+    reversed_table["value"] = 1 / reversed_table["value"]
+
+    panel = Panel.from_table(
+        ExampleImpact,
+        pd.concat([table.assign(expert="A"), reversed_table.assign(expert="B")]),
+    )
+    assert panel.experts == ["A", "B"]
+
+    # a comparison given twice by an expert, here in both directions
+    with pytest.raises(InvalidInput):
+        Panel.from_table(
+            ExampleImpact,
+            pd.concat([table.assign(expert="A"), reversed_table.iloc[:1].assign(expert="A")]),
+        )
+
+    for aggregation in ["judgments", "priorities"]:
+        panel.apply(aggregation)
+        pdt.assert_frame_equal(ExampleImpact.score, score, check_dtype=False)
+
+
+def test_panel_matrices(ExampleImpact):
+
+    panel = Panel(ExampleImpact, experts=["A", "B", "C"])
+    for obj in panel.objects:
+        size = len(obj)
+        panel.set_matrices(obj, np.ones((3, size, size)))
+
+    capitals = ExampleImpact.capitals
+    matrices = np.ones((3, 5, 5))
+    matrices[0, 0, 1], matrices[0, 1, 0] = 4, 1 / 4
+    matrices[1, 0, 1] = matrices[1, 1, 0] = np.nan
+    panel.set_matrices(ExampleImpact, matrices)
+
+    aggregated = panel.aggregate(expert_weights={"A": 1, "B": 1, "C": 1})
+    value = aggregated.set_index(["level", "reference", "compared"]).loc[
+        ("Impact", capitals[0], capitals[1]), "value"
+    ]
+    # the missing judgment of expert B is skipped
+    np.testing.assert_allclose(value, 2)
+
+    panel.apply("priorities")
+    weights = ExampleImpact.calc_weight()
+    # expert B has no priorities for the impact matrix
+    np.testing.assert_allclose(
+        weights, aggregate_priorities(matrices[[0, 2]]), rtol=1e-10
+    )
+
+    with pytest.raises(InvalidInput):
+        panel.aggregate("dummy")
@@ -6,7 +6,9 @@ sys.path.append(pyiat_path)
 
 mock_path = f'{pyiat_path}/tests/mocks'
 
+import pytest
 from pyiat.utils.io import excel_parser
+from pyiat.error_log.errors import InvalidInput, WrongFormat
 import pandas as pd
 import pandas.testing as pdt
 from pyiat.core.impact import Capital,Dimension,Indicator,Impact
@@ -38,3 +40,101 @@ def test_excel_parser():
 
 
 
+def test_from_frame():
+
+    data = pd.read_excel(f'{mock_path}/mock_01.xlsx',index_col=[0,1,2])
+
+    impact = Impact.from_frame(data,name="dummy")
+    assert impact.capitals == ["Cap.1","Cap.2"]
+    assert impact._capitals["Cap.1"].dimensions == ["Dim.1"]
+
+    records = data.rename_axis(["capital","dimension","indicator"]).reset_index()
+    records = records.to_dict("records")
+    records.append(dict(records[0],indicator="Ind.3",ex_post=5))
+
+    impact = Impact.from_records(records)
+    indicator = impact._capitals["Cap.1"]._dimensions["Dim.1"]._indicators["Ind.3"]
+    assert (indicator.ex_ante,indicator.ex_post,indicator.type) == (1,5,"negative")
+
+    records[0]["ex_ante"] = 7
+    records[1]["type"] = "dummy"
+    with pytest.raises(InvalidInput) as msg:
+        Impact.from_records(records)
+    assert "Valid inputs for type" in str(msg.value)
+
+    with pytest.raises(WrongFormat):
+        Impact.from_frame(data.drop(columns="unit"))
+
+
+def test_parse_weight_matrices(tmp_path):
+
+    example_path = f'{pyiat_path}/pyiat/example'
+    impact = excel_parser(f'{example_path}/Project.xlsx').impact
+    impact.parse_weight_matrices(example_path)
+    score = impact.score
+
+    # an empty template reports all the sheets with nans together
+    impact.weight_matrices_to_excel(str(tmp_path))
+    with pytest.raises(InvalidInput) as msg:
+        impact.parse_weight_matrices(str(tmp_path))
+    assert "sheet -> impacts" in str(msg.value)
+    assert "sheet -> Land" in str(msg.value)
+    assert "sheet -> Human Capital" in str(msg.value)
+
+    files = impact.weight_matrices_to_excel(None)
+    for item,vals in files.items():
+        for sheet,df in vals.items():
+            df[:] = 1
+
+    impact.parse_weight_matrices(files)
+    assert not score.equals(impact.score)
+    assert (impact.calc_weight() == 1/len(impact)).all()
+
+
+def test_weight_table(tmp_path):
+
+    example_path = f'{pyiat_path}/pyiat/example'
+    impact = excel_parser(f'{example_path}/Project.xlsx').impact
+
+    template = impact.weight_matrices_to_table()
+    assert template.columns.tolist() == ["level","parent","reference","compared","value"]
+    assert template["value"].isnull().all()
+    assert len(template) == 10 + 4*3 + 1 + 14
+
+    impact.parse_weight_matrices(example_path)
+    impact.weight_matrices_to_table(f"{tmp_path}/weights.csv")
+
+    other = excel_parser(f'{example_path}/Project.xlsx').impact
+    other.parse_weight_table(f"{tmp_path}/weights.csv")
+
+    pdt.assert_frame_equal(impact.score,other.score)
+
+    with pytest.raises(InvalidInput):
+        other.parse_weight_table(template)
+
+    # absent and duplicated comparisons
+    table = impact.weight_matrices_to_table()
+    for invalid in [table.drop(index=0), pd.concat([table, table.iloc[[0]]])]:
+        with pytest.raises(InvalidInput):
+            other.parse_weight_table(invalid)
+
+    other.parse_weight_table(table.drop(index=0), allow_missing=True)
+    reference, compared = table.loc[0, ["reference", "compared"]]
+    assert other.weight_matrix.isnull().sum().sum() == 2
+    assert pd.isnull(other.weight_matrix.loc[reference, compared])
+
+
+def test_weight_table_parquet(tmp_path):
+
+    pytest.importorskip("pyarrow")
+
+    example_path = f'{pyiat_path}/pyiat/example'
+    impact = excel_parser(f'{example_path}/Project.xlsx').impact
+    impact.parse_weight_matrices(example_path)
+    impact.weight_matrices_to_table(f"{tmp_path}/weights.parquet")
+
+    other = excel_parser(f'{example_path}/Project.xlsx').impact
+    other.parse_weight_table(f"{tmp_path}/weights.parquet")
+
+    pdt.assert_frame_equal(impact.weight_matrices_to_table(),other.weight_matrices_to_table())
+    pdt.assert_frame_equal(impact.score,other.score)
@@ -0,0 +1,65 @@
+import os
+import sys
+
+pyiat_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.append(pyiat_path)
+
+import pytest
+import numpy as np
+from pyiat.core import montecarlo
+from pyiat.core.montecarlo import MonteCarlo, perturb_saaty, SAATY_SCALE
+from pyiat.error_log.errors import InvalidInput
+
+
+def test_perturb_saaty():
+
+    rng = np.random.default_rng(0)
+    samples = perturb_saaty(np.array([5, 1 / 5, 1]), 1000, 1, rng)
+
+    assert samples.shape == (1000, 3)
+    assert set(samples[:, 0]) == {4, 5}
+    assert set(samples[:, 1]) == {1 / 5, 1 / 4}
+    assert set(samples[:, 2]) == {1 / 2, 1, 2}
+    assert np.isin(samples, SAATY_SCALE).all()
+
+
+@pytest.mark.parametrize("batch_size", [2 ** 22, 1])
+def test_no_perturbation(ExampleImpact, monkeypatch, batch_size):
+
+    # a batch of one sample per matrix group gives the same scores
+    monkeypatch.setattr(montecarlo, "BATCH_SIZE", batch_size)
+    result = MonteCarlo(ExampleImpact, spread=0).run(50, chunk_size=20, seed=1)
+
+    assert len(result) == 50
+    np.testing.assert_allclose(
+        result.score.to_numpy(),
+        np.tile(ExampleImpact.score["Impact"].to_numpy(dtype=float), (50, 1)),
+    )
+    np.testing.assert_allclose(
+        result.capitals_score("ex_ante").iloc[0],
+        ExampleImpact.capitals_score.loc["ex_ante"].to_numpy(dtype=float),
+    )
+
+    ranks = result.rank_probabilities()
+    assert ((ranks == 0) | (ranks == 1)).all().all()
+
+
+def test_distributions(ExampleImpact):
+
+    model = MonteCarlo(ExampleImpact, perturbation="lognormal", sigma=0.3)
+    result = model.run(1000, chunk_size=300, seed=7)
+
+    quantiles = result.quantiles([0.05, 0.95])
+    assert (quantiles.loc[0.05] < quantiles.loc[0.95]).all()
+
+    ranks = result.rank_probabilities("difference")
+    np.testing.assert_allclose(ranks.sum(axis=0), 1)
+    np.testing.assert_allclose(ranks.sum(axis=1), 1)
+
+    # same seed and chunks give the same samples
+    np.testing.assert_array_equal(
+        result.impact, model.run(1000, chunk_size=300, seed=7).impact
+    )
+
+    with pytest.raises(InvalidInput):
+        MonteCarlo(ExampleImpact, perturbation="dummy")
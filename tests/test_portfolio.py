@@ -0,0 +1,51 @@
+import os
+import sys
+
+pyiat_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.append(pyiat_path)
+
+example_path = f"{pyiat_path}/pyiat/example"
+
+import pytest
+import pandas.testing as pdt
+from pyiat.utils.storage import save_project
+from pyiat.core.portfolio import evaluate_portfolio, portfolio_frame
+from pyiat.error_log.errors import InvalidInput
+
+
+def test_evaluate_portfolio(ExampleImpact, tmp_path):
+
+    save_project(ExampleImpact, str(tmp_path))
+    projects = [
+        ExampleImpact,
+        str(tmp_path),
+        (f"{example_path}/Project.xlsx", example_path),
+    ]
+
+    results = list(evaluate_portfolio(projects, chunksize=2))
+
+    assert [result.index for result in results] == [0, 1, 2]
+    for result in results:
+        pdt.assert_frame_equal(result.score, ExampleImpact.score, check_dtype=False)
+    assert len(results[0].summary) == 28
+
+    frame = portfolio_frame(results)
+    assert frame.index.names == ["Project", "State"]
+    assert frame.shape == (6, 6)
+
+    with pytest.raises(InvalidInput):
+        list(evaluate_portfolio([1]))
+
+
+def test_evaluate_portfolio_processes(ExampleImpact, tmp_path):
+
+    save_project(ExampleImpact, str(tmp_path))
+
+    results = list(
+        evaluate_portfolio(
+            [str(tmp_path)] * 4, processes=2, ordered=False, summary=False
+        )
+    )
+
+    assert sorted(result.index for result in results) == [0, 1, 2, 3]
+    assert all(result.summary is None for result in results)
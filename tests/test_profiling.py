@@ -0,0 +1,41 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import json
+from pyiat.example.synthetic import synthetic_impact
+from pyiat.utils.profiling import _ACTIVE, profile, timed
+
+
+def test_profile(tmp_path):
+
+    impact = synthetic_impact(capitals=2, dimensions=2, indicators=3, seed=0)
+
+    with profile() as stats:
+        impact.score
+        impact.score
+        with timed("block"):
+            pass
+
+    assert not _ACTIVE
+    counters = stats.counters
+    assert counters["Impact.score"] == 2
+    assert counters["block"] == 1
+    # the second score is served from the cache
+    assert counters["Impact.compile"] == 1
+
+    report = stats.report()
+    assert list(report.columns) == ["Calls", "Total", "Mean", "Max"]
+    assert report.loc["Impact.score", "Calls"] == 2
+
+    stats.to_chrome_trace(f"{tmp_path}/trace.json")
+    with open(f"{tmp_path}/trace.json") as file:
+        trace = json.load(file)
+
+    assert len(trace["traceEvents"]) == len(stats)
+    assert {event["ph"] for event in trace["traceEvents"]} == {"X"}
+
+    # nothing is recorded outside profile
+    impact.compile()
+    assert counters == stats.counters
@@ -0,0 +1,88 @@
+import os
+import sys
+
+pyiat_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.append(pyiat_path)
+
+import pytest
+import numpy as np
+from pyiat.core.sensitivity import Sensitivity
+from pyiat.example.synthetic import synthetic_impact
+from pyiat.error_log.errors import InvalidInput
+
+
+def test_sweep(ExampleImpact):
+
+    model = Sensitivity(ExampleImpact)
+    base = ExampleImpact.score["Impact"].to_numpy(dtype=float)
+
+    # a factor of one keeps the current judgments and weights
+    for of in ["judgments", "weights"]:
+        sweep = model.sweep(of, grid=[1], relative=True)
+        assert len(sweep) == len(model.parameters(of))
+        np.testing.assert_allclose(
+            sweep[["ex_ante", "ex_post"]].to_numpy(), np.tile(base, (len(sweep), 1))
+        )
+
+    # a sweep point is the score with the judgment set in the weight matrix
+    sweep = model.sweep(grid=[1 / 3, 4])
+    for position in [0, 10, len(sweep) - 1]:
+        row = sweep.iloc[position]
+        level, parent, reference, compared, _ = row.name
+
+        impact = ExampleImpact.copy()
+        if level == "Impact":
+            obj = impact
+        else:
+            obj = [
+                dimension
+                for _, capital in impact
+                for name, dimension in capital
+                if name == parent
+            ][0]
+
+        matrix = obj.get_weight_matrix()
+        matrix[:] = obj.judgments
+        matrix.loc[(reference, compared)] = row["Value"]
+        obj.set_weight_matrix(matrix)
+
+        np.testing.assert_allclose(
+            row[["ex_ante", "ex_post"]].to_numpy(dtype=float),
+            impact.score["Impact"].to_numpy(dtype=float),
+        )
+
+    with pytest.raises(InvalidInput):
+        model.sweep("scores")
+
+
+def test_local_sensitivity():
+
+    impact = synthetic_impact(noise=0.3, seed=3)
+    model = Sensitivity(impact)
+
+    elasticities = model.elasticities("weights")
+    assert np.isfinite(elasticities.to_numpy()).all()
+
+    tornado = model.tornado()
+    assert tornado["Range"].is_monotonic_decreasing
+    assert (tornado["Low Value"] < tornado["High Value"]).all()
+
+    # the impact judgments do not change the capital scores
+    reversals = model.rank_reversals()
+    assert reversals.loc["Impact"].isna().all().all()
+    lower = reversals["Dimension Lower"].dropna()
+    assert (lower < model.parameters()[lower.index]).all()
+
+
+def test_sobol():
+
+    model = Sensitivity(synthetic_impact(noise=0.3, seed=3))
+
+    indices = model.sobol(samples=512, by="matrix", seed=0)
+    assert len(indices) == 1 + 9
+    assert (indices["Total"] >= 0).all()
+    # the scores are almost additive in the matrices
+    np.testing.assert_allclose(indices["First Order"].sum(), 1, atol=0.25)
+
+    indices = model.sobol(samples=64, seed=0)
+    assert len(indices) == len(model.parameters())
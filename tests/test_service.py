@@ -0,0 +1,104 @@
+import os
+import sys
+
+pyiat_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.append(pyiat_path)
+
+example_path = f"{pyiat_path}/pyiat/example"
+
+import asyncio
+import json
+import numpy as np
+from pyiat.service import ScoringService, load
+
+
+def request(port, method, path, body=None):
+    async def send():
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        data = b"" if body is None else json.dumps(body).encode()
+        writer.write(
+            f"{method} {path} HTTP/1.1\r\nContent-Length: {len(data)}\r\n"
+            "Connection: close\r\n\r\n".encode() + data
+        )
+        response = await reader.read()
+        writer.close()
+
+        head, _, content = response.partition(b"\r\n\r\n")
+        return int(head.split()[1]), json.loads(content)
+
+    return send()
+
+
+def test_service():
+
+    impact = load("Utopia", f"{example_path}/Project.xlsx")
+    service = ScoringService({"Utopia": impact}, max_delay=0.05)
+    compiled = impact.compile()
+    capital = compiled.capitals[0]
+    weights = np.linspace(0, 1, 20)
+
+    async def run():
+        server = await service.start(port=0)
+        port = server.sockets[0].getsockname()[1]
+
+        score = await request(port, "GET", "/projects/Utopia/score")
+        summary = await request(port, "GET", "/projects/Utopia/summary")
+        missing = await request(port, "GET", "/projects/Dystopia/score")
+        invalid = await request(
+            port, "POST", "/projects/Utopia/what_if", {"capital_weight": {capital: 2}}
+        )
+        queries = await asyncio.gather(
+            *[
+                request(
+                    port, "POST", "/projects/Utopia/what_if", {"capital_weight": {capital: weight}}
+                )
+                for weight in weights
+            ]
+        )
+
+        server.close()
+        await server.wait_closed()
+
+        return score, summary, missing, invalid, queries
+
+    score, summary, missing, invalid, queries = asyncio.run(run())
+
+    assert score[0] == 200
+    np.testing.assert_allclose(
+        [score[1]["ex_ante"], score[1]["ex_post"]], impact.score["Impact"].to_numpy(dtype=float)
+    )
+    assert len(summary[1]) == len(impact.summary)
+    assert missing[0] == 404
+    assert invalid[0] == 400
+
+    # the concurrent queries are evaluated together
+    assert service.batchers["Utopia"].batches == 1
+    for weight, (status, result) in zip(weights, queries):
+        assert status == 200
+        np.testing.assert_allclose(
+            [result["score"]["ex_ante"], result["score"]["ex_post"]],
+            compiled.what_if_capital(capital, weight),
+        )
+
+
+def test_rates_query():
+
+    impact = load("Utopia", f"{example_path}/Project.xlsx")
+    batcher = ScoringService({"Utopia": impact}).batchers["Utopia"]
+    compiled = impact.compile()
+
+    capital, dimension, indicator = compiled.indicator_index[0]
+    query = batcher.query(
+        {
+            "rates": [
+                {"capital": capital, "dimension": dimension, "indicator": indicator, "ex_post": 5}
+            ]
+        }
+    )
+    result = batcher.evaluate([query])[0]
+
+    impact.edit(capital, dimension, indicator).ex_post = 5
+    np.testing.assert_allclose(
+        [result["score"]["ex_ante"], result["score"]["ex_post"]],
+        impact.score["Impact"].to_numpy(dtype=float),
+    )
@@ -0,0 +1,80 @@
+import os
+import sys
+
+pyiat_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.append(pyiat_path)
+
+example_path = f"{pyiat_path}/pyiat/example"
+
+import pytest
+import numpy as np
+import pandas.testing as pdt
+from pyiat.utils.io import excel_parser
+from pyiat.core.impact import Impact, IndicatorTable
+from pyiat.example.synthetic import synthetic_frame, synthetic_judgments
+from pyiat.utils.storage import save_project, load_project, load_compiled
+from pyiat.error_log.errors import MissingData, WrongFormat
+
+
+def test_save_load_project(ExampleImpact, tmp_path):
+
+    ExampleImpact._capitals["Human Capital"].weight_method = "eigenvector"
+    save_project(ExampleImpact, str(tmp_path))
+
+    impact = load_project(str(tmp_path))
+
+    assert impact.name == "Utopia"
+    assert impact.capitals == ExampleImpact.capitals
+    assert impact._capitals["Human Capital"].weight_method == "eigenvector"
+    pdt.assert_frame_equal(impact.score, ExampleImpact.score)
+    pdt.assert_frame_equal(
+        impact.weight_matrices_to_table(), ExampleImpact.weight_matrices_to_table()
+    )
+
+
+def test_save_load_compact_project(tmp_path):
+
+    impact = Impact.from_frame(synthetic_frame(seed=1), indicator_table=True)
+    for obj in impact._weighted_objects():
+        matrix = obj.get_weight_matrix()
+        matrix[:] = synthetic_judgments(len(obj), 0.2, np.random.default_rng(2))
+        obj.set_weight_matrix(matrix, compact=obj.id != "Impact")
+
+    save_project(impact, str(tmp_path))
+    loaded = load_project(str(tmp_path))
+
+    for obj, other in zip(impact._weighted_objects(), loaded._weighted_objects()):
+        assert (obj._compact is None) == (other._compact is None)
+        np.testing.assert_array_equal(obj.judgments, other.judgments)
+
+    dimension = [*[*loaded._capitals.values()][0]._dimensions.values()][0]
+    assert isinstance(dimension._indicators, IndicatorTable)
+    pdt.assert_frame_equal(loaded.score, impact.score)
+
+
+def test_load_compiled(ExampleImpact, tmp_path):
+
+    save_project(ExampleImpact, str(tmp_path))
+
+    compiled = load_compiled(str(tmp_path))
+
+    assert isinstance(compiled.ex_ante.base, np.memmap)
+    pdt.assert_frame_equal(compiled.score, ExampleImpact.compile().score)
+
+    # copy-on-write pages do not change the files
+    compiled.update(0, ex_ante=5)
+    assert load_compiled(str(tmp_path)).ex_ante[0] == ExampleImpact.compile().ex_ante[0]
+
+
+def test_missing_weights(tmp_path):
+
+    impact = excel_parser(f"{example_path}/Project.xlsx").impact
+    save_project(impact, str(tmp_path))
+
+    with pytest.raises(MissingData):
+        load_compiled(str(tmp_path))
+
+    assert not hasattr(load_project(str(tmp_path)), "weight_matrix")
+
+    with pytest.raises(WrongFormat):
+        load_project(str(tmp_path / "dummy"))
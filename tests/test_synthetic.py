@@ -0,0 +1,32 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import numpy as np
+import pandas as pd
+from pyiat.example.synthetic import synthetic_impact, synthetic_judgments
+
+
+def test_synthetic_impact():
+
+    impact = synthetic_impact(capitals=2, dimensions=3, indicators=4, seed=0)
+
+    assert len(impact) == 2
+    assert all(len(capital) == 3 for capital in impact._capitals.values())
+    assert len(impact.compile().indicators) == 24
+
+    # consistent judgments
+    np.testing.assert_allclose(impact.consistency_report()["CR"], 0, atol=1e-9)
+
+    same = synthetic_impact(capitals=2, dimensions=3, indicators=4, seed=0)
+    pd.testing.assert_frame_equal(impact.score, same.score)
+
+
+def test_synthetic_judgments():
+
+    consistent = synthetic_judgments(5, seed=0)
+    noisy = synthetic_judgments(5, noise=0.5, seed=0)
+
+    assert consistent.shape == noisy.shape == (10,)
+    assert not np.allclose(consistent, noisy)
@@ -0,0 +1,89 @@
+import os
+import sys
+
+pyiat_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.append(pyiat_path)
+
+import threading
+import numpy as np
+import pandas.testing as pdt
+from pyiat.core.threads import evaluate_weights, score_impacts, warm_scores
+
+
+def test_concurrent_readers(ExampleImpact):
+
+    expected = {
+        attribute: getattr(ExampleImpact.copy(), attribute)
+        for attribute in ["score", "capitals_score", "summary"]
+    }
+
+    barrier = threading.Barrier(6)
+    errors = []
+
+    def read(attribute):
+        barrier.wait()
+        try:
+            for _ in range(5):
+                pdt.assert_frame_equal(getattr(ExampleImpact, attribute), expected[attribute])
+        except Exception as error:
+            errors.append(error)
+
+    threads = [
+        threading.Thread(target=read, args=(attribute,))
+        for attribute in [*expected] * 2
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+
+
+def test_thread_pool(ExampleImpact):
+
+    warm_scores(ExampleImpact, max_workers=4)
+    for _, capital in ExampleImpact:
+        assert ("score",) in capital._cache
+
+    forks = [ExampleImpact.fork() for _ in range(3)]
+    forks[1].edit("Natural Capital", "Water", "Water quality").ex_post = 1
+    scores = score_impacts([ExampleImpact] + forks, max_workers=4)
+    for fork, score in zip(forks, scores[1:]):
+        pdt.assert_frame_equal(score, fork.score)
+
+    compiled = ExampleImpact.compile()
+    rng = np.random.default_rng(0)
+    indicator_weight = rng.uniform(size=(1000, len(compiled)))
+    np.testing.assert_allclose(
+        evaluate_weights(compiled, indicator_weight=indicator_weight, chunk_size=128),
+        compiled.evaluate_weights(indicator_weight=indicator_weight),
+    )
+
+
+def test_concurrent_updates(ExampleImpact):
+
+    compiled = ExampleImpact.compile()
+    barrier = threading.Barrier(4)
+
+    def edit(position):
+        barrier.wait()
+        for ex_post in [1, 2, 3, 4, 5] * 20:
+            compiled.update(position, ex_post=ex_post)
+            compiled.impact_values()
+
+    threads = [threading.Thread(target=edit, args=(position,)) for position in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # the incremental updates of all the threads were applied
+    values = compiled.impact_values()
+    compiled.refresh()
+    np.testing.assert_allclose(values, compiled.impact_values())
+
+    ex_ante, ex_post, positive = compiled.rates()
+    assert (ex_post[:4] == 5).all()
+    ex_post[0] = 1
+    assert compiled.ex_post[0] == 5
@@ -0,0 +1,192 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import pytest
+import numpy as np
+from pyiat.core.consistency import consistency_ratio
+from pyiat.core.impact import Dimension, Indicator
+from pyiat.core.weights import (
+    WEIGHT_METHODS,
+    complete_matrix,
+    eigenvector_weights,
+    is_connected,
+    llsm_weights,
+    register_weight_method,
+    set_default_weight_method,
+    default_weight_method,
+)
+from pyiat.error_log.errors import InvalidInput, WrongFormat
+from pyiat.utils.tools import geometric_mean_weights, principal_eigen
+
+MATRICES = np.array(
+    [
+        [[1, 2, 1 / 2], [1 / 2, 1, 3], [2, 1 / 3, 1]],
+        [[1, 3, 5], [1 / 3, 1, 2], [1 / 5, 1 / 2, 1]],
+    ]
+)
+
+
+@pytest.fixture
+def DummyDimension():
+
+    indicators = [
+        Indicator(name=f"ind.{ii}", type="positive", unit="-", ex_ante=1, ex_post=2)
+        for ii in range(3)
+    ]
+    dimension = Dimension(name="dummy", indicators=indicators)
+
+    weight_matrix = dimension.get_weight_matrix()
+    weight_matrix[:] = [2, 1 / 2, 3]
+    dimension.set_weight_matrix(weight_matrix)
+
+    return dimension
+
+
+def test_eigenvector_weights():
+
+    weights = eigenvector_weights(MATRICES)
+
+    for matrix, weight in zip(MATRICES, weights):
+        values, vectors = np.linalg.eig(matrix)
+        vector = np.abs(vectors[:, values.real.argmax()].real)
+        np.testing.assert_allclose(weight, vector / vector.sum())
+
+
+def test_unconverged_eigen():
+
+    # the matrices left unconverged by the power iteration are solved exactly
+    values, vectors = principal_eigen(MATRICES, max_iter=1)
+    expected_values, expected_vectors = principal_eigen(MATRICES)
+
+    np.testing.assert_allclose(values, expected_values)
+    np.testing.assert_allclose(vectors, expected_vectors)
+
+
+def test_llsm_weights():
+
+    # for complete matrices llsm is equal to the geometric mean
+    np.testing.assert_allclose(llsm_weights(MATRICES), geometric_mean_weights(MATRICES))
+
+
+def test_weight_method_selection(DummyDimension):
+
+    geo_mean = DummyDimension.calc_weight()
+    np.testing.assert_allclose(geo_mean, geometric_mean_weights(MATRICES[0]))
+
+    DummyDimension.weight_method = "eigenvector"
+    np.testing.assert_allclose(
+        DummyDimension.calc_weight(), eigenvector_weights(MATRICES[0])
+    )
+    np.testing.assert_allclose(
+        DummyDimension.calc_weight("geometric_mean"), geo_mean
+    )
+
+    with pytest.raises(InvalidInput):
+        DummyDimension.weight_method = "dummy"
+
+
+def test_default_weight_method(DummyDimension):
+
+    try:
+        set_default_weight_method("eigenvector")
+        assert default_weight_method() == "eigenvector"
+        np.testing.assert_allclose(
+            DummyDimension.calc_weight(), eigenvector_weights(MATRICES[0])
+        )
+    finally:
+        set_default_weight_method("geometric_mean")
+
+
+def test_register_weight_method(DummyDimension):
+
+    register_weight_method("uniform", lambda m: np.full(m.shape[:-1], 1 / m.shape[-1]))
+
+    try:
+        np.testing.assert_allclose(DummyDimension.calc_weight("uniform"), 1 / 3)
+
+        with pytest.raises(InvalidInput):
+            register_weight_method("uniform", lambda m: m)
+    finally:
+        WEIGHT_METHODS.pop("uniform")
+
+
+def test_incomplete_matrix():
+
+    # a consistent matrix keeps its weights when comparisons are removed
+    weights = np.array([0.4, 0.3, 0.2, 0.1])
+    consistent = weights[:, None] / weights[None, :]
+
+    incomplete = consistent.copy()
+    incomplete[[0, 3, 1, 2], [3, 0, 2, 1]] = np.nan
+
+    assert is_connected(incomplete)
+    np.testing.assert_allclose(llsm_weights(incomplete), weights)
+    np.testing.assert_allclose(eigenvector_weights(incomplete), weights)
+    np.testing.assert_allclose(complete_matrix(incomplete), consistent)
+
+    disconnected = np.full((4, 4), np.nan)
+    disconnected[[0, 1, 2, 3, 0, 1, 2, 3], [0, 1, 2, 3, 1, 0, 3, 2]] = 1
+    assert not is_connected(disconnected)
+
+
+def test_set_incomplete_weight_matrix(DummyDimension):
+
+    weight_matrix = DummyDimension.get_weight_matrix()
+    weight_matrix[:] = [2, np.nan, 3]
+
+    with pytest.raises(InvalidInput):
+        DummyDimension.set_weight_matrix(weight_matrix)
+
+    DummyDimension.set_weight_matrix(weight_matrix, allow_missing=True)
+    assert np.isnan(DummyDimension.weight_matrix.loc["ind.0", "ind.2"])
+    np.testing.assert_allclose(DummyDimension.calc_weight(), [6 / 10, 3 / 10, 1 / 10])
+
+    weight_matrix[:] = [np.nan, np.nan, 3]
+    with pytest.raises(InvalidInput):
+        DummyDimension.set_weight_matrix(weight_matrix, allow_missing=True)
+
+
+def test_compact_weight_matrix(DummyDimension):
+
+    dense = DummyDimension.weight_matrix
+    weights = DummyDimension.calc_weight()
+
+    weight_matrix = DummyDimension.get_weight_matrix()
+    weight_matrix[:] = [2, 1 / 2, 3]
+    DummyDimension.set_weight_matrix(weight_matrix, compact=True)
+
+    assert DummyDimension.compact
+    np.testing.assert_allclose(DummyDimension.judgments, [2, 1 / 2, 3])
+    np.testing.assert_allclose(DummyDimension.weight_matrix, dense)
+    np.testing.assert_allclose(DummyDimension.calc_weight(), weights)
+    assert DummyDimension.consistency.cr == pytest.approx(
+        consistency_ratio(MATRICES[0])[2]
+    )
+
+    with pytest.raises(WrongFormat):
+        DummyDimension._set_compact([2, 1 / 2])
+
+    empty = Dimension(name="empty", indicators=[])
+    assert not hasattr(empty, "weight_matrix")
+    assert not empty.weight_assigned
+
+
+def test_reversed_weight_matrix(DummyDimension):
+
+    weight_matrix = DummyDimension.get_weight_matrix()
+    weight_matrix[:] = [2, 1 / 2, 3]
+    weight_matrix.index = weight_matrix.index.swaplevel()
+    DummyDimension.set_weight_matrix(weight_matrix)
+
+    np.testing.assert_allclose(DummyDimension.weight_matrix, MATRICES[0].T)
+
+
+def test_read_only_weight_matrix(DummyDimension):
+
+    weight = DummyDimension.calc_weight()
+    with pytest.raises(ValueError):
+        DummyDimension.weight_matrix.loc["ind.0", "ind.1"] = 5
+
+    np.testing.assert_allclose(DummyDimension.calc_weight(), weight)